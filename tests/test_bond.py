@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from scipy.optimize import brentq
+
+from tmval import Bond, InterpolatedAccumulation, Rate, yield_solver
+
+
+def direct_price(times, amounts, call_time, red, disc):
+    return sum(c * disc(t) for t, c in zip(times, amounts) if t <= call_time) + red * disc(call_time)
+
+
+@pytest.fixture
+def callable_bond():
+    return Bond(face=1000, term=10, alpha=.06, cfreq=2, gr=.05, red=1000)
+
+
+def test_price_to_worst_matches_direct_discounting(callable_bond):
+    times = [3, 5, 8]
+    premiums = [30, 20, 10]
+    res = callable_bond.price_to_worst(times=times, premiums=premiums)
+
+    prices = [
+        direct_price(callable_bond.coupons.times, callable_bond.coupons.amounts, t, 1000 + p, lambda x: 1.05 ** -x)
+        for t, p in zip(times + [10], premiums + [0])
+    ]
+
+    assert res['price'] == pytest.approx(min(prices), rel=1e-12)
+    assert res['time'] == (times + [10])[int(np.argmin(prices))]
+    assert res['yield'] == pytest.approx(.05)
+
+
+@pytest.mark.parametrize('gr', [
+    Rate(s=.05),
+    InterpolatedAccumulation(times=[0, 1, 5, 10], values=[1, 1.04, 1.25, 1.6])
+])
+def test_price_to_worst_non_compound_yield(callable_bond, gr):
+    res = callable_bond.price_to_worst(times=[3], gr=gr)
+
+    acc = res['yield']
+    prices = [
+        direct_price(callable_bond.coupons.times, callable_bond.coupons.amounts, t, 1000, acc.discount_func)
+        for t in [3, 10]
+    ]
+
+    assert not acc.is_compound
+    assert res['price'] == pytest.approx(min(prices), rel=1e-12)
+
+
+def test_yield_to_worst_matches_scalar_yields(callable_bond):
+    times = [3, 5]
+    premiums = [50, 25]
+    price = 1080
+    res = callable_bond.yield_to_worst(times=times, premiums=premiums, price=price)
+
+    yields = [
+        brentq(
+            lambda i: direct_price(
+                callable_bond.coupons.times, callable_bond.coupons.amounts, t, 1000 + p, lambda x: (1 + i) ** -x
+            ) - price,
+            1e-6,
+            1
+        )
+        for t, p in zip(times + [10], premiums + [0])
+    ]
+
+    assert res['yield'] == pytest.approx(min(yields), rel=1e-8)
+    assert res['time'] == (times + [10])[int(np.argmin(yields))]
+
+
+def brentq_yield(price, amounts, periods, red, red_periods):
+    def f(j):
+        return sum(c * (1 + j) ** -k for c, k in zip(amounts, periods)) + red * (1 + j) ** -red_periods - price
+
+    return brentq(f, -.5, 1)
+
+
+@pytest.mark.parametrize('price', [850, 1000, 1050, 1400])
+def test_bond_yield_from_price(price):
+    bond = Bond(face=1000, term=10, alpha=.06, cfreq=2, price=price, red=1000)
+
+    expected = brentq_yield(price, [30] * 20, range(1, 21), 1000, 20)
+
+    assert bond.j == pytest.approx(expected, rel=1e-10)
+    assert Bond(face=1000, term=10, alpha=.06, cfreq=2, gr=bond.gr, red=1000).price == pytest.approx(price)
+
+
+def test_yield_solver_vectorized_matches_scalar():
+    amounts = [40, 40, 45, 45, 50, 50]
+    times = [.5, 1, 1.5, 2, 2.5, 3]
+    price = np.array([950, 1000, 1100])
+    n = np.array([6, 4, 2])
+    term = n * .5
+
+    res = yield_solver(price=price, amounts=amounts, times=times, red=1000, term=term, period=.5, n=n)
+
+    expected = [brentq_yield(p, amounts[:k], range(1, k + 1), 1000, k) for p, k in zip(price, n)]
+
+    np.testing.assert_allclose(res, expected, rtol=1e-10)
+
+
+def test_yield_solver_zero_coupon():
+    j = yield_solver(price=700, amounts=[], times=[], red=1000, term=8, period=1)
+
+    assert j == pytest.approx((1000 / 700) ** (1 / 8) - 1, rel=1e-12)
@@ -0,0 +1,36 @@
+import datetime as dt
+
+import numpy as np
+import pytest
+
+import tmval.daycount
+
+from tmval import year_frac
+
+
+def test_star_import_exports_only_public_functions():
+    namespace = {}
+    exec('from tmval.daycount import *', namespace)
+
+    assert set(namespace) - {'__builtins__'} == set(tmval.daycount.__all__)
+    assert all(callable(getattr(tmval.daycount, name)) for name in tmval.daycount.__all__)
+
+
+@pytest.mark.parametrize('beg, end, convention, expected', [
+    ('2020-01-15', '2021-01-15', 'Actual/365 Fixed', 366 / 365),
+    ('2020-01-15', '2021-01-15', 'Actual/360', 366 / 360),
+    ('2019-07-01', '2020-07-01', 'Actual/Actual ISDA', 184 / 365 + 182 / 366),
+    ('2020-01-31', '2020-03-31', '30/360', 60 / 360),
+    ('2020-02-29', '2020-08-31', '30E/360', 181 / 360)
+])
+def test_year_frac(beg, end, convention, expected):
+    assert year_frac(beg, end, convention=convention) == pytest.approx(expected, rel=1e-12)
+
+
+def test_year_frac_vectorized_matches_scalar():
+    beg = [dt.date(2019, 3, 1), dt.date(2020, 2, 29), dt.date(2021, 12, 31)]
+    end = [dt.date(2020, 3, 1), dt.date(2024, 2, 29), dt.date(2022, 6, 30)]
+
+    expected = [year_frac(b, e) for b, e in zip(beg, end)]
+
+    np.testing.assert_allclose(year_frac(beg, end), expected, rtol=1e-12)
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from scipy.integrate import quad
+from scipy.optimize import brentq
+
+from tmval import acc_from_delta_t, amt_from_delta_t, bracket_solver, ForceOfInterest, InvestmentYearTable, t_solver
+
+
+def quad_acc(delta_t, t):
+    return np.exp(quad(delta_t, 0, t)[0])
+
+
+@pytest.mark.parametrize('t', [.3, 2.5, 7, 25, -2])
+def test_force_of_interest_matches_quad(t):
+    def delta_t(s):
+        return .05 + .01 * np.sin(s)
+
+    acc = acc_from_delta_t(delta_t)
+
+    assert acc(t) == pytest.approx(quad_acc(delta_t, t), rel=1e-9)
+
+
+def test_force_of_interest_vectorized():
+    def delta_t(s):
+        return .02 + .001 * s
+
+    foi = ForceOfInterest(delta_t=delta_t)
+    times = np.array([-1, .5, 3, 12])
+
+    expected = [quad_acc(delta_t, t) for t in times]
+
+    np.testing.assert_allclose(foi.val(times), expected, rtol=1e-9)
+    np.testing.assert_allclose(amt_from_delta_t(delta_t)(times, 100), 100 * np.asarray(expected), rtol=1e-9)
+
+
+def test_force_of_interest_does_not_integrate_past_requested_times():
+    # the force of interest is singular at t = -1, which lies beyond the time requested
+    acc = acc_from_delta_t(lambda s: 2 / (s + 1))
+
+    assert acc(-.5) == pytest.approx(.25, rel=1e-9)
+    assert acc(3) == pytest.approx(16, rel=1e-9)
+
+
+@pytest.fixture
+def iym_table():
+    return InvestmentYearTable(table={
+        2000: [.06, .065, .0575, .06, .065],
+        2001: [.07, .0625, .06, .07, .0675],
+        2002: [.06, .06, .0725, .07, .0725],
+        2003: [.0775, .08, .08, .0775, .0715]
+    })
+
+
+def test_investment_year_table_matches_tiered_time(iym_table):
+    t0 = np.array([2000, 2001, 2003])
+    t = np.array([2.5, 7, 11.25])
+
+    expected = [iym_table.tiered_time(t0=y).val(x) for y, x in zip(t0, t)]
+
+    np.testing.assert_allclose(iym_table.val(t0=t0, t=t), expected, rtol=1e-12)
+    assert iym_table.rate(t0=2000, t=5) == .0675
+
+
+@pytest.mark.parametrize('t', [-1, np.array([0, 2, -3])])
+def test_investment_year_table_rejects_negative_times(iym_table, t):
+    with pytest.raises(ValueError):
+        iym_table.rate(t0=2001, t=t)
+
+    with pytest.raises(ValueError):
+        iym_table.val(t0=2001, t=t - .5)
+
+
+def test_bracket_solver_matches_brentq():
+    c = np.array([.5, 2, 10, 1e-3])
+
+    def f(x):
+        return x ** 10 - c
+
+    res = bracket_solver(f, a=np.zeros(4), b=np.full(4, 2.))
+    expected = [brentq(lambda x: x ** 10 - k, 0, 2, xtol=1e-15) for k in c]
+
+    np.testing.assert_allclose(res, expected, rtol=1e-10)
+
+
+def test_bracket_solver_requires_sign_change():
+    with pytest.raises(Exception):
+        bracket_solver(lambda x: x ** 2 + 1, a=np.array([-1.]), b=np.array([1.]))
+
+
+@pytest.mark.parametrize('target', [1.5, np.array([1.01, 2, 50, 1e4])])
+def test_t_solver_matches_closed_form(target):
+    res = t_solver(lambda t: 1.05 ** t, target=target)
+
+    np.testing.assert_allclose(res, np.log(target) / np.log(1.05), rtol=1e-10)
+
+
+def test_t_solver_array_matches_scalar():
+    targets = np.array([1.2, 3, 7.5])
+
+    def f(t):
+        return 1 + .04 * t + .002 * t ** 2
+
+    res = t_solver(f, target=targets, t0=1, step=.5)
+
+    np.testing.assert_allclose(res, [t_solver(f, target=x, t0=1, step=.5) for x in targets], rtol=1e-10)
@@ -0,0 +1,121 @@
+import datetime as dt
+
+import numpy as np
+import pytest
+
+from scipy.optimize import brentq
+
+from tmval import DatedPayments, key_rate_durations, Payments
+
+
+def bumped_pv(amounts, times, spot, shock):
+    return sum(c * (1 + spot(t) + shock(t)) ** -t for c, t in zip(amounts, times))
+
+
+def krd_direct(amounts, times, spot, key_rates, h=.0001):
+    res = {}
+    pv = bumped_pv(amounts, times, spot, lambda t: 0)
+
+    for k in range(len(key_rates)):
+        bump = np.eye(len(key_rates))[k]
+
+        def shock(t, s=1):
+            return s * h * np.interp(t, key_rates, bump)
+
+        up = bumped_pv(amounts, times, spot, shock)
+        down = bumped_pv(amounts, times, spot, lambda t: shock(t, -1))
+        res[key_rates[k]] = (down - up) / (2 * h * pv)
+
+    return res
+
+
+@pytest.fixture
+def bond_flows():
+    times = [.5 * k for k in range(1, 21)]
+    amounts = [30] * 19 + [1030]
+
+    return amounts, times
+
+
+def test_key_rate_durations_match_direct_revaluation(bond_flows):
+    amounts, times = bond_flows
+    key_rates = [1, 2, 5, 10]
+    pmts = Payments(amounts=amounts, times=times, gr=.05)
+
+    res = pmts.key_rate_durations(key_rates=key_rates, excl_inv=False)
+    expected = krd_direct(amounts, times, lambda t: .05, key_rates)
+
+    assert res == pytest.approx(expected, rel=1e-9)
+
+
+def test_key_rate_durations_sum_to_effective_duration(bond_flows):
+    amounts, times = bond_flows
+    h = .0001
+    pmts = Payments(amounts=amounts, times=times, gr=.05)
+
+    res = pmts.key_rate_durations(key_rates=[2, 5, 7], h=h, excl_inv=False)
+
+    up = bumped_pv(amounts, times, lambda t: .05, lambda t: h)
+    down = bumped_pv(amounts, times, lambda t: .05, lambda t: -h)
+    pv = bumped_pv(amounts, times, lambda t: .05, lambda t: 0)
+
+    # the key rate shocks sum to a parallel shift, so the durations agree up to the second order terms in h
+    assert sum(res.values()) == pytest.approx((down - up) / (2 * h * pv), rel=1e-7)
+
+
+def test_key_rate_durations_of_spot_curve_and_portfolio(bond_flows):
+    amounts, times = bond_flows
+    curve = {.5: .03, 2: .035, 5: .04, 10: .045}
+    key_rates = [2, 5, 10]
+
+    half = len(times) // 2
+    portfolio = [
+        Payments(amounts=amounts[:half], times=times[:half]),
+        Payments(amounts=amounts[half:], times=times[half:])
+    ]
+
+    res = key_rate_durations(payments=portfolio, key_rates=key_rates, curve=curve, excl_inv=False)
+    expected = krd_direct(amounts, times, lambda t: np.interp(t, list(curve), list(curve.values())), key_rates)
+
+    assert res == pytest.approx(expected, rel=1e-9)
+
+
+def brentq_xirr(amounts, times, lo=-.9, hi=10):
+    return brentq(lambda i: sum(c * (1 + i) ** -t for c, t in zip(amounts, times)), lo, hi, xtol=1e-14)
+
+
+@pytest.mark.parametrize('amounts, times', [
+    ([-1000, 300, 450, 500], [0, .7, 1.9, 3.2]),
+    ([-5000, -2000, 1500, 4000, 3500], [0, .25, 1.1, 2.6, 4.05]),
+    ([-1000, 800], [0, 1.5])
+])
+def test_xirr_matches_brentq(amounts, times):
+    pmts = Payments(amounts=amounts, times=times)
+
+    assert pmts.xirr() == pytest.approx(brentq_xirr(amounts, times), rel=1e-9)
+
+
+def test_xirr_picks_root_closest_to_guess():
+    # (1 + i)^-1 = 1 / 1.1 and 1 / 1.2 are both roots
+    amounts = [-1, 2.3, -1.32]
+    times = [0, 1, 2]
+    pmts = Payments(amounts=amounts, times=times)
+
+    assert pmts.xirr(x0=.05) == pytest.approx(.1, rel=1e-9)
+    assert pmts.xirr(x0=.3) == pytest.approx(.2, rel=1e-9)
+
+
+def test_xirr_without_sign_change():
+    with pytest.raises(Exception):
+        Payments(amounts=[100, 200], times=[0, 1]).xirr()
+
+
+def test_dated_payments_xirr():
+    dates = [dt.date(2020, 1, 15), dt.date(2020, 7, 1), dt.date(2021, 3, 31), dt.date(2022, 2, 28)]
+    amounts = [-10000, 2750, 4250, 3900]
+    pmts = DatedPayments(amounts=amounts, dates=dates)
+
+    times = [(d - dates[0]).days / 365 for d in dates]
+
+    np.testing.assert_allclose(pmts.times, times, rtol=1e-12)
+    assert pmts.xirr() == pytest.approx(brentq_xirr(amounts, times), rel=1e-9)
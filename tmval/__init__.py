@@ -1,6 +1,8 @@
 from tmval.growth import *
+from tmval.daycount import *
 from tmval.rate import *
 from tmval.value import *
+from tmval.factors import *
 from tmval.annuity import *
 from tmval.loan import *
 from tmval.bond import *
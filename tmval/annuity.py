@@ -3,8 +3,8 @@ Contains the Annuity class, TmVal's main class for all kinds of annuities. The u
 annuities to represent by specifying the arguments at initialization.
 """
 from collections import namedtuple
-import decimal
 import numpy as np
+import warnings
 from scipy.integrate import quad
 
 from typing import (
@@ -14,15 +14,25 @@ from typing import (
 
 from tmval.value import (
     Payments,
+    PerpetualStream,
     Rate
 )
 
 from tmval.growth import (
     Accumulation,
+    array_func,
     standardize_acc,
     TieredTime
 )
 
+from tmval.factors import (
+    a_angln,
+    continuous_pv,
+    get_period_rate,
+    ia_angln,
+    s_angln
+)
+
 from math import (
     ceil,
     floor
@@ -78,6 +88,9 @@ class Annuity(Payments):
     :type loan: float, optional
     :param drb: Whether the final loan payment is a 'drop' or 'balloon' payment.
     :type drb: str, optional
+    :param check_level: For a continuously paying annuity with a callable amount, whether to check if the rate of \
+    payment is level, which requires integrating it, defaults to False.
+    :type check_level: bool
     """
 
     def __init__(
@@ -113,7 +126,8 @@ class Annuity(Payments):
         deferral: float = 0.0,
         imd: str = 'immediate',
         loan: float = None,
-        drb: str = None
+        drb: str = None,
+        check_level: bool = False
     ):
         self.term = term
         self.amount = amount
@@ -131,6 +145,9 @@ class Annuity(Payments):
             raise ValueError("Invalid value provided to aprog.")
 
         imd_ind = 1 if imd == 'immediate' else 0
+        self.stream = None
+        self._spec = None
+        self._drb_mode = None
         self.is_level_pmt = None
         self.reinv = reinv
         self.deferral = deferral
@@ -165,22 +182,28 @@ class Annuity(Payments):
         # perpetuity
         if self.term == np.inf or self.n_payments == np.Inf:
 
-            def perp_series(t):
-                start = amount
-                factor = 1 + gprog
-                curr = 0
-                while curr < t:
-                    yield start * factor ** curr
-                    curr += 1
-
-            def perp_times(t):
-                curr = 0 + 1 if imd == 'immediate' else 0
-                while curr < t:
-                    yield curr + 1
-
-            amounts = perp_series
-            times = perp_times
+            self.stream = PerpetualStream(
+                amount=amount,
+                period=period,
+                gprog=gprog,
+                aprog=self.aprog,
+                mprog=self.mprog,
+                imd=imd,
+                deferral=deferral,
+                gr=gr
+            )
+
+            amounts = self.stream.iter_amounts
+            times = self.stream.iter_times
             self._ann_perp = 'perpetuity'
+
+            # the payments only exist lazily, so valuations that need them are answered by the stream
+            for name in [
+                'npv', 'eq_val', 'macaulay_duration', 'macaulay_convexity', 'modified_duration',
+                'modified_convexity', 'effective_duration', 'relchg', 'append', 'paymentize', 'group_payments',
+                'pt_bal', 'irr', 'xirr', 'dw_approx', 'time_weighted_yield', 'key_rate_durations'
+            ]:
+                setattr(self, name, getattr(self.stream, name))
             self.n_payments = np.inf
 
             if gprog == 0:
@@ -195,9 +218,10 @@ class Annuity(Payments):
             self._ann_perp = 'annuity'
 
             if isinstance(amount, Callable):
-                if round(amount(0) * self.term, 3) == round(quad(amount, 0, self.term)[0], 3):
-                    Warning("Level continuously paying annuity detected. It's better to supply a constant to the "
-                            "amount argument to speed up computation.")
+                if check_level and \
+                        round(amount(0) * self.term, 3) == round(continuous_pv(amount, self.term)['pv'], 3):
+                    warnings.warn("Level continuously paying annuity detected. It's better to supply a constant to "
+                                  "the amount argument to speed up computation.")
                     self.is_level_pmt = True
                 else:
                     self.is_level_pmt = False
@@ -222,19 +246,19 @@ class Annuity(Payments):
                 f = 0
 
             if isinstance(amount, (int, float)) or (isinstance(amount, list) and len(amount)) == 1:
-                amounts = [self.amount * (1 + self.gprog) ** x +
-                           self.aprog * floor(x * self.mprog) for x in range(self.n_payments)]
-                times = [period * (x + imd_ind) for x in range(self.n_payments)]
+                # the payments follow a formula, so only its parameters are kept until the payments are needed
+                self._spec = (self.amount, self.gprog, self.aprog, self.mprog, period, imd_ind, self.n_payments)
+                amounts = None
+                times = None
             else:
                 amounts = amount
                 times = times
                 times.sort()
-                intervals = list(np.diff(times))
-                intervals = [round(x, 7) for x in intervals]
-                if intervals[1:] != intervals[:-1]:
+                intervals = np.round(np.diff(times), 7)
+                if np.any(intervals != intervals[0]):
                     raise Exception("Non-level intervals detected, use payments class instead.")
                 else:
-                    self.period = intervals[0]
+                    self.period = float(intervals[0])
 
                 if min(times) == 0:
                     self.imd = 'due'
@@ -243,18 +267,17 @@ class Annuity(Payments):
                     self.imd = 'immediate'
                     self.term = max(times)
 
-            if deferral > 0:
+            if deferral > 0 and times is not None:
                 times = [x + deferral for x in times]
 
             if 0 < f < 1:
 
                 if drb == "balloon":
                     self.drb_pmt = self.get_balloon(gr)
-                    amounts[-1] = self.drb_pmt
+                    self._drb_mode = 'replace'
                 elif drb == "drop":
                     self.drb_pmt = self.get_drop(gr)
-                    amounts.append(self.drb_pmt)
-                    times.append(self.term)
+                    self._drb_mode = 'append'
                     self.n_payments += 1
 
                 self.is_level_pmt = False
@@ -268,13 +291,18 @@ class Annuity(Payments):
                     t=self.term
                 )
 
-                amounts.append(self.drb_pmt)
-                times.append(self.term)
+                self._drb_mode = 'append'
                 self.is_level_pmt = False
 
             else:
                 pass
 
+            if amounts is not None and self._drb_mode == 'replace':
+                amounts[-1] = self.drb_pmt
+            elif amounts is not None and self._drb_mode == 'append':
+                amounts.append(self.drb_pmt)
+                times.append(self.term)
+
             if (isinstance(amount, (int, float)) or (isinstance(amount, list) and
                 len(amount))) == 1 and \
                     gprog == 0 and \
@@ -286,6 +314,12 @@ class Annuity(Payments):
 
                 self.is_level_pmt = False
 
+            elif amounts is None:
+
+                # level payments, with the final payment replaced by or followed by the drop or balloon payment
+                n_level = self._spec[-1] - 1 if self._drb_mode == 'replace' else self._spec[-1]
+                self.is_level_pmt = n_level == 0 or self.drb_pmt == self.amount
+
             elif amounts[1:] == amounts[:-1]:
 
                 self.is_level_pmt = True
@@ -308,6 +342,53 @@ class Annuity(Payments):
         if imd not in ['immediate', 'due']:
             raise ValueError('imd can either be immediate or due.')
 
+    @property
+    def amounts(self) -> Union[list, Callable]:
+        """
+        The payment amounts. For annuities whose payments follow a formula, the list is only generated the first \
+        time it is needed, since the shortcut formulas used by :meth:`pv` and :meth:`sv` do not require it.
+        """
+        if self._amounts is None and self._spec is not None:
+            self._materialize()
+
+        return self._amounts
+
+    @amounts.setter
+    def amounts(self, value):
+        self._amounts = value
+
+    @property
+    def times(self) -> Union[list, Callable]:
+        """
+        The payment times, generated along with the payment amounts when first needed.
+        """
+        if self._times is None and self._spec is not None:
+            self._materialize()
+
+        return self._times
+
+    @times.setter
+    def times(self, value):
+        self._times = value
+
+    def _materialize(self):
+        amount, gprog, aprog, mprog, period, imd_ind, n_payments = self._spec
+
+        amounts = [amount * (1 + gprog) ** x + aprog * floor(x * mprog) for x in range(n_payments)]
+        times = [period * (x + imd_ind) for x in range(n_payments)]
+
+        if self.deferral > 0:
+            times = [x + self.deferral for x in times]
+
+        if self._drb_mode == 'replace':
+            amounts[-1] = self.drb_pmt
+        elif self._drb_mode == 'append':
+            amounts.append(self.drb_pmt)
+            times.append(self.term)
+
+        self._amounts = amounts
+        self._times = times
+
     def pv(self) -> float:
         """
         Calculates the present value of the annuity. The formula used to calculate the present value will \
@@ -333,36 +414,36 @@ class Annuity(Payments):
         """
 
         if isinstance(self.amount, Callable):
-            def f(x):
-                return self.amount(x) * self.gr.discount_func(x)
-            pv = quad(f, 0, self.term)[0]
+            pv = self._continuous_pv()
+
+        # arithmetic progressions, alone or combined with geometric ones, and drop or balloon payments
+        elif self._has_progression_form():
+            return self._progression_pv()
+
+        # level perpetuity
+        elif self._ann_perp == 'perpetuity' and isinstance(self.gr, Accumulation) and self.gr.is_level and \
+                self.is_level_pmt and self.aprog == 0 and self.gprog == 0:
+            pv = self.amount / (self.gr.val(self.period) - 1)
+
+        # growing perpetuities, which the stream values as a summed head plus a closed-form tail
+        elif self._ann_perp == 'perpetuity':
+            return self.stream.npv()
 
         # if interest rate is level, can use formulas to save time
         elif isinstance(self.gr, Accumulation) and self.gr.is_level and (self.is_level_pmt or self.gprog != 0):
             i = self.gr.val(self.period) - 1
             g = self.gprog
 
-            if self._ann_perp == 'perpetuity':
-                # perpetuity with arithmetically increasing payments
-                if self.aprog != 0:
-                    pv = self.amount / i + self.aprog / (i ** 2)
+            if round(i - g, 5) != 0:
 
-                else:
+                pv = self.amount * ((1 - ((1 + g) / (1 + i)) ** self.n_payments) / (i - g))
 
-                    pv = self.amount / (self.gr.val(self.period) - 1)
+            # Continuously paying annuity
+            elif self.period == 0:
+                pv = self.abar_angln()
 
             else:
-
-                if round(i - g, 5) != 0:
-
-                    pv = self.amount * ((1 - ((1 + g) / (1 + i)) ** self.n_payments) / (i - g))
-
-                # Continuously paying annuity
-                elif self.period == 0:
-                    pv = self.abar_angln()
-
-                else:
-                    pv = self.n_payments * self.amount * (1 + i) ** (-1)
+                pv = self.n_payments * self.amount * (1 + i) ** (-1)
 
         # annuity with arithmetically increasing payments
         elif self.aprog != 0 and self.mprog == 0:
@@ -378,35 +459,11 @@ class Annuity(Payments):
 
                 pv = p * a_n + q / i * (a_n - n * (1 + i) ** - n)
 
-        # perpetuity with geometric payments and tiered growth
-        elif self._ann_perp == 'perpetuity' and isinstance(self.gr.gr, TieredTime):
-
-            intervals = list(np.diff(self.gr.gr.tiers))
-            rates_b = self.gr.gr.rates[:-1]
-            r_f = self.gr.gr.rates[-1]
-            t_f = self.gr.gr.tiers[-1]
-
-            pv = 0
-            disc = 1
-            for t, r in zip(intervals, rates_b):
-                n = t / self.period
-                i = (1 + r) ** self.period - 1
-                ratio = (1 + self.gprog) / (1 + i)
-                pv_t = self.amount * ((1 + i) ** -1) * ((1 - ratio ** n) / (1 - ratio))
-                pv += pv_t
-                disc *= (1 + r) ** (-t)
-
-            pv_f = disc * (self.amount * (1 + self.gprog) ** t_f) * ((1 + r_f) ** -1) * (
-                        1 / (1 - ((1 + self.gprog) / (1 + r_f))))
-
-            pv += pv_f
-
         else:
-            # otherwise, use npv function
-            pv = self.npv()
-            skip_due = True
+            # otherwise, value the payments directly, which already accounts for their timing and any deferral
+            return self._vec_value()
 
-        if self.imd == 'due' and 'skip_due' not in locals():
+        if self.imd == 'due':
             i = self.gr.val(self.period) - 1
             pv = pv * (1 + i)
 
@@ -466,27 +523,24 @@ class Annuity(Payments):
 
                 sv = p * s_n + q / i * (s_n - n)
 
-        # reinvestment
-        elif self.reinv is not None:
-
-            i = self.gr.val(self.period) - 1
-            n = self.n_payments
-            rn = n - 1
+        elif self._has_progression_form() and self.reinv is None:
 
-            r = standardize_acc(self.reinv)
-            r = r.val(self.period) - 1
-            dr = r / (1 + r)
-            aprog = self.amount * i
+            return self._progression_pv() * self.gr.val(self.term + self.deferral)
 
-            i_s = aprog * (((((1 + r) ** rn - 1) / dr) - rn) / r)
-
-            k = self.amount * n
+        # reinvestment
+        elif self.reinv is not None:
 
-            sv = i_s + k
+            return reinvested_sv(
+                amounts=self.amounts,
+                times=self.times,
+                gr=self.gr,
+                reinv=self.reinv,
+                t=self.term + self.deferral
+            )
 
         else:
 
-            sv = self.eq_val(t=self.term + self.deferral)
+            sv = self._vec_value(t=self.term + self.deferral)
 
             return sv
 
@@ -499,6 +553,124 @@ class Annuity(Payments):
 
         return sv
 
+    def _continuous_pv(
+        self,
+        tol: float = 1e-8,
+        max_panels: int = 256
+    ) -> float:
+        """
+        Calculates the present value of a continuously paying annuity with a callable amount with \
+        :func:`tmval.factors.continuous_pv`, doubling the number of panels until the estimated error is within a \
+        tolerance relative to the present value. If the tolerance is not met by max_panels, as can happen when the \
+        rate of payment jumps, scipy quad is used instead and a warning is emitted.
+        """
+        n_panels = 16
+        while n_panels <= max_panels:
+            res = continuous_pv(amount=self.amount, term=self.term, gr=self.gr, n_panels=n_panels)
+            if res['error'] <= tol * max(abs(res['pv']), 1):
+                return res['pv']
+            n_panels *= 2
+
+        warnings.warn("Gauss-Legendre quadrature of the continuously paying annuity did not converge, with an "
+                      "estimated error of %s, falling back to scipy quad." % res['error'])
+
+        def f(x):
+            return self.amount(x) * self.gr.discount_func(x)
+
+        return quad(f, 0, self.term, limit=200)[0]
+
+    def _has_progression_form(self) -> bool:
+        """
+        Whether the payments follow a formula with an arithmetic progression or a drop or balloon payment, and the \
+        growth rate is compound, so that :meth:`_progression_pv` applies.
+        """
+        return self._spec is not None and \
+            (self.aprog != 0 or self._drb_mode is not None) and \
+            isinstance(self.gr, Accumulation) and \
+            self.gr.is_compound
+
+    def _progression_pv(self) -> float:
+        """
+        Calculates the present value of an annuity whose payments are :math:`P(1 + g)^k + Q \\lfloor k m \\rfloor` \
+        for k = 0, 1, ..., n - 1, where m is the number of arithmetic steps per payment, including any deferral and \
+        drop or balloon payment, from the annuity factors.
+        """
+        amount, gprog, aprog, mprog, period, imd_ind, n_payments = self._spec
+        imd = 'immediate' if imd_ind else 'due'
+        i = self.gr.val(period) - 1
+
+        # a balloon payment replaces the final payment, so the progression covers one fewer payment
+        n = n_payments - 1 if self._drb_mode == 'replace' else n_payments
+
+        pv = amount * a_angln(n=n, i=i, g=gprog, imd=imd)
+
+        if aprog != 0:
+            pv += aprog * self._step_factor(n=n, i=i, m=mprog) * (1 if imd_ind else 1 + i)
+
+        pv *= self.gr.discount_func(self.deferral)
+
+        if self._drb_mode == 'replace':
+            pv += self.drb_pmt * self.gr.discount_func(period * (n_payments - 1 + imd_ind) + self.deferral)
+        elif self._drb_mode == 'append':
+            pv += self.drb_pmt * self.gr.discount_func(self.term)
+
+        return pv
+
+    @staticmethod
+    def _step_factor(
+        n: int,
+        i: float,
+        m: float
+    ) -> float:
+        """
+        Calculates :math:`\\sum_{k=0}^{n-1} \\lfloor k m \\rfloor v^{k+1}`, the present value of the arithmetic \
+        steps per unit of increase. When m is a whole number, the steps increase by m every payment. When 1 / m is a \
+        whole number r, the steps increase by 1 every r payments, and the annuity is valued in blocks of r payments. \
+        Otherwise, the steps are summed over an array of the payments.
+        """
+        if n <= 0:
+            return 0.0
+
+        r = 1 / m if m else np.inf
+
+        if float(m).is_integer():
+            return m * ia_angln(n=n, i=i, p=0, q=1)
+
+        elif abs(r - round(r)) < 1e-9:
+            r = round(r)
+            i_r = (1 + i) ** r - 1
+            n_blocks = n // r
+            rem = n - n_blocks * r
+
+            return a_angln(n=r, i=i) * (1 + i_r) * ia_angln(n=n_blocks, i=i_r, p=0, q=1) + \
+                n_blocks * (1 + i_r) ** - n_blocks * a_angln(n=rem, i=i)
+
+        else:
+            k = np.arange(n)
+            return float(np.floor(k * m) @ (1 + i) ** - (k + 1.0))
+
+    def _vec_value(
+        self,
+        t: float = None
+    ) -> float:
+        """
+        Values the payments at time t, or at time 0 if t is not provided, evaluating the growth function on an \
+        array of the payment times instead of payment by payment.
+        """
+        if self.stream is not None:
+            return self.stream.npv() if t is None else self.stream.eq_val(t=t)
+
+        if not isinstance(self.gr, Accumulation) or not isinstance(self.amounts, list):
+            return self.npv() if t is None else self.eq_val(t=t)
+
+        amounts = np.array(self.amounts, dtype=float)
+        acc = array_func(self.gr.val)(np.array(self.times, dtype=float))
+
+        if t is None:
+            return float(np.sum(amounts / acc))
+        else:
+            return float(np.sum(amounts * (self.gr.val(t) / acc)))
+
     def sbar_angln(self):
         delta = self.get_delta()
         return (np.exp(delta * self.term) - 1) / delta
@@ -585,6 +757,289 @@ class Annuity(Payments):
         return self.gr.interest_rate.convert_rate(pattern="Force of Interest")
 
 
+class AnnuityBook:
+    """
+    :class:`AnnuityBook` values a block of level or geometrically increasing annuities that differ only in amount, \
+    period, term, deferral, growth and interest rate. Each contract is a row of a set of columns, and every \
+    calculation runs over all the rows at once with the annuity factor kernels, so that no :class:`.Annuity` or \
+    Accumulation object is constructed per contract.
+
+    Each column may be a single value shared by every row, or an array with one entry per row. The columns can also \
+    be passed together as a dict of arrays to data, whose entries take the place of the keyword arguments.
+
+    :param amount: the first payment of each annuity.
+    :type amount: float, ndarray
+    :param term: the term of each annuity, excluding any deferral, in years.
+    :type term: float, ndarray
+    :param gr: a compound growth rate object shared by every row, or an array of annual effective interest rates.
+    :type gr: float, Rate, Accumulation, ndarray
+    :param period: the payment period of each annuity, as a fraction of a year, defaults to 1.
+    :type period: float, ndarray
+    :param gprog: the geometric rate at which each annuity's payments grow, defaults to 0.
+    :type gprog: float, ndarray
+    :param deferral: the deferral period of each annuity, in years, defaults to 0.
+    :type deferral: float, ndarray
+    :param imd: 'immediate' or 'due', or an array of them, defaults to 'immediate'.
+    :type imd: str, ndarray
+    :param data: a dict of columns, keyed by the names of the arguments above.
+    :type data: dict
+    """
+    def __init__(
+        self,
+        amount: Union[float, np.ndarray] = None,
+        term: Union[float, np.ndarray] = None,
+        gr: Union[float, Rate, Accumulation, np.ndarray] = None,
+        period: Union[float, np.ndarray] = 1.0,
+        gprog: Union[float, np.ndarray] = 0.0,
+        deferral: Union[float, np.ndarray] = 0.0,
+        imd: Union[str, np.ndarray] = 'immediate',
+        data: dict = None
+    ):
+        cols = {
+            'amount': amount,
+            'term': term,
+            'gr': gr,
+            'period': period,
+            'gprog': gprog,
+            'deferral': deferral,
+            'imd': imd
+        }
+
+        if data is not None:
+            unknown = set(data) - set(cols)
+            if unknown:
+                raise ValueError("Unknown columns passed to data: " + ", ".join(sorted(unknown)) + ".")
+            cols.update(data)
+
+        if cols['amount'] is None or cols['term'] is None or cols['gr'] is None:
+            raise ValueError("The amount, term and gr columns are required.")
+
+        imd = np.asarray(cols['imd'])
+        if not np.all(np.isin(imd, ['immediate', 'due'])):
+            raise ValueError("imd can either be immediate or due.")
+
+        gr = cols['gr']
+        rates = isinstance(gr, (list, np.ndarray))
+
+        columns = np.broadcast_arrays(
+            np.asarray(cols['amount'], dtype=float),
+            np.asarray(cols['term'], dtype=float),
+            np.asarray(cols['period'], dtype=float),
+            np.asarray(cols['gprog'], dtype=float),
+            np.asarray(cols['deferral'], dtype=float),
+            (imd == 'due').astype(float),
+            np.asarray(gr, dtype=float) if rates else np.zeros(1)
+        )
+        columns = [np.atleast_1d(x).astype(float) for x in columns]
+        self.amount, self.term, self.period, self.gprog, self.deferral, self.due, gr_col = columns
+
+        if not np.all(np.isfinite(self.term)):
+            raise ValueError("AnnuityBook only values annuities with finite terms.")
+
+        self.gr = gr_col if rates else gr
+        self.i = get_period_rate(gr=self.gr, period=self.period)
+
+        if self.i is None:
+            raise ValueError("AnnuityBook requires a compound growth rate.")
+
+        self.i = np.broadcast_to(self.i, self.amount.shape)
+        self.n_payments = np.floor(np.round(self.term / self.period, 9))
+
+        # the time of each annuity's first payment
+        self.first = self.deferral + self.period * (1 - self.due)
+
+    def __len__(self) -> int:
+        return self.amount.size
+
+    def pv(self) -> np.ndarray:
+        """
+        Calculates the present value of each annuity.
+
+        :return: the present values.
+        :rtype: ndarray
+        """
+        return self.amount * a_angln(
+            n=self.n_payments,
+            i=self.i,
+            g=self.gprog,
+            deferral=self.deferral / self.period - self.due
+        )
+
+    def sv(self) -> np.ndarray:
+        """
+        Calculates the accumulated value of each annuity at the end of its term, including any deferral.
+
+        :return: the accumulated values.
+        :rtype: ndarray
+        """
+        return self.pv() * (1 + get_period_rate(gr=self.gr, period=self.term + self.deferral))
+
+    def _n_paid(self, t: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Returns the number of payments each annuity has made by time t, counting a payment made at t, with one \
+        column per time if t is an array.
+        """
+        t = np.asarray(t, dtype=float)
+        first, period, n = self.first, self.period, self.n_payments
+
+        if t.ndim:
+            first, period, n = first[:, None], period[:, None], n[:, None]
+
+        k = np.floor(np.round((t - first) / period, 9)) + 1
+
+        return np.clip(k, 0, n)
+
+    def balance(self, t: float) -> np.ndarray:
+        """
+        Calculates the outstanding value of each annuity at the valuation date t, being the value at t of the \
+        payments made after t.
+
+        :param t: the valuation date.
+        :type t: float
+        :return: the balances.
+        :rtype: ndarray
+        """
+        k = self._n_paid(t)
+        next_time = self.first + k * self.period
+
+        return self.amount * (1 + self.gprog) ** k * a_angln(
+            n=self.n_payments - k,
+            i=self.i,
+            g=self.gprog,
+            imd='due',
+            deferral=(next_time - t) / self.period
+        )
+
+    def cash_flows(
+        self,
+        edges: Union[list, np.ndarray],
+        aggregate: bool = False
+    ) -> dict:
+        """
+        Projects the payments of each annuity into time buckets, where each bucket collects the payments made \
+        after its left edge, up to and including its right edge. When aggregate is set to True, the projections \
+        are summed into a single cash-flow vector for the whole book.
+
+        :param edges: the edges of the time buckets, in increasing order.
+        :type edges: list, ndarray
+        :param aggregate: whether to sum the cash flows over the annuities, defaults to False.
+        :type aggregate: bool
+        :return: a dictionary of the right edges of the buckets and the cash flows, with one row per annuity \
+        unless aggregate is True.
+        :rtype: dict
+        """
+        edges = np.asarray(edges, dtype=float)
+
+        # the payments in each bucket run from the first one unpaid at its left edge to the last one paid by its right
+        k = self._n_paid(edges)
+        g = self.gprog[:, None]
+        flows = self.amount[:, None] * (1 + g) ** k[:, :-1] * s_angln(n=np.diff(k, axis=1), i=g)
+
+        if aggregate:
+            flows = flows.sum(axis=0)
+
+        return {
+            'time': edges[1:],
+            'amount': flows
+        }
+
+
+def round_cents(
+    x: Union[float, list, np.ndarray],
+    rounding: str = 'nearest'
+) -> Union[int, np.ndarray]:
+    """
+    Rounds amounts to whole cents, returning the number of cents as integers. The rounding is decided on the exact \
+    binary value of each amount, using an error-free product, so the results agree with Python's round(x, 2) when \
+    rounding is 'nearest' (ties go to the even cent), and with the decimal module's ROUND_UP when rounding is 'up' \
+    (away from zero).
+
+    :param x: an amount, or an array of amounts.
+    :type x: float, list, ndarray
+    :param rounding: 'nearest' or 'up', defaults to 'nearest'.
+    :type rounding: str
+    :return: the number of cents, or an array of them.
+    :rtype: int, ndarray
+    """
+    x = np.asarray(x, dtype=float)
+
+    # hi + lo is exactly 100 * x, using Dekker's splitting of x into two halves of 26 bits
+    hi = x * 100
+    split = x * 134217729.0
+    x_hi = split - (split - x)
+    x_lo = x - x_hi
+    lo = (x_hi * 100 - hi) + x_lo * 100
+
+    if rounding == 'nearest':
+        m = np.floor(hi)
+        frac = hi - m
+        tie = frac == .5
+        up = (frac > .5) | (tie & (lo > 0)) | (tie & (lo == 0) & (m % 2 == 1))
+        res = m + up
+    elif rounding == 'up':
+        res = np.where(x >= 0, np.ceil(hi), np.floor(hi))
+        res = res + ((hi == res) & (x >= 0) & (lo > 0)) - ((hi == res) & (x < 0) & (lo < 0))
+    else:
+        raise ValueError("rounding can either be nearest or up.")
+
+    res = res.astype(np.int64)
+
+    if res.ndim == 0:
+        res = int(res)
+
+    return res
+
+
+def cents_pmts(
+    target: Union[float, np.ndarray],
+    factor: Union[float, np.ndarray],
+    carry: Union[float, np.ndarray] = 1.0,
+    last_factor: Union[float, np.ndarray] = 1.0
+) -> dict:
+    """
+    Rounds the payments of a batch of annuities to cents with the Daniel and Vaaler algorithm, on integer arrays of \
+    cents. Each annuity is described by the value it must reach, such as a loan amount or a savings goal, and the \
+    value of the annuity per unit of payment. The exact payment is first rounded to the nearest cent. If that \
+    payment reaches the target to the cent, no adjustment is needed. Otherwise, the payment is rounded up to the \
+    next cent and the final payment is reduced by the overpayment, carried forward to the final payment date.
+
+    :param target: the value that the payments must reach, or an array of them.
+    :type target: float, ndarray
+    :param factor: the value of the annuity per unit of payment, such as :math:`\\ax{\\angln i}` for a loan or \
+    :math:`\\sx{\\angln i}` for a savings goal, or an array of them.
+    :type factor: float, ndarray
+    :param carry: the factor that accumulates the overpayment to the final payment date, defaults to 1.
+    :type carry: float, ndarray
+    :param last_factor: the size of the final payment relative to the first, defaults to 1.
+    :type last_factor: float, ndarray
+    :return: a dictionary with the exact payments, whether the payments rounded to the nearest cent reach the \
+    target, and the rounded up payments and final payments in cents.
+    :rtype: dict
+    """
+    target = np.asarray(target, dtype=float)
+    factor = np.asarray(factor, dtype=float)
+
+    pmt = target / factor
+    fits = target == round_cents(round_cents(pmt) / 100 * factor) / 100
+
+    pmt_cents = round_cents(pmt, rounding='up')
+    diff = pmt_cents / 100 * factor - target
+    last = round_cents(pmt_cents / 100 * last_factor - round_cents(diff * carry) / 100)
+
+    res = {
+        'pmt': pmt,
+        'fits': fits,
+        'cents': pmt_cents,
+        'last': last
+    }
+
+    if pmt.ndim == 0:
+        res['pmt'] = float(pmt)
+        res['fits'] = bool(fits)
+
+    return res
+
+
 def get_loan_amt(
     down_pmt: float,
     loan_pmt: float,
@@ -609,14 +1064,19 @@ def get_loan_amt(
     :rtype: float
     """
 
-    ann = Annuity(
-        period=period,
-        term=term,
-        amount=loan_pmt,
-        gr=gr
-    )
+    i = get_period_rate(gr=gr, period=period)
 
-    loan_amt = ann.pv() + down_pmt
+    if i is not None:
+        loan_amt = loan_pmt * a_angln(n=floor(term / period), i=i) + down_pmt
+    else:
+        ann = Annuity(
+            period=period,
+            term=term,
+            amount=loan_pmt,
+            gr=gr
+        )
+
+        loan_amt = ann.pv() + down_pmt
 
     return loan_amt
 
@@ -694,34 +1154,42 @@ def get_loan_pmt(
 
         acc = Accumulation(gr=gr)
 
-        pmt_round = round(pmt, 2)
+        if aprog == 0:
+            # the present value is proportional to the payment, so the factor for a payment of 1 is reused
+            n = ann.n_payments
+            res = cents_pmts(
+                target=loan_amt,
+                factor=ann.pv(),
+                carry=acc.val(t=term),
+                last_factor=(1 + gprog) ** (n - 1)
+            )
 
-        pv = Annuity(
-            amount=pmt_round,
-            period=period,
-            term=term,
-            gr=gr,
-            gprog=gprog,
-            imd=imd
-        ).pv()
+            if res['fits']:
 
-        if loan_amt == round(pv, 2):
+                return pmts_dict
 
-            return pmts_dict
+            growth = np.array([(1 + gprog) ** x for x in range(n - 1)])
+            pmts = (round_cents(res['cents'] / 100 * growth) / 100).tolist()
+            pmts.append(res['last'] / 100)
 
         else:
+            pmt_round = round_cents(pmt) / 100
 
-            cent = decimal.Decimal('0.01')
+            pv = Annuity(
+                amount=pmt_round,
+                period=period,
+                term=term,
+                gr=gr,
+                gprog=gprog,
+                imd=imd
+            ).pv()
 
-            pmt_round2 = float(
-                decimal.Decimal(pmt).quantize(
-                    cent,
-                    rounding=decimal.ROUND_UP
-                )
-            )
+            if loan_amt == round_cents(pv) / 100:
+
+                return pmts_dict
 
             d_ann = Annuity(
-                amount=pmt_round2,
+                amount=round_cents(pmt, rounding='up') / 100,
                 period=period,
                 term=term,
                 gr=gr,
@@ -732,15 +1200,15 @@ def get_loan_pmt(
 
             diff = d_ann.pv() - loan_amt
 
-            last_pmt = round(d_ann.amounts[-1] - round(diff * acc.val(t=term), 2), 2)
+            last_pmt = round_cents(d_ann.amounts[-1] - round_cents(diff * acc.val(t=term)) / 100) / 100
 
-            pmts = [round(x, 2) for x in d_ann.amounts[:-1]]
+            pmts = (round_cents(d_ann.amounts[:-1]) / 100).tolist()
             pmts.append(last_pmt)
 
-            pmts_dict = {
-                'times': times,
-                'amounts': pmts
-            }
+        pmts_dict = {
+            'times': times,
+            'amounts': pmts
+        }
 
     return pmts_dict
 
@@ -771,52 +1239,91 @@ def get_savings_pmt(
     :rtype: float, or tuple if cents is True
     """
 
-    ann = Annuity(
-        period=period,
-        term=term,
-        gr=gr
-    )
+    if term < period:
+        raise ValueError("The term must be at least one payment period.")
 
-    pmt = fv / ann.sv()
+    i = get_period_rate(gr=gr, period=period)
 
-    if cents:
-        pmt_round = round(pmt, 2)
-
-        fv2 = Annuity(
-            amount=pmt_round,
+    # the accumulated value is proportional to the payment, so only the factor for a payment of 1 is needed
+    if i is not None:
+        s_n = s_angln(n=floor(term / period), i=i)
+    else:
+        s_n = Annuity(
             period=period,
             term=term,
             gr=gr
         ).sv()
 
-        if fv == round(fv2, 2):
+    pmt = fv / s_n
+
+    if cents:
+        res = cents_pmts(target=fv, factor=s_n)
+
+        if res['fits']:
 
             return pmt
 
         else:
-            cent = decimal.Decimal('0.01')
+            Installments = namedtuple('installments', 'amount last')
 
-            pmt_round2 = float(
-                decimal.Decimal(pmt).quantize(
-                    cent,
-                    rounding=decimal.ROUND_UP
-                )
-            )
+            return Installments(res['cents'] / 100, res['last'] / 100)
+    else:
+        return pmt
 
-            diff = Annuity(
-                amount=pmt_round2,
-                period=period,
-                term=term,
-                gr=gr
-            ).sv() - fv
 
-            last_pmt = round(pmt_round2 - round(diff, 2), 2)
+def get_savings_pmt_batch(
+    fv: Union[float, np.ndarray],
+    period: Union[float, np.ndarray],
+    term: Union[float, np.ndarray],
+    gr: Union[float, Rate, Accumulation, np.ndarray],
+    cents: bool = False
+) -> dict:
+    """
+    Vectorized counterpart of :func:`get_savings_pmt`, which solves the savings payments for a batch of goals in a \
+    single pass over arrays using the accumulation factor :math:`\\sx{\\angln i}`, without constructing an \
+    annuity for each goal. When cents is set to True, the payments are rounded up to the next cent and the last \
+    payments are adjusted so that each future value is reached exactly. Goals whose payments reach the future \
+    value when rounded to the nearest cent keep their exact payments, as in :func:`get_savings_pmt`.
+
+    :param fv: the desired future values.
+    :type fv: float, ndarray
+    :param period: the payment periods, as fractions of a year.
+    :type period: float, ndarray
+    :param term: the amounts of time required to reach the future values, in years.
+    :type term: float, ndarray
+    :param gr: a compound growth rate object, or an array of annual effective interest rates.
+    :type gr: float, Rate, Accumulation, ndarray
+    :param cents: whether you want the payments rounded up to the next cent, except the final one.
+    :type cents: bool
+    :return: a dictionary of the exact payments and, if cents is True, whether the payments need adjustment and \
+    the adjusted payments and last payments.
+    :rtype: dict
+    """
+    i = get_period_rate(gr=gr, period=period)
 
-            Installments = namedtuple('installments', 'amount last')
+    if i is None:
+        raise ValueError("The batch functions require a compound growth rate.")
 
-            return Installments(pmt_round2, last_pmt)
-    else:
-        return pmt
+    fv = np.asarray(fv, dtype=float)
+    n = np.floor(np.asarray(term, dtype=float) / np.asarray(period, dtype=float))
+
+    if np.any(n < 1):
+        raise ValueError("The term must be at least one payment period.")
+
+    s_n = np.asarray(s_angln(n=n, i=i))
+
+    if not cents:
+        return {'pmt': fv / s_n}
+
+    res = cents_pmts(target=fv, factor=s_n)
+    fits = np.asarray(res['fits'])
+
+    return {
+        'pmt': np.asarray(res['pmt']),
+        'fits': fits,
+        'amount': np.where(fits, res['pmt'], res['cents'] / 100),
+        'last': np.where(fits, res['pmt'], res['last'] / 100)
+    }
 
 
 def get_number_of_pmts(
@@ -840,10 +1347,13 @@ def get_number_of_pmts(
     :return: The number of payments.
     :rtype: int
     """
-    i = gr.convert_rate(
-        'Effective Interest',
-        interval=period
-    )
+    i = get_period_rate(gr=gr, period=period)
+
+    if i is None:
+        i = gr.convert_rate(
+            'Effective Interest',
+            interval=period
+        )
 
     n = np.log(fv / pmt * i + 1) / np.log(1 + i)
 
@@ -852,6 +1362,41 @@ def get_number_of_pmts(
     return n
 
 
+def get_number_of_pmts_batch(
+    pmt: Union[float, np.ndarray],
+    fv: Union[float, np.ndarray],
+    period: Union[float, np.ndarray],
+    gr: Union[float, Rate, Accumulation, np.ndarray]
+) -> np.ndarray:
+    """
+    Vectorized counterpart of :func:`get_number_of_pmts`, which calculates the number of payments required to \
+    reach each of a batch of future values in a single pass over arrays, without converting the interest rate for \
+    each goal.
+
+    :param pmt: the payment amounts.
+    :type pmt: float, ndarray
+    :param fv: the desired future values.
+    :type fv: float, ndarray
+    :param period: the payment periods, as fractions of a year.
+    :type period: float, ndarray
+    :param gr: a compound growth rate object, or an array of annual effective interest rates.
+    :type gr: float, Rate, Accumulation, ndarray
+    :return: an array of the numbers of payments.
+    :rtype: ndarray
+    """
+    i = get_period_rate(gr=gr, period=period)
+
+    if i is None:
+        raise ValueError("The batch functions require a compound growth rate.")
+
+    fv = np.asarray(fv, dtype=float)
+    pmt = np.asarray(pmt, dtype=float)
+
+    n = np.log(fv / pmt * i + 1) / np.log(1 + i)
+
+    return np.ceil(n).astype(np.int64)
+
+
 def olb_r(
     loan: float,
     q: float,
@@ -876,15 +1421,20 @@ def olb_r(
     :rtype: float
     """
 
-    ann = Annuity(
-        period=period,
-        term=t,
-        gr=gr,
-        amount=q
-    )
+    i = get_period_rate(gr=gr, period=period)
+
+    if i is not None:
+        olb = loan * (1 + i) ** (t / period) - q * s_angln(n=floor(t / period), i=i)
+    else:
+        ann = Annuity(
+            period=period,
+            term=t,
+            gr=gr,
+            amount=q
+        )
 
-    acc = Accumulation(gr=gr)
-    olb = loan * acc.val(t) - ann.sv()
+        acc = Accumulation(gr=gr)
+        olb = loan * acc.val(t) - ann.sv()
 
     return max(olb, 0)
 
@@ -918,19 +1468,31 @@ def olb_p(
     :return: The outstanding loan balance.
     :rtype: float
     """
-    acc = Accumulation(gr=gr)
+    pmt_period = period if r is not None else min(period, term - t)
+    i = get_period_rate(gr=gr, period=pmt_period) if pmt_period > 0 else None
+
+    if i is not None:
+        acc = standardize_acc(gr)
+    else:
+        acc = Accumulation(gr=gr)
 
     if r is not None:
-        ann = Annuity(
-            period=period,
-            term=term - t - period,
-            gr=gr,
-            amount=q
-        )
+        if i is not None:
+            ann_pv = q * a_angln(n=floor((term - t - period) / period), i=i)
+        else:
+            ann_pv = Annuity(
+                period=period,
+                term=term - t - period,
+                gr=gr,
+                amount=q
+            ).pv()
 
         r_pv = r * acc.discount_func(term - t)
 
-        olb = ann.pv() + r_pv
+        olb = ann_pv + r_pv
+
+    elif i is not None:
+        olb = q * a_angln(n=floor((term - t) / pmt_period), i=i)
 
     else:
         ann = Annuity(
@@ -950,6 +1512,183 @@ def olb_p(
     return olb
 
 
+def olb_r_schedule(
+    loan: float,
+    q: float,
+    period: float,
+    gr: Union[Accumulation, float, Rate],
+    times: Union[list, np.ndarray]
+) -> np.ndarray:
+    """
+    Calculates the outstanding loan balance at each of a set of times, using the retrospective method. The \
+    balances are the same as those returned by :func:`.olb_r`, but when the growth rate is compound, they are \
+    calculated at once from the annuity factors instead of declaring an annuity for each time.
+
+    :param loan: The loan amount.
+    :type loan: float
+    :param q: The payment amount.
+    :type q: float
+    :param period: The payment period.
+    :type period: float
+    :param gr: A growth rate object.
+    :type gr: Accumulation, float, or Rate
+    :param times: The valuation times.
+    :type times: list, ndarray
+    :return: The outstanding loan balances.
+    :rtype: ndarray
+    """
+    times = np.asarray(times, dtype=float)
+    i = get_period_rate(gr=gr, period=period)
+
+    if i is None:
+        return np.array([olb_r(loan=loan, q=q, period=period, gr=gr, t=t) for t in times.ravel()]).reshape(times.shape)
+
+    n = np.floor(times / period)
+    olb = loan * (1 + i) ** (times / period) - q * np.asarray(s_angln(n=n, i=i))
+
+    return np.maximum(olb, 0)
+
+
+def olb_p_schedule(
+    q: float,
+    period: float,
+    term: float,
+    gr: Union[Accumulation, float, Rate],
+    times: Union[list, np.ndarray],
+    r: float = None,
+    missed: list = None
+) -> np.ndarray:
+    """
+    Calculates the outstanding loan balance at each of a set of times, using the prospective method. The balances \
+    are the same as those returned by :func:`.olb_p`, including the adjustment for missed payments, but when the \
+    growth rate is compound, they are calculated at once from the annuity factors instead of declaring an annuity \
+    for each time.
+
+    :param q: The payment amount.
+    :type q: float
+    :param period: The payment period.
+    :type period: float
+    :param term: The loan term, in years.
+    :type term: float
+    :param gr: A growth rate object.
+    :type gr: Accumulation, float, or Rate.
+    :param times: The valuation times, in years.
+    :type times: list, ndarray
+    :param r: The final payment amount, if different from the others, defaults to None.
+    :type r: float, optional
+    :param missed: A list of missed payments, for example, 4th and 5th payments would be [4, 5].
+    :type missed: list
+    :return: The outstanding loan balances.
+    :rtype: ndarray
+    """
+    times = np.asarray(times, dtype=float)
+    i = get_period_rate(gr=gr, period=period)
+
+    if i is None:
+        return np.array([
+            olb_p(q=q, period=period, term=term, gr=gr, t=t, r=r, missed=missed) for t in times.ravel()
+        ]).reshape(times.shape)
+
+    acc = standardize_acc(gr)
+    remaining = term - times
+
+    if r is not None:
+        olb = q * np.asarray(a_angln(n=np.floor((remaining - period) / period), i=i)) + \
+            r * np.asarray(acc.discount_func(remaining))
+    else:
+        # within the final period, the remaining payment is a single payment at the end of the term
+        olb = np.where(
+            remaining >= period,
+            q * np.asarray(a_angln(n=np.floor(remaining / period), i=i)),
+            np.where(remaining == 0, 0.0, q * np.asarray(acc.discount_func(remaining)))
+        )
+
+    if missed:
+        olb = olb + q * np.asarray(acc.val(times[..., None] - np.asarray(missed, dtype=float))).sum(axis=-1)
+
+    return olb
+
+
+def _grid_val(
+    gr: Union[Accumulation, float, Rate, TieredTime, list, np.ndarray],
+    grid: np.ndarray
+) -> np.ndarray:
+    """
+    Evaluates the accumulation function of a growth object over a grid of times. Unlike :func:`.standardize_acc`, \
+    accumulation objects that are not compound are accepted as is. An array of floats is read as one annual \
+    effective interest rate per annuity, giving one row of values per rate.
+    """
+    if isinstance(gr, (list, np.ndarray)):
+        return np.exp(np.log1p(np.asarray(gr, dtype=float))[:, None] * grid)
+
+    acc = gr if isinstance(gr, Accumulation) else standardize_acc(gr)
+
+    return np.asarray(array_func(acc.val)(grid), dtype=float)
+
+
+def reinvested_sv(
+    amounts: Union[list, np.ndarray],
+    times: Union[list, np.ndarray],
+    gr: Union[Accumulation, float, Rate, TieredTime, list, np.ndarray],
+    reinv: Union[Accumulation, float, Rate, TieredTime, list, np.ndarray],
+    t: float = None
+) -> Union[float, np.ndarray]:
+    """
+    Calculates the accumulated value at time t of deposits into a fund that pays out its interest at each payment \
+    time, and at t, where the interest is reinvested at a different rate. The deposits earn interest according to \
+    gr, and the reinvested interest grows according to reinv, which may be any growth object, including \
+    non-compound accumulation functions, tiered rates and interpolated curves.
+
+    The interest paid over each interval of the payment grid is the balance times the effective rate of gr over \
+    the interval, and it is accumulated to t with the reversed cumulative product of the growth factors of reinv \
+    over the later intervals. A batch of annuities sharing the same payment times can be valued at once by passing \
+    a 2-D array of amounts with one row per annuity, along with arrays of annual effective rates for gr and reinv \
+    if they differ between annuities.
+
+    :param amounts: the deposits, or a 2-D array of them with one row per annuity.
+    :type amounts: list, ndarray
+    :param times: the payment times, in increasing order.
+    :type times: list, ndarray
+    :param gr: the growth rate of the fund, or an array of annual effective rates.
+    :type gr: Accumulation, float, Rate, TieredTime, list, ndarray
+    :param reinv: the growth rate at which the interest is reinvested, or an array of annual effective rates.
+    :type reinv: Accumulation, float, Rate, TieredTime, list, ndarray
+    :param t: the valuation time, defaults to the last payment time.
+    :type t: float
+    :return: the accumulated value, or an array of them.
+    :rtype: float, ndarray
+    """
+    amounts = np.asarray(amounts, dtype=float)
+    times = np.asarray(times, dtype=float)
+
+    if t is None:
+        t = times[-1]
+
+    if t < times[-1]:
+        raise ValueError("The valuation time cannot precede the last payment.")
+
+    grid = np.append(times, t) if t > times[-1] else times
+
+    g_val = _grid_val(gr, grid)
+    r_val = _grid_val(reinv, grid)
+
+    # interest paid at the end of each interval, on the deposits made up to its start
+    rates = g_val[..., 1:] / g_val[..., :-1] - 1
+    interest = np.cumsum(amounts, axis=-1)[..., :grid.size - 1] * rates
+
+    # growth of the reinvested interest from the end of each interval to t
+    factors = r_val[..., 1:] / r_val[..., :-1]
+    growth = np.ones_like(factors)
+    growth[..., :-1] = np.cumprod(factors[..., :0:-1], axis=-1)[..., ::-1]
+
+    res = amounts.sum(axis=-1) + (interest * growth).sum(axis=-1)
+
+    if np.ndim(res) == 0:
+        res = float(res)
+
+    return res
+
+
 def get_perpetuity_gr(
     amount: float,
     pv: float,
@@ -1025,29 +1764,32 @@ def get_perpetuity_pmt(
 
 def n_solver(
         gr: Union[Accumulation, float, Rate],
-        amount: Union[float, int],
-        sv: Union[float, int] = None,
+        amount: Union[float, int, np.ndarray],
+        sv: Union[float, int, np.ndarray] = None,
         period: float = None,
-) -> float:
+) -> Union[float, np.ndarray]:
     """
     Given the present value, future value, growth rate, and payment interval, solves for the number of payments
-    in a level annuity.
+    in a level annuity. The amounts and future values may also be arrays, to solve a batch of annuities at once.
 
     :param gr: A growth rate object.
     :type gr: Accumulation, float, Rate
     :param amount: The present value of the annuity.
-    :type amount: float, int
+    :type amount: float, int, ndarray
     :param sv: The future value of the annuity.
-    :type sv: float, int
+    :type sv: float, int, ndarray
     :param period: The payment period.
     :type period: float
-    :return: The number of periods.
+    :return: The number of periods, or an array of them.
     """
-    if sv:
+    if sv is not None and (np.ndim(sv) > 0 or sv):
         acc = standardize_acc(gr)
-        i = acc.effective_rate(period)
+        i = acc.effective_rate(period).rate
+
+        n = np.log1p(np.asarray(sv) / amount * i) / np.log1p(i)
 
-        n = np.log(1 + sv / amount * i) / np.log(1 + i)
+        if np.ndim(n) == 0:
+            n = float(n)
     else:
         n = None
 
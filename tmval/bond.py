@@ -4,7 +4,7 @@ This file contains the Bond class, which is TmVal's class for representing bonds
 import numpy as np
 
 from math import floor
-from typing import Iterable, List, Union
+from typing import List, Union
 
 from tmval.annuity import Annuity
 from tmval.growth import Amount, standardize_acc, TieredTime
@@ -156,27 +156,25 @@ class Bond(Payments):
                 self.price = price
 
                 if self.is_zero:
-                    amounts = [-price, red]
+                    amounts = []
+                    period = 1
                 elif self.fr_is_level:
-                    amounts = [-price] + [self.fr] * self.n_coupons + [red]
+                    amounts = [self.fr] * self.n_coupons
+                    period = self.coupon_period()
                 else:
-                    amounts = [-price]
-                    cis = self.get_coupon_intervals()
+                    amounts = self.coupon_schedule()[0]
+                    period = self.coupon_period()
 
-                    for afr, cf, ci in zip(self.fr, self.cfreq, cis):
-                        n = cf * ci
-                        amounts += [afr[0]] * n
-                    amounts += [red]
-
-                times = [0.0] + self.get_coupon_times() + [term]
-
-                pmts = Payments(
+                j = yield_solver(
+                    price=price,
                     amounts=amounts,
-                    times=times
+                    times=self.get_coupon_times(),
+                    red=red,
+                    term=term,
+                    period=period
                 )
 
-                irr = [x for x in pmts.irr() if x > 0]
-                self.gr = standardize_acc(min(irr))
+                self.gr = standardize_acc((1 + j) ** (1 / period) - 1)
 
                 self.coupons = self.get_coupons()
 
@@ -202,7 +200,7 @@ class Bond(Payments):
                     self.gr = standardize_acc(gr)
                     self.coupons = self.get_coupons()
 
-                    self.red = (self.coupons.pv() - pd) / (1 - self.gr.discount_func(t=self.term))
+                    self.red = (self.coupons.npv() - pd) / (1 - self.gr.discount_func(t=self.term))
 
                     self.price = self.red + pd
 
@@ -216,8 +214,10 @@ class Bond(Payments):
                     self.g = self.fr / self.red
 
                     self.price = self.makeham()
-                    self.term = self.gr.solve_t(pv=k, fv=self.red)
-                    self.n_coupons = self.get_n_coupons()
+                    # the term is taken to be a whole number of coupon periods
+                    n = int(round(self.gr.solve_t(pv=k, fv=self.red) * self.cfreq))
+                    self.term = n / self.cfreq
+                    self.n_coupons = n
                     self.coupons = self.get_coupons()
                     self.is_term_floor = self.term_floor()
                 else:
@@ -258,7 +258,10 @@ class Bond(Payments):
 
         if price is None:
             if self.is_term_floor:
-                self.price = self.npv()
+                if self.gr.is_compound and self.gr.is_level:
+                    self.price = self.coupon_pv() + self.gr.discount_func(t=self.term, fv=self.red)
+                else:
+                    self.price = self.npv()
             else:
                 if self.n_coupons == 1:
 
@@ -299,12 +302,7 @@ class Bond(Payments):
         elif self.fr_is_level:
             times = [(x + 1) * 1 / self.cfreq for x in range(self.n_coupons)]
         else:
-            times = []
-            coupon_intervals = self.get_coupon_intervals()
-            for t, cf, a in zip(coupon_intervals, self.cfreq, self.alpha):
-                at = a[1]
-                n = t * cf
-                times += [(x + 1) * 1 / cf + at for x in range(n)]
+            times = self.coupon_schedule()[1].tolist()
 
         return times
 
@@ -341,7 +339,7 @@ class Bond(Payments):
         if self.is_zero:
             c = self.price * self.gr.val(self.term)
         else:
-            c = (self.price - self.coupons.pv()) * self.gr.val(self.term)
+            c = (self.price - self.coupons.npv()) * self.gr.val(self.term)
         return c
 
     def get_n_coupons(
@@ -360,24 +358,23 @@ class Bond(Payments):
         elif self.fr_is_level:
             # if term is evenly divisible by period, assume bond purchased at beginning of period
             if round(self.term % (1 / self.cfreq), 5) == 0:
-                n_coupons = self.term * self.cfreq
+                n_coupons = int(round(self.term * self.cfreq))
 
             # else, assume
             else:
                 n_coupons = 1 + floor(self.term * self.cfreq)
         else:
-            n_coupons = 0
-            for t, c in zip(self.coupon_intervals, self.cfreq):
-                n_coupons += t * c
+            n_coupons = int(self.tier_counts().sum())
 
         return n_coupons
 
-    def get_coupons(self) -> Annuity:
+    def get_coupons(self) -> Union[Annuity, Payments]:
         """
-        Calculates the coupons and returns them as an Annuity object.
+        Calculates the coupons and returns them as an Annuity object, or as a Payments object if the coupon \
+        frequency changes between tiers.
 
         :return: The bond coupons.
-        :rtype: Annuity
+        :rtype: Annuity, Payments
         """
         if self.is_zero:
             coupons = None
@@ -404,31 +401,109 @@ class Bond(Payments):
                 )
 
         else:
-            times = []
-            amounts = []
-            base = 0
+            amounts, times = self.coupon_schedule()
+
+            # tiers paid at different frequencies do not form an annuity, so they are kept as plain payments
+            if len(set(np.round(np.diff(times), 7))) > 1:
+                coupons = Payments(
+                    amounts=amounts.tolist(),
+                    times=times.tolist(),
+                    gr=self.gr
+                )
+            else:
+                coupons = Annuity(
+                    gr=self.gr,
+                    amount=amounts.tolist(),
+                    times=times.tolist(),
+                    term=self.term
+                )
 
-            if isinstance(self.fr, Iterable)\
-                    and isinstance(self.cfreq, Iterable)\
-                    and isinstance(self.coupon_intervals, Iterable):
+        return coupons
 
-                for a, c, t in zip(self.fr, self.cfreq, self.coupon_intervals):
-                    n_pmt = t * c
-                    amounts += [a[0]] * n_pmt
-                    times += [(x + base + 1) / c for x in range(n_pmt)]
-                    base += n_pmt
+    def tier_counts(self) -> np.ndarray:
+        """
+        Calculates the number of coupons paid in each tier of a bond with nonlevel coupons.
 
-            else:
-                raise TypeError("fr, cfreq, and coupon_intervals must be iterable when coupons are nonlevel")
+        :return: The number of coupons per tier.
+        :rtype: np.ndarray
+        """
 
-            coupons = Annuity(
-                gr=self.gr,
-                amount=amounts,
-                times=times,
-                term=self.term
-            )
+        counts = np.rint(np.asarray(self.coupon_intervals) * np.asarray(self.cfreq)).astype(int)
 
-        return coupons
+        return counts
+
+    def coupon_schedule(self) -> tuple:
+        """
+        Generates the coupon amounts and times of a bond with nonlevel coupons as NumPy arrays. Each tier \
+        contributes a block of level coupons, paid at its own frequency starting from the beginning of the tier.
+
+        :return: The coupon amounts and the coupon times.
+        :rtype: tuple
+        """
+
+        counts = self.tier_counts()
+        starts = np.array([a[1] for a in self.alpha], dtype=float)
+        periods = 1 / np.asarray(self.cfreq, dtype=float)
+
+        amounts = np.repeat([a[0] for a in self.fr], counts).astype(float)
+
+        # position of each coupon within its tier, 1, 2, ..., n for every tier
+        offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        idx = np.arange(counts.sum()) - np.repeat(offsets, counts) + 1
+
+        times = np.repeat(starts, counts) + idx * np.repeat(periods, counts)
+
+        return amounts, times
+
+    def coupon_pv(
+        self,
+        gr: Union[float, Rate] = None
+    ) -> float:
+        """
+        Calculates the present value of the coupons of a bond whose term coincides with a coupon payment. At a level \
+        compound yield, each tier of coupons is valued as a level annuity-immediate, and discounted to time 0 from the \
+        beginning of the tier, so the cost of valuing nonlevel coupons is proportional to the number of tiers rather \
+        than the number of coupons. Other yields discount each coupon directly.
+
+        :param gr: The valuation yield, defaults to the bond's yield.
+        :type gr: float, Rate
+        :return: The present value of the coupons.
+        :rtype: float
+        """
+
+        if gr is None:
+            acc = self.gr
+        else:
+            acc = standardize_acc(gr)
+
+        if self.is_zero:
+            return 0
+        elif not (acc.is_compound and acc.is_level):
+            # the closed form relies on a level compound yield, otherwise each coupon is discounted directly
+            pv = acc.discount_func(t=np.asarray(self.coupons.times), fv=np.asarray(self.coupons.amounts))
+            return float(np.sum(pv))
+        elif self.fr_is_level:
+            fr = np.array([self.fr], dtype=float)
+            starts = np.zeros(1)
+            periods = np.array([1 / self.cfreq])
+            counts = np.array([self.n_coupons])
+        else:
+            fr = np.array([a[0] for a in self.fr], dtype=float)
+            starts = np.array([a[1] for a in self.alpha], dtype=float)
+            periods = 1 / np.asarray(self.cfreq, dtype=float)
+            counts = self.tier_counts()
+
+        # one discount factor per tier, rather than per coupon
+        v_start = np.array([acc.discount_func(t=x) for x in starts])
+        v = np.array([acc.discount_func(t=x) for x in periods])
+        j = 1 / v - 1
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ann = np.where(j == 0, counts, (1 - v ** counts) / j)
+
+        pv = float(np.sum(fr * v_start * ann))
+
+        return pv
 
     def get_coupon_intervals(self) -> list:
         """
@@ -1123,6 +1198,223 @@ class Bond(Payments):
 
             return res
 
+    def yield_to_worst(
+        self,
+        times: Union[float, list],
+        premiums: Union[float, list] = None,
+        price: float = None
+    ) -> dict:
+
+        """
+        Calculates the yield to worst of a callable bond, the lowest yield among the call times and maturity. The \
+        yields for every call time are solved at once by :func:`.yield_solver`, with the coupons received prior to \
+        each call time read off a shared prefix sum of the coupon payments. The result is a dict containing the worst \
+        time, the yield to that time, and the price.
+
+        :param times: A list of call times.
+        :type times: float, list
+        :param premiums: A list of call premiums, corresponding to the call times. Defaults to no premiums.
+        :type premiums: float, list
+        :param price: The price of the bond, defaults to the bond's price.
+        :type price: float
+        :return: The worst time, the yield to worst, and the price.
+        :rtype: dict
+        """
+
+        if price is None:
+            price = self.price
+
+        call_times, call_reds, counts = self.call_schedule(times=times, premiums=premiums)
+
+        period = self.coupon_period()
+
+        j = yield_solver(
+            price=price,
+            amounts=self.coupons.amounts,
+            times=self.coupons.times,
+            red=call_reds,
+            term=call_times,
+            period=period,
+            n=counts
+        )
+
+        yields = (1 + j) ** (1 / period) - 1
+        worst = int(np.argmin(yields))
+
+        res = {
+            'time': float(call_times[worst]),
+            'yield': float(yields[worst]),
+            'price': price
+        }
+
+        return res
+
+    def price_to_worst(
+        self,
+        times: Union[float, list],
+        premiums: Union[float, list] = None,
+        gr: Union[float, Rate] = None
+    ) -> dict:
+
+        """
+        Calculates the price to worst of a callable bond, the lowest price among the call times and maturity, when \
+        the bond is priced at a given yield. The result is a dict containing the worst time, the yield, and the price \
+        to that time. The yield is reported as a rate when it is compound, and as the growth object otherwise.
+
+        :param times: A list of call times.
+        :type times: float, list
+        :param premiums: A list of call premiums, corresponding to the call times. Defaults to no premiums.
+        :type premiums: float, list
+        :param gr: The valuation yield, defaults to the bond's yield.
+        :type gr: float, Rate, Accumulation
+        :return: The worst time, the yield, and the price to worst.
+        :rtype: dict
+        """
+
+        if gr is None:
+            acc = self.gr
+        else:
+            acc = standardize_acc(gr)
+
+        call_times, call_reds, counts = self.call_schedule(times=times, premiums=premiums)
+
+        coupon_pv = acc.discount_func(t=np.asarray(self.coupons.times), fv=np.asarray(self.coupons.amounts))
+        coupon_pv = np.concatenate([[0.0], np.cumsum(coupon_pv)])
+        red_pv = acc.discount_func(t=call_times, fv=call_reds)
+
+        prices = coupon_pv[counts] + red_pv
+        worst = int(np.argmin(prices))
+
+        # only a compound yield reduces to a single rate, otherwise the growth object itself is reported
+        res = {
+            'time': float(call_times[worst]),
+            'yield': acc.interest_rate.rate if acc.is_compound else acc,
+            'price': float(prices[worst])
+        }
+
+        return res
+
+    def call_schedule(
+        self,
+        times: Union[float, list],
+        premiums: Union[float, list] = None
+    ) -> tuple:
+
+        """
+        Standardizes a call schedule, adding maturity if it is not already one of the call times. Returns arrays of \
+        the call times, the amounts paid upon call, and the number of coupons received up to and including each call \
+        time.
+
+        :param times: A list of call times.
+        :type times: float, list
+        :param premiums: A list of call premiums, corresponding to the call times. Defaults to no premiums.
+        :type premiums: float, list
+        :return: The call times, call amounts, and coupon counts.
+        :rtype: tuple
+        """
+
+        call_times = np.atleast_1d(np.asarray(times, dtype=float))
+
+        if premiums is None:
+            premiums = np.zeros(len(call_times))
+        else:
+            premiums = np.broadcast_to(np.asarray(premiums, dtype=float), call_times.shape)
+
+        if self.term not in call_times:
+            call_times = np.append(call_times, self.term)
+            premiums = np.append(premiums, 0.0)
+
+        call_reds = self.red + premiums
+        counts = np.searchsorted(self.coupons.times, call_times, side='right')
+
+        return call_times, call_reds, counts
+
+    def coupon_period(self) -> float:
+
+        """
+        Returns the length of the coupon period, in years. For nonlevel coupons, the period of the first set of \
+        coupons is returned.
+
+        :return: The coupon period.
+        :rtype: float
+        """
+
+        if self.fr_is_level:
+            period = 1 / self.cfreq
+        else:
+            period = 1 / self.cfreq[0]
+
+        return period
+
+    def price_grid(
+        self,
+        yields: Union[list, np.ndarray]
+    ) -> dict:
+
+        """
+        Evaluates the price, duration, and convexity of the bond at each of a vector of annual effective yields. The \
+        bond's cash flows are reused, and the discount factors for every cash flow and yield are calculated in a \
+        single matrix, so this is much faster than constructing a new bond for each yield. The results are returned \
+        as a dict of arrays, which can be supplied to a pandas DataFrame.
+
+        :param yields: The annual effective yields.
+        :type yields: list, np.ndarray
+        :return: The yields, prices, Macaulay durations, modified durations, and modified convexities.
+        :rtype: dict
+        """
+
+        y = np.atleast_1d(np.asarray(yields, dtype=float))
+        amounts = np.asarray(self.amounts[1:], dtype=float)
+        times = np.asarray(self.times[1:], dtype=float)
+
+        # discount factors, yields x cash flows
+        disc = (1 + y)[:, None] ** -times
+        pv = disc * amounts
+
+        price = pv.sum(axis=1)
+        macaulay = (pv * times).sum(axis=1) / price
+        modified = macaulay / (1 + y)
+        convexity = (pv * times * (times + 1)).sum(axis=1) / (price * (1 + y) ** 2)
+
+        res = {
+            'yield': y,
+            'price': price,
+            'macaulay_duration': macaulay,
+            'modified_duration': modified,
+            'convexity': convexity
+        }
+
+        return res
+
+    def yield_grid(
+        self,
+        prices: Union[list, np.ndarray]
+    ) -> np.ndarray:
+
+        """
+        Calculates the annual effective yield of the bond at each of a vector of prices. The yields are solved at \
+        once by :func:`.yield_solver`, using the bond's cash flows.
+
+        :param prices: The bond prices.
+        :type prices: list, np.ndarray
+        :return: The annual effective yields.
+        :rtype: np.ndarray
+        """
+
+        prices = np.atleast_1d(np.asarray(prices, dtype=float))
+
+        # a period of one year makes the solved rate annual effective
+        yields = yield_solver(
+            price=prices,
+            amounts=self.amounts[1:-1],
+            times=self.times[1:-1],
+            red=self.red,
+            term=self.term,
+            period=1
+        )
+
+        return yields
+
     def prior_coupons(
             self,
             t: float
@@ -1262,6 +1554,108 @@ def parse_cgr(
     return res
 
 
+def yield_solver(
+    price: Union[float, np.ndarray],
+    amounts: Union[list, np.ndarray],
+    times: Union[list, np.ndarray],
+    red: Union[float, np.ndarray],
+    term: Union[float, np.ndarray],
+    period: float,
+    n: Union[int, np.ndarray] = None,
+    tol: float = 1e-12,
+    max_iter: int = 50
+) -> Union[float, np.ndarray]:
+    """
+    Solves for the yield rate per coupon period :math:`j` of a bond, given its price, its coupon amounts and times, \
+    and a redemption amount paid at the end of the term. The bond salesman's method provides the starting value:
+
+    .. math::
+
+       j \\approx \\frac{Fr + \\frac{C - P}{n}}{\\frac{C + P}{2}}
+
+    which is then refined with Newton's method, using the closed-form derivative of the price with respect to \
+    :math:`j`. Since the price of a bond with positive cash flows decreases monotonically in :math:`j`, the root \
+    is unique, and there are no complex or negative roots to filter out. Convergence usually takes 3-5 iterations.
+
+    Coupons do not have to be level, so this works for coupon schedules generated from a :class:`.TieredTime`. \
+    Coupon times are supplied in years and are converted to coupon periods via the period argument.
+
+    The solver is vectorized. If price, red, term, or n are arrays, each element represents a separate bond that \
+    receives the first n coupons before being redeemed for red at time term, and all of them are solved at once.
+
+    :param price: The bond price.
+    :type price: float, np.ndarray
+    :param amounts: The coupon amounts.
+    :type amounts: list, np.ndarray
+    :param times: The coupon times, in years.
+    :type times: list, np.ndarray
+    :param red: The redemption amount.
+    :type red: float, np.ndarray
+    :param term: The time of redemption, in years.
+    :type term: float, np.ndarray
+    :param period: The length of the coupon period, in years.
+    :type period: float
+    :param n: The number of coupons received prior to redemption, defaults to all of them.
+    :type n: int, np.ndarray
+    :param tol: The convergence tolerance for :math:`j`, defaults to 1e-12.
+    :type tol: float
+    :param max_iter: The maximum number of Newton iterations, defaults to 50.
+    :type max_iter: int
+    :return: The yield rate per coupon period.
+    :rtype: float, np.ndarray
+    """
+    amounts = np.asarray(amounts, dtype=float)
+    periods = np.asarray(times, dtype=float) / period
+
+    price, red, term = np.broadcast_arrays(
+        np.asarray(price, dtype=float),
+        np.asarray(red, dtype=float),
+        np.asarray(term, dtype=float)
+    )
+
+    if n is None:
+        n = len(amounts)
+
+    n = np.broadcast_to(np.asarray(n, dtype=int), price.shape)
+    red_periods = term / period
+
+    # bond salesman's method for the starting value
+    coupons = np.concatenate([[0.0], np.cumsum(amounts)])[n]
+    j = (coupons + red - price) / red_periods / ((red + price) / 2)
+
+    for _ in range(max_iter):
+        v = 1 / (1 + j)
+        disc = v[..., None] ** periods
+
+        # prefix sums of the discounted coupons and their derivatives, read off at the n-th coupon
+        pv = np.cumsum(np.concatenate([np.zeros(disc.shape[:-1] + (1,)), amounts * disc], axis=-1), axis=-1)
+        dpv = np.cumsum(np.concatenate([np.zeros(disc.shape[:-1] + (1,)), amounts * periods * disc], axis=-1), axis=-1)
+
+        pv = np.take_along_axis(pv, n[..., None], axis=-1)[..., 0]
+        dpv = np.take_along_axis(dpv, n[..., None], axis=-1)[..., 0]
+
+        red_disc = v ** red_periods
+
+        f = pv + red * red_disc - price
+        df = - (dpv + red * red_periods * red_disc) * v
+
+        step = f / df
+        j_next = j - step
+
+        # an overshoot from above can jump past -1, in which case move halfway towards -1 instead
+        j = np.where(j_next > -1, j_next, (j - 1) / 2)
+
+        if np.all(np.abs(step) < tol):
+            break
+    else:
+        raise Exception("Yield solver failed to converge.")
+
+    if j.ndim == 0:
+        j = float(j)
+
+    return j
+
+
 # def bsolve_g_from_am_prem(
 #         am: float,
 #         gr,
@@ -68,4 +68,41 @@ EFFECTIVES = [
     'Effective Discount',
     'Simple Interest',
     'Simple Discount'
-]
\ No newline at end of file
+]
+
+# Day count conventions refer to canonical names of conventions and their aliases.
+DAY_COUNTS = {
+    'Actual/Actual ISDA': 'Actual/Actual ISDA',
+    'Actual/Actual': 'Actual/Actual ISDA',
+    'Act/Act': 'Actual/Actual ISDA',
+    'Act/Act ISDA': 'Actual/Actual ISDA',
+    'act/act': 'Actual/Actual ISDA',
+    'isda': 'Actual/Actual ISDA',
+
+    'Actual/Actual ICMA': 'Actual/Actual ICMA',
+    'Act/Act ICMA': 'Actual/Actual ICMA',
+    'ISMA-99': 'Actual/Actual ICMA',
+    'icma': 'Actual/Actual ICMA',
+
+    'Actual/360': 'Actual/360',
+    'Act/360': 'Actual/360',
+    'act/360': 'Actual/360',
+    'bankers': 'Actual/360',
+
+    'Actual/365 Fixed': 'Actual/365 Fixed',
+    'Act/365F': 'Actual/365 Fixed',
+    'Act/365': 'Actual/365 Fixed',
+    'act/365': 'Actual/365 Fixed',
+    'English': 'Actual/365 Fixed',
+
+    '30/360': '30/360',
+    '30/360 Bond Basis': '30/360',
+    'Bond Basis': '30/360',
+
+    '30E/360': '30E/360',
+    'Eurobond Basis': '30E/360',
+    '30/360 ICMA': '30E/360',
+
+    '30E/360 ISDA': '30E/360 ISDA',
+    'German': '30E/360 ISDA'
+}
\ No newline at end of file
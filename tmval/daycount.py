@@ -0,0 +1,431 @@
+"""
+Contains day count conventions, which convert pairs of dates into numbers of days and year fractions.
+The functions work on NumPy datetime64 arrays, so that millions of date pairs can be converted in one call.
+"""
+import datetime as dt
+import numpy as np
+
+from numpy import ndarray
+from typing import Iterable, Union
+
+from tmval.constants import DAY_COUNTS
+
+__all__ = [
+    'act_360',
+    'act_365f',
+    'act_act_icma',
+    'act_act_isda',
+    'actual_days',
+    'thirty_360',
+    'thirty_e_360',
+    'thirty_e_360_isda',
+    'to_datetime64',
+    'year_frac'
+]
+
+
+def to_datetime64(
+    dates: Union[dt.date, dt.datetime, str, Iterable, ndarray]
+) -> ndarray:
+    """
+    Converts dates supplied as datetime objects, ISO strings, or lists or arrays of them to a NumPy datetime64 array \
+    with a resolution of one day.
+
+    :param dates: a date, or a list or array of dates.
+    :type dates: datetime.date, datetime.datetime, str, Iterable, ndarray
+    :return: the dates as datetime64[D].
+    :rtype: ndarray
+    """
+    if isinstance(dates, dt.datetime):
+        dates = dates.date()
+    elif isinstance(dates, Iterable) and not isinstance(dates, (str, ndarray)):
+        dates = [x.date() if isinstance(x, dt.datetime) else x for x in dates]
+
+    return np.asarray(dates, dtype='datetime64[D]')
+
+
+def ymd(
+    dates: ndarray
+) -> tuple:
+    """
+    Splits an array of datetime64 dates into arrays of years, months, and days.
+
+    :param dates: the dates.
+    :type dates: ndarray
+    :return: the years, months, and days.
+    :rtype: tuple
+    """
+    dates = to_datetime64(dates)
+    months = dates.astype('datetime64[M]')
+
+    y = dates.astype('datetime64[Y]').astype(int) + 1970
+    m = months.astype(int) % 12 + 1
+    d = (dates - months).astype(int) + 1
+
+    return y, m, d
+
+
+def is_leap(
+    y: Union[int, ndarray]
+) -> Union[bool, ndarray]:
+    """
+    Checks whether years are leap years.
+
+    :param y: the year, or an array of years.
+    :type y: int, ndarray
+    :return: whether each year is a leap year.
+    :rtype: bool, ndarray
+    """
+    return (y % 4 == 0) & ((y % 100 != 0) | (y % 400 == 0))
+
+
+def days_in_month(
+    y: Union[int, ndarray],
+    m: Union[int, ndarray]
+) -> Union[int, ndarray]:
+    """
+    Calculates the number of days in a month.
+
+    :param y: the year, or an array of years.
+    :type y: int, ndarray
+    :param m: the month, or an array of months.
+    :type m: int, ndarray
+    :return: the number of days in the month.
+    :rtype: int, ndarray
+    """
+    start = (np.asarray(y) - 1970) * 12 + np.asarray(m) - 1
+
+    return ((start + 1).astype('datetime64[M]').astype('datetime64[D]') -
+            start.astype('datetime64[M]').astype('datetime64[D]')).astype(int)
+
+
+def add_months(
+    dates: ndarray,
+    months: Union[int, ndarray]
+) -> ndarray:
+    """
+    Adds a number of months to dates. If the day of the month does not exist in the resulting month, the last day \
+    of that month is used instead, so that adding a month to January 31 gives the end of February.
+
+    :param dates: the dates.
+    :type dates: ndarray
+    :param months: the number of months to add, or an array of them.
+    :type months: int, ndarray
+    :return: the resulting dates.
+    :rtype: ndarray
+    """
+    y, m, d = ymd(dates)
+    total = (y - 1970) * 12 + (m - 1) + np.asarray(months)
+
+    start = total.astype('datetime64[M]').astype('datetime64[D]')
+    d = np.minimum(d, days_in_month(total // 12 + 1970, total % 12 + 1))
+
+    return start + (d - 1)
+
+
+def act_360(
+    beg_dt: ndarray,
+    end_dt: ndarray
+) -> ndarray:
+    """
+    Calculates year fractions using the actual/360 convention, also known as the Banker's rule.
+
+    :param beg_dt: the beginning dates.
+    :type beg_dt: ndarray
+    :param end_dt: the ending dates.
+    :type end_dt: ndarray
+    :return: the year fractions.
+    :rtype: ndarray
+    """
+    return actual_days(beg_dt, end_dt) / 360
+
+
+def act_365f(
+    beg_dt: ndarray,
+    end_dt: ndarray
+) -> ndarray:
+    """
+    Calculates year fractions using the actual/365 fixed convention.
+
+    :param beg_dt: the beginning dates.
+    :type beg_dt: ndarray
+    :param end_dt: the ending dates.
+    :type end_dt: ndarray
+    :return: the year fractions.
+    :rtype: ndarray
+    """
+    return actual_days(beg_dt, end_dt) / 365
+
+
+def act_act_isda(
+    beg_dt: ndarray,
+    end_dt: ndarray
+) -> ndarray:
+    """
+    Calculates year fractions using the actual/actual ISDA convention, where the days falling in leap years are \
+    divided by 366 and the remaining days by 365:
+
+    .. math::
+
+       \\frac{\\text{days in non-leap years}}{365} + \\frac{\\text{days in leap years}}{366}
+
+    :param beg_dt: the beginning dates.
+    :type beg_dt: ndarray
+    :param end_dt: the ending dates.
+    :type end_dt: ndarray
+    :return: the year fractions.
+    :rtype: ndarray
+    """
+    beg_dt = to_datetime64(beg_dt)
+    end_dt = to_datetime64(end_dt)
+
+    y1 = beg_dt.astype('datetime64[Y]')
+    y2 = end_dt.astype('datetime64[Y]')
+
+    basis1 = np.where(is_leap(y1.astype(int) + 1970), 366, 365)
+    basis2 = np.where(is_leap(y2.astype(int) + 1970), 366, 365)
+
+    # the rest of the first year, the whole years in between, and the start of the last year
+    head = ((y1 + 1).astype('datetime64[D]') - beg_dt).astype(int) / basis1
+    tail = (end_dt - y2.astype('datetime64[D]')).astype(int) / basis2
+
+    return head + (y2 - y1).astype(int) - 1 + tail
+
+
+def act_act_icma(
+    beg_dt: ndarray,
+    end_dt: ndarray,
+    freq: int,
+    ref: ndarray = None
+) -> ndarray:
+    """
+    Calculates year fractions using the actual/actual ICMA convention, used for accrued interest on bonds. The \
+    coupon periods are laid out every 12 / freq months from a reference coupon date, and each day is worth \
+    1 / (freq * the number of days in its coupon period).
+
+    :param beg_dt: the beginning dates.
+    :type beg_dt: ndarray
+    :param end_dt: the ending dates.
+    :type end_dt: ndarray
+    :param freq: the coupon frequency, per year.
+    :type freq: int
+    :param ref: a coupon date, or an array of them, such as the maturity date. Defaults to the ending dates.
+    :type ref: ndarray
+    :return: the year fractions.
+    :rtype: ndarray
+    """
+    if 12 % freq != 0:
+        raise ValueError("The coupon frequency must divide 12.")
+
+    end_dt = to_datetime64(end_dt)
+    ref = end_dt if ref is None else to_datetime64(ref)
+
+    return coupon_position(end_dt, ref, freq) - coupon_position(beg_dt, ref, freq)
+
+
+def coupon_position(
+    dates: ndarray,
+    ref: ndarray,
+    freq: int
+) -> ndarray:
+    """
+    Calculates the position of dates on a schedule of coupon periods laid out every 12 / freq months from a \
+    reference date, measured in years, with each coupon period having a length of 1 / freq.
+
+    :param dates: the dates.
+    :type dates: ndarray
+    :param ref: the reference coupon date.
+    :type ref: ndarray
+    :param freq: the coupon frequency, per year.
+    :type freq: int
+    :return: the positions.
+    :rtype: ndarray
+    """
+    dates = to_datetime64(dates)
+    step = 12 // freq
+
+    y, m, _ = ymd(dates)
+    ry, rm, _ = ymd(ref)
+    k = ((y - ry) * 12 + (m - rm)) // step
+
+    # the estimate of the coupon period is off by at most one, depending on the day of the month
+    start = add_months(ref, k * step)
+    k = np.where(start > dates, k - 1, k)
+    start = add_months(ref, k * step)
+    end = add_months(ref, (k + 1) * step)
+
+    return (k + (dates - start).astype(int) / (end - start).astype(int)) / freq
+
+
+def thirty_360(
+    beg_dt: ndarray,
+    end_dt: ndarray
+) -> ndarray:
+    """
+    Calculates year fractions using the 30/360 convention, also known as the bond basis. A day of 31 at the \
+    beginning is changed to 30, and a day of 31 at the end is changed to 30 if the beginning day is 30 or 31.
+
+    :param beg_dt: the beginning dates.
+    :type beg_dt: ndarray
+    :param end_dt: the ending dates.
+    :type end_dt: ndarray
+    :return: the year fractions.
+    :rtype: ndarray
+    """
+    y1, m1, d1 = ymd(beg_dt)
+    y2, m2, d2 = ymd(end_dt)
+
+    d2 = np.where((d2 == 31) & (d1 >= 30), 30, d2)
+    d1 = np.minimum(d1, 30)
+
+    return days_360(y1, m1, d1, y2, m2, d2) / 360
+
+
+def thirty_e_360(
+    beg_dt: ndarray,
+    end_dt: ndarray
+) -> ndarray:
+    """
+    Calculates year fractions using the 30E/360 convention, also known as the Eurobond basis. Days of 31 are \
+    changed to 30.
+
+    :param beg_dt: the beginning dates.
+    :type beg_dt: ndarray
+    :param end_dt: the ending dates.
+    :type end_dt: ndarray
+    :return: the year fractions.
+    :rtype: ndarray
+    """
+    y1, m1, d1 = ymd(beg_dt)
+    y2, m2, d2 = ymd(end_dt)
+
+    return days_360(y1, m1, np.minimum(d1, 30), y2, m2, np.minimum(d2, 30)) / 360
+
+
+def thirty_e_360_isda(
+    beg_dt: ndarray,
+    end_dt: ndarray,
+    maturity: ndarray = None
+) -> ndarray:
+    """
+    Calculates year fractions using the 30E/360 ISDA convention. Days of 31 and the last day of February are \
+    changed to 30, except for an ending date at the end of February that is also the maturity date.
+
+    :param beg_dt: the beginning dates.
+    :type beg_dt: ndarray
+    :param end_dt: the ending dates.
+    :type end_dt: ndarray
+    :param maturity: the maturity date, or an array of them, defaults to None.
+    :type maturity: ndarray
+    :return: the year fractions.
+    :rtype: ndarray
+    """
+    y1, m1, d1 = ymd(beg_dt)
+    y2, m2, d2 = ymd(end_dt)
+
+    d1 = np.where(d1 == days_in_month(y1, m1), 30, d1)
+    d1 = np.minimum(d1, 30)
+
+    end_of_month = d2 == days_in_month(y2, m2)
+    if maturity is not None:
+        end_of_month &= ~((m2 == 2) & (to_datetime64(end_dt) == to_datetime64(maturity)))
+
+    d2 = np.where(end_of_month, 30, d2)
+    d2 = np.minimum(d2, 30)
+
+    return days_360(y1, m1, d1, y2, m2, d2) / 360
+
+
+def days_360(y1, m1, d1, y2, m2, d2) -> ndarray:
+    """
+    Counts the days between two dates assuming 30 day months and 360 day years, after the day adjustments of \
+    the convention have been made.
+
+    :return: the number of days.
+    :rtype: ndarray
+    """
+    return 360 * (y2 - y1) + 30 * (m2 - m1) + (d2 - d1)
+
+
+def actual_days(
+    beg_dt: ndarray,
+    end_dt: ndarray
+) -> ndarray:
+    """
+    Counts the actual number of days between dates.
+
+    :param beg_dt: the beginning dates.
+    :type beg_dt: ndarray
+    :param end_dt: the ending dates.
+    :type end_dt: ndarray
+    :return: the number of days.
+    :rtype: ndarray
+    """
+    return (to_datetime64(end_dt) - to_datetime64(beg_dt)).astype(int)
+
+
+def year_frac(
+    beg_dt: Union[dt.date, dt.datetime, str, Iterable, ndarray],
+    end_dt: Union[dt.date, dt.datetime, str, Iterable, ndarray],
+    convention: str = 'Actual/Actual ISDA',
+    freq: int = None,
+    ref: Union[dt.date, dt.datetime, str, Iterable, ndarray] = None
+) -> Union[float, ndarray]:
+    """
+    Converts pairs of dates into year fractions using a day count convention. The dates can be supplied as \
+    datetime objects, ISO strings, or lists or arrays of them, and the results can be supplied as the times of a \
+    :class:`.Payments` object. The following conventions are supported, along with the aliases listed in \
+    DAY_COUNTS:
+
+    * Actual/Actual ISDA
+    * Actual/Actual ICMA, which requires freq and optionally ref
+    * Actual/360
+    * Actual/365 Fixed
+    * 30/360
+    * 30E/360
+    * 30E/360 ISDA, which optionally uses ref as the maturity date
+
+    :param beg_dt: the beginning date, or an array of them.
+    :type beg_dt: datetime.date, datetime.datetime, str, Iterable, ndarray
+    :param end_dt: the ending date, or an array of them.
+    :type end_dt: datetime.date, datetime.datetime, str, Iterable, ndarray
+    :param convention: the day count convention, defaults to 'Actual/Actual ISDA'.
+    :type convention: str
+    :param freq: the coupon frequency, for Actual/Actual ICMA.
+    :type freq: int
+    :param ref: a coupon date for Actual/Actual ICMA, or the maturity date for 30E/360 ISDA.
+    :type ref: datetime.date, datetime.datetime, str, Iterable, ndarray
+    :return: the year fraction, or an array of them.
+    :rtype: float, ndarray
+    """
+    if convention not in DAY_COUNTS:
+        raise ValueError("Unknown day count convention: " + str(convention))
+
+    convention = DAY_COUNTS[convention]
+
+    beg_dt = to_datetime64(beg_dt)
+    end_dt = to_datetime64(end_dt)
+
+    if convention == 'Actual/Actual ISDA':
+        res = act_act_isda(beg_dt, end_dt)
+    elif convention == 'Actual/Actual ICMA':
+        if freq is None:
+            raise ValueError("Actual/Actual ICMA requires a coupon frequency.")
+        res = act_act_icma(beg_dt, end_dt, freq=freq, ref=ref)
+    elif convention == 'Actual/360':
+        res = act_360(beg_dt, end_dt)
+    elif convention == 'Actual/365 Fixed':
+        res = act_365f(beg_dt, end_dt)
+    elif convention == '30/360':
+        res = thirty_360(beg_dt, end_dt)
+    elif convention == '30E/360':
+        res = thirty_e_360(beg_dt, end_dt)
+    else:
+        res = thirty_e_360_isda(beg_dt, end_dt, maturity=ref)
+
+    res = np.asarray(res, dtype=float)
+
+    if res.ndim == 0:
+        res = float(res)
+
+    return res
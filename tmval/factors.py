@@ -0,0 +1,435 @@
+"""
+Contains functions that calculate annuity factors directly, without declaring an :class:`.Annuity` object. Each \
+function accepts NumPy arrays for its numeric arguments, which are broadcast against each other, so that a table of \
+factors over a grid of terms and interest rates can be calculated in a single call. For example, the payments on a \
+loan of 1 for 40 terms and 500 interest rates are:
+
+.. code-block:: python
+
+   1 / a_angln(n=np.arange(1, 41), i=np.linspace(.01, .1, 500)[:, None])
+
+The interest rates are effective per payment period. The formulas are rearranged so that they remain accurate as \
+the interest rate approaches 0, and, for geometric annuities, as the interest rate approaches the rate of growth of \
+the payments.
+"""
+
+import numpy as np
+
+from numpy import ndarray
+from typing import Callable, Union
+
+from functools import lru_cache
+
+from tmval.constants import COMPOUNDS
+from tmval.growth import Accumulation, CompoundAccumulation, array_func, standardize_acc
+from tmval.rate import Rate
+
+
+def _expm1_ratio(x: ndarray) -> ndarray:
+    """
+    Calculates :math:`(e^x - 1) / x`, which tends to 1 as x tends to 0.
+    """
+    x = np.asarray(x, dtype=float)
+    small = np.abs(x) < 1e-8
+    x_safe = np.where(small, 1.0, x)
+
+    return np.where(small, 1 + x / 2, np.expm1(x_safe) / x_safe)
+
+
+def _log1p_ratio(u: ndarray) -> ndarray:
+    """
+    Calculates :math:`\\ln(1 + u) / u`, which tends to 1 as u tends to 0.
+    """
+    u = np.asarray(u, dtype=float)
+    small = np.abs(u) < 1e-8
+    u_safe = np.where(small, 1.0, u)
+
+    return np.where(small, 1 - u / 2, np.log1p(u_safe) / u_safe)
+
+
+def _timing(
+    i: ndarray,
+    imd: str,
+    deferral: Union[float, ndarray]
+) -> ndarray:
+    """
+    Returns the factor that moves an annuity-immediate to the payment timing and deferral requested.
+    """
+    if imd == 'immediate':
+        shift = - np.asarray(deferral, dtype=float)
+    elif imd == 'due':
+        shift = 1 - np.asarray(deferral, dtype=float)
+    else:
+        raise ValueError("imd can either be immediate or due.")
+
+    return np.exp(shift * np.log1p(i))
+
+
+def _to_float(res: ndarray) -> Union[float, ndarray]:
+    res = np.asarray(res)
+
+    if res.ndim == 0:
+        res = float(res)
+
+    return res
+
+
+def a_angln(
+    n: Union[float, ndarray],
+    i: Union[float, ndarray],
+    g: Union[float, ndarray] = 0.0,
+    imd: str = 'immediate',
+    deferral: Union[float, ndarray] = 0.0
+) -> Union[float, ndarray]:
+    """
+    Calculates the present value of an annuity of n payments, the first of which is 1 and each subsequent one \
+    growing by g. With the default g of 0, this is :math:`\\ax{\\angln i}`, or :math:`\\ax**{\\angln i}` for an \
+    annuity-due. The formula is evaluated as:
+
+    .. math::
+
+       \\frac{1 - \\left(\\frac{1 + g}{1 + i}\\right)^n}{i - g} = \\frac{n}{1 + i} \\cdot \\frac{e^{n\\lambda} - 1}\
+       {n\\lambda} \\cdot \\frac{\\ln(1 + u)}{u}
+
+    where :math:`u = (g - i) / (1 + i)` and :math:`\\lambda = \\ln(1 + u)`, so that it tends smoothly to \
+    :math:`n / (1 + i)` as i tends to g.
+
+    :param n: the number of payments.
+    :type n: float, ndarray
+    :param i: the effective interest rate per payment period.
+    :type i: float, ndarray
+    :param g: the geometric rate of growth of the payments, defaults to 0.
+    :type g: float, ndarray
+    :param imd: 'immediate' or 'due', defaults to 'immediate'.
+    :type imd: str
+    :param deferral: the number of payment periods by which the annuity is deferred, defaults to 0.
+    :type deferral: float, ndarray
+    :return: the annuity factor, or an array of them.
+    :rtype: float, ndarray
+    """
+    n = np.asarray(n, dtype=float)
+    i = np.asarray(i, dtype=float)
+    g = np.asarray(g, dtype=float)
+
+    u = (g - i) / (1 + i)
+    lam = np.log1p(u)
+
+    res = n / (1 + i) * _expm1_ratio(n * lam) * _log1p_ratio(u) * _timing(i, imd, deferral)
+
+    return _to_float(res)
+
+
+def s_angln(
+    n: Union[float, ndarray],
+    i: Union[float, ndarray],
+    g: Union[float, ndarray] = 0.0,
+    imd: str = 'immediate'
+) -> Union[float, ndarray]:
+    """
+    Calculates the accumulated value, at the end of the term, of an annuity of n payments, the first of which is 1 \
+    and each subsequent one growing by g. With the default g of 0, this is :math:`\\sx{\\angln i}`, or \
+    :math:`\\sx**{\\angln i}` for an annuity-due.
+
+    :param n: the number of payments.
+    :type n: float, ndarray
+    :param i: the effective interest rate per payment period.
+    :type i: float, ndarray
+    :param g: the geometric rate of growth of the payments, defaults to 0.
+    :type g: float, ndarray
+    :param imd: 'immediate' or 'due', defaults to 'immediate'.
+    :type imd: str
+    :return: the annuity factor, or an array of them.
+    :rtype: float, ndarray
+    """
+    n = np.asarray(n, dtype=float)
+    i = np.asarray(i, dtype=float)
+
+    res = np.asarray(a_angln(n=n, i=i, g=g, imd=imd)) * np.exp(n * np.log1p(i))
+
+    return _to_float(res)
+
+
+def ia_angln(
+    n: Union[float, ndarray],
+    i: Union[float, ndarray],
+    p: Union[float, ndarray] = 1.0,
+    q: Union[float, ndarray] = 1.0,
+    imd: str = 'immediate',
+    deferral: Union[float, ndarray] = 0.0
+) -> Union[float, ndarray]:
+    """
+    Calculates the present value of an annuity of n payments of P, P + Q, P + 2Q, and so on. With the defaults of \
+    P = Q = 1, this is :math:`(Ia)_{\\angln i}`. The increasing part is the sum of :math:`k v^k`, which is \
+    calculated as :math:`(\\ax**{\\angln i} - n v^n) / i`, except where :math:`n \\delta` is small enough for that \
+    difference to lose precision, in which case a Taylor expansion in the force of interest :math:`\\delta` is used.
+
+    :param n: the number of payments.
+    :type n: float, ndarray
+    :param i: the effective interest rate per payment period.
+    :type i: float, ndarray
+    :param p: the first payment, defaults to 1.
+    :type p: float, ndarray
+    :param q: the amount by which each payment increases, defaults to 1.
+    :type q: float, ndarray
+    :param imd: 'immediate' or 'due', defaults to 'immediate'.
+    :type imd: str
+    :param deferral: the number of payment periods by which the annuity is deferred, defaults to 0.
+    :type deferral: float, ndarray
+    :return: the annuity factor, or an array of them.
+    :rtype: float, ndarray
+    """
+    n = np.asarray(n, dtype=float)
+    i = np.asarray(i, dtype=float)
+    delta = np.log1p(i)
+
+    a_n = np.asarray(a_angln(n=n, i=i))
+    small = np.abs(n * delta) < 1e-4
+    i_safe = np.where(small, 1.0, i)
+    direct = (a_n * (1 + i) - n * np.exp(- n * delta)) / i_safe
+
+    s1 = n * (n + 1) / 2
+    s2 = n * (n + 1) * (2 * n + 1) / 6
+    s3 = s1 ** 2
+    s4 = n * (n + 1) * (2 * n + 1) * (3 * n ** 2 + 3 * n - 1) / 30
+    series = s1 - delta * s2 + delta ** 2 / 2 * s3 - delta ** 3 / 6 * s4
+
+    # P, P + Q, P + 2Q, ... is a level annuity of P - Q plus an increasing annuity of Q, 2Q, 3Q, ...
+    ia_n = np.where(small, series, direct)
+    res = ((p - q) * a_n + q * ia_n) * _timing(i, imd, deferral)
+
+    return _to_float(res)
+
+
+def is_angln(
+    n: Union[float, ndarray],
+    i: Union[float, ndarray],
+    p: Union[float, ndarray] = 1.0,
+    q: Union[float, ndarray] = 1.0,
+    imd: str = 'immediate'
+) -> Union[float, ndarray]:
+    """
+    Calculates the accumulated value, at the end of the term, of an annuity of n payments of P, P + Q, P + 2Q, and \
+    so on. With the defaults of P = Q = 1, this is :math:`(Is)_{\\angln i}`.
+
+    :param n: the number of payments.
+    :type n: float, ndarray
+    :param i: the effective interest rate per payment period.
+    :type i: float, ndarray
+    :param p: the first payment, defaults to 1.
+    :type p: float, ndarray
+    :param q: the amount by which each payment increases, defaults to 1.
+    :type q: float, ndarray
+    :param imd: 'immediate' or 'due', defaults to 'immediate'.
+    :type imd: str
+    :return: the annuity factor, or an array of them.
+    :rtype: float, ndarray
+    """
+    n = np.asarray(n, dtype=float)
+    i = np.asarray(i, dtype=float)
+
+    res = np.asarray(ia_angln(n=n, i=i, p=p, q=q, imd=imd)) * np.exp(n * np.log1p(i))
+
+    return _to_float(res)
+
+
+def abar_angln(
+    n: Union[float, ndarray],
+    delta: Union[float, ndarray]
+) -> Union[float, ndarray]:
+    """
+    Calculates the present value of an annuity paying continuously at a rate of 1 per period for n periods, \
+    :math:`\\bar{a}_{\\angln}`, given the force of interest per period.
+
+    :param n: the term, in periods.
+    :type n: float, ndarray
+    :param delta: the force of interest per period.
+    :type delta: float, ndarray
+    :return: the annuity factor, or an array of them.
+    :rtype: float, ndarray
+    """
+    n = np.asarray(n, dtype=float)
+    delta = np.asarray(delta, dtype=float)
+
+    return _to_float(n * _expm1_ratio(- n * delta))
+
+
+def sbar_angln(
+    n: Union[float, ndarray],
+    delta: Union[float, ndarray]
+) -> Union[float, ndarray]:
+    """
+    Calculates the accumulated value of an annuity paying continuously at a rate of 1 per period for n periods, \
+    :math:`\\bar{s}_{\\angln}`, given the force of interest per period.
+
+    :param n: the term, in periods.
+    :type n: float, ndarray
+    :param delta: the force of interest per period.
+    :type delta: float, ndarray
+    :return: the annuity factor, or an array of them.
+    :rtype: float, ndarray
+    """
+    n = np.asarray(n, dtype=float)
+    delta = np.asarray(delta, dtype=float)
+
+    return _to_float(n * _expm1_ratio(n * delta))
+
+
+def ibar_abar_angln(
+    n: Union[float, ndarray],
+    delta: Union[float, ndarray]
+) -> Union[float, ndarray]:
+    """
+    Calculates the present value of an annuity paying continuously at a rate of t at time t, for n periods, \
+    :math:`(\\bar{I}\\bar{a})_{\\angln}`, given the force of interest per period. A Taylor expansion is used when \
+    :math:`n \\delta` is small.
+
+    :param n: the term, in periods.
+    :type n: float, ndarray
+    :param delta: the force of interest per period.
+    :type delta: float, ndarray
+    :return: the annuity factor, or an array of them.
+    :rtype: float, ndarray
+    """
+    n = np.asarray(n, dtype=float)
+    delta = np.asarray(delta, dtype=float)
+
+    small = np.abs(n * delta) < 1e-4
+    delta_safe = np.where(small, 1.0, delta)
+    direct = (n * _expm1_ratio(- n * delta_safe) - n * np.exp(- n * delta_safe)) / delta_safe
+    series = n ** 2 / 2 - delta * n ** 3 / 3 + delta ** 2 * n ** 4 / 8 - delta ** 3 * n ** 5 / 30
+
+    return _to_float(np.where(small, series, direct))
+
+
+@lru_cache(maxsize=None)
+def _gl_nodes(order: int) -> tuple:
+    """
+    Returns the Gauss-Legendre nodes and weights of an order on [-1, 1], which are calculated once and reused.
+    """
+    return np.polynomial.legendre.leggauss(order)
+
+
+def _gl_panels(
+    f: Callable,
+    term: ndarray,
+    n_panels: int,
+    order: int
+) -> ndarray:
+    """
+    Integrates f from 0 to each term, splitting each interval into n_panels panels of equal width. All of the nodes \
+    are passed to f in a single call.
+    """
+    x, w = _gl_nodes(order)
+    half = term[..., None, None] / n_panels / 2
+    mids = (2 * np.arange(n_panels)[:, None] + 1) * half
+    nodes = mids + half * x
+
+    return (f(nodes) * w * half).sum(axis=(-1, -2))
+
+
+def continuous_pv(
+    amount: Union[Callable, list],
+    term: Union[float, ndarray],
+    gr: Union[Accumulation, Callable, float, Rate] = None,
+    n_panels: int = 16,
+    order: int = 8
+) -> dict:
+    """
+    Calculates the present value of an annuity paying continuously at a rate given by a function of time, from 0 to \
+    the term:
+
+    .. math::
+
+       \\int_0^n \\rho(t) v(t) dt
+
+    The integral is calculated with Gauss-Legendre quadrature on panels of equal width. The rate of payment and the \
+    discount function are each evaluated once, on an array of all the nodes, so they should accept NumPy arrays; \
+    functions that do not are vectorized automatically. The integral is also calculated with half as many panels, \
+    and the difference between the two is returned as an estimate of the error.
+
+    An array of terms, or a list of payment functions, can be supplied to value a batch of annuities at once.
+
+    :param amount: the rate of payment, a function of t, or a list of them.
+    :type amount: Callable, list
+    :param term: the term of the annuity, or an array of terms.
+    :type term: float, ndarray
+    :param gr: a growth rate object used to discount the payments, defaults to None, in which case the payments \
+    are not discounted.
+    :type gr: Accumulation, Callable, float, Rate
+    :param n_panels: the number of panels, defaults to 16.
+    :type n_panels: int
+    :param order: the number of Gauss-Legendre nodes per panel, defaults to 8.
+    :type order: int
+    :return: a dictionary with the present value and the error estimate, each a float, or an array with one row \
+    per payment function and one column per term.
+    :rtype: dict
+    """
+    term = np.asarray(term, dtype=float)
+    funcs = [array_func(f) for f in amount] if isinstance(amount, list) else [array_func(amount)]
+
+    if gr is None:
+        def disc(t):
+            return 1.0
+    else:
+        if not isinstance(gr, Accumulation):
+            gr = standardize_acc(gr) if isinstance(gr, (float, Rate)) else Accumulation(gr)
+        disc = array_func(gr.discount_func)
+
+    pv = []
+    error = []
+
+    for f in funcs:
+        def integrand(t):
+            return np.asarray(f(t.ravel()) * disc(t.ravel()), dtype=float).reshape(t.shape)
+
+        fine = _gl_panels(integrand, term, n_panels, order)
+        coarse = _gl_panels(integrand, term, max(n_panels // 2, 1), order)
+        pv.append(fine)
+        error.append(np.abs(fine - coarse))
+
+    pv = np.array(pv)
+    error = np.array(error)
+
+    if not isinstance(amount, list):
+        pv = pv[0]
+        error = error[0]
+
+    res = {
+        'pv': _to_float(pv),
+        'error': _to_float(error)
+    }
+
+    return res
+
+
+def get_period_rate(
+    gr: Union[Accumulation, Callable, float, Rate, list, ndarray],
+    period: Union[float, ndarray]
+) -> Union[float, ndarray, None]:
+    """
+    Returns the effective interest rate per payment period implied by a growth rate object, so that it can be \
+    passed to the annuity factor functions. The annuity factors assume compound interest, so None is returned if \
+    the growth rate object is not compound. An array of floats is read as an array of annual effective interest \
+    rates, and may be combined with an array of payment periods.
+
+    :param gr: a growth rate object, or an array of annual effective interest rates.
+    :type gr: Accumulation, Callable, float, Rate, list, ndarray
+    :param period: the payment period, or an array of them.
+    :type period: float, ndarray
+    :return: the effective interest rate per payment period, an array of them, or None.
+    :rtype: float, ndarray, None
+    """
+    if isinstance(gr, (list, ndarray)):
+        res = np.expm1(np.asarray(period, dtype=float) * np.log1p(np.asarray(gr, dtype=float)))
+        return _to_float(res)
+
+    if isinstance(gr, (float, int)) or (isinstance(gr, Rate) and gr.formal_pattern in COMPOUNDS):
+        gr = CompoundAccumulation(gr)
+
+    if isinstance(gr, CompoundAccumulation):
+        return _to_float(np.expm1(gr.log_rate * np.asarray(period, dtype=float)))
+
+    if isinstance(gr, Accumulation) and gr.is_compound:
+        return gr.val(period) - 1
+
+    return None
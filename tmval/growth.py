@@ -6,16 +6,18 @@ from __future__ import annotations
 
 import datetime as dt
 import numpy as np
+import warnings
 
-from dateutil.relativedelta import relativedelta
+from collections import OrderedDict
 from inspect import signature
 from numpy import ndarray
-from scipy.integrate import quad
+from scipy.interpolate import CubicHermiteSpline, PchipInterpolator
 from scipy.misc import derivative
-from scipy.optimize import newton
+from scipy.optimize import brentq
 from typing import Callable, Iterable, Tuple, Union
 
 from tmval.constants import COMPOUNDS, SIMPLES
+from tmval.daycount import act_act_isda
 from tmval.rate import Rate, standardize_rate
 
 
@@ -270,27 +272,35 @@ class Amount:
         accumulation = Accumulation(gr=acc_func)
         return accumulation
 
-    def solve_t(self, fv, pv=None, x0=range(100), precision=5):
+    def solve_t(
+        self,
+        fv: Union[float, ndarray],
+        pv: Union[float, ndarray] = None
+    ) -> Union[float, ndarray]:
+        """
+        Solves for the time it takes for the amount function to grow from pv to fv. If pv is not provided, the time \
+        is measured from time 0. Compound interest is solved in closed form, while other growth patterns are solved \
+        with :func:`.t_solver`. Arrays of values are solved all at once.
+
+        :param fv: the future value, or an array of them.
+        :type fv: float, ndarray
+        :param pv: the present value, or an array of them, defaults to None.
+        :type pv: float, ndarray
+        :return: the time, or an array of times.
+        :rtype: float, ndarray
+        """
+
+        if isinstance(self.gr, (float, Rate)) and self.is_compound:
+            if pv is None:
+                pv = self.k
+            return np.log(np.asarray(fv) / pv) / np.log(1 + self.interest_rate.rate)
 
         if pv is None:
             t0 = 0
         else:
-            def f0(t):
-                return pv - self.val(t)
-            rs = newton(f0, x0=x0)
-            if isinstance(rs, Iterable):
-                t0 = list(set([round(x, precision) for x in rs]))[0]
-            else:
-                t0 = rs
-
-        def f1(t):
-            return fv - self.val(t)
+            t0 = t_solver(f=self.val, target=pv)
 
-        rs = newton(f1, x0=x0)
-        if isinstance(rs, Iterable):
-            t1 = list(set([round(x, precision) for x in rs]))[0]
-        else:
-            t1 = rs
+        t1 = t_solver(f=self.val, target=fv)
 
         return t1 - t0
 
@@ -420,26 +430,285 @@ class Accumulation(Amount):
 
         return delta_t
 
-    def solve_t(self, pv, fv, x0=10):
+    def solve_t(
+        self,
+        pv: Union[float, ndarray],
+        fv: Union[float, ndarray]
+    ) -> Union[float, ndarray]:
+        """
+        Solves for the time it takes for an investment of pv to grow to fv. Compound interest is solved in closed \
+        form, while other growth patterns are solved with :func:`.t_solver`. Arrays of values are solved all at once.
+
+        :param pv: the present value, or an array of them.
+        :type pv: float, ndarray
+        :param fv: the future value, or an array of them.
+        :type fv: float, ndarray
+        :return: the time, or an array of times.
+        :rtype: float, ndarray
+        """
 
-        def f(t0):
-            return self.val(t0) - fv / pv
+        ratio = np.asarray(fv) / np.asarray(pv)
 
-        roots = newton(func=f, x0=x0)
-        if isinstance(roots, ndarray):
-            pass
-        else:
-            roots = np.array(roots)
-        reals = roots[np.isreal(roots)]
-        res = round(reals[0])
+        if isinstance(self.gr, (float, int, Rate)) and self.is_compound:
+            return np.log(ratio) / np.log(1 + self.interest_rate.rate)
 
-        return res
+        return t_solver(f=self.val, target=ratio)
 
     def dval(self, k, t1, t2):
         k0 = self.discount_func(t=t1, fv=k)
         return k0 * self.val(t2)
 
 
+class CompoundAccumulation(Accumulation):
+    """
+    A specialized :class:`Accumulation` for compound interest, returned by :func:`.standardize_acc` for floats and \
+    compound Rate objects. The force of interest :math:`\\ln(1 + i)` is calculated once when the object is \
+    declared, so that the accumulation and discount functions reduce to a single exponential, which also accepts \
+    NumPy arrays. The checks that the parent class performs on arbitrary growth functions are skipped, since the \
+    growth pattern is known to be compound and level.
+
+    :param gr: the interest rate, either a float representing an annual effective interest rate or a compound \
+    Rate object.
+    :type gr: float, Rate
+    :return: a compound accumulation object.
+    :rtype: CompoundAccumulation
+    """
+    def __init__(
+        self,
+        gr: Union[float, int, Rate]
+    ):
+        if isinstance(gr, Rate) and gr.formal_pattern not in COMPOUNDS:
+            raise TypeError("CompoundAccumulation requires a compound interest rate.")
+
+        self.gr = gr
+        self.k = 1
+        self.interest_rate = standardize_rate(gr)
+        self.log_rate = float(np.log1p(self.interest_rate.rate))
+        self.func = self.val
+        self.is_compound = True
+        self.is_level = True
+
+    def val(self, t: Union[float, ndarray]) -> Union[float, ndarray]:
+        """
+        Calculates the value of 1 invested at time 0, at time t.
+
+        :param t: the valuation time, or an array of valuation times.
+        :type t: float, ndarray
+        :return: the accumulated value, or an array of them.
+        :rtype: float, ndarray
+        """
+        res = np.exp(self.log_rate * np.asarray(t, dtype=float))
+
+        if res.ndim == 0:
+            res = float(res)
+
+        return res
+
+    def discount_func(
+        self,
+        t: Union[float, ndarray],
+        fv: Union[float, ndarray] = None
+    ) -> Union[float, ndarray]:
+        """
+        Returns the discount factor at time t, multiplied by fv if it is provided.
+
+        :param t: the time, or an array of times.
+        :type t: float, ndarray
+        :param fv: the future value, assumed to be 1 if not provided.
+        :type fv: float, ndarray, optional
+        :return: the discount factor, or the present value of fv, or an array of them.
+        :rtype: float, ndarray
+        """
+        if fv is None:
+            fv = 1
+
+        res = np.asarray(fv, dtype=float) * np.exp(-self.log_rate * np.asarray(t, dtype=float))
+
+        if res.ndim == 0:
+            res = float(res)
+
+        return res
+
+    def effective_interval(
+        self,
+        t2: float,
+        t1: float = 0,
+        annualized: bool = False
+    ) -> Rate:
+        """
+        Calculates the effective interest rate over a time period.
+
+        :param t2: the end of the period.
+        :type t2: float
+        :param t1: the beginning of the period, defaults to 0.
+        :type t1: float
+        :param annualized: whether you want the results to be annualized, defaults to False.
+        :type annualized: bool
+        :return: the effective interest rate over the time period.
+        :rtype: Rate
+        """
+        interval = t2 - t1
+
+        if annualized:
+            return Rate(rate=self.interest_rate.rate, pattern="Effective Interest", interval=1)
+
+        return Rate(rate=float(np.expm1(self.log_rate * interval)), pattern="Effective Interest", interval=interval)
+
+    def solve_t(
+        self,
+        pv: Union[float, ndarray],
+        fv: Union[float, ndarray]
+    ) -> Union[float, ndarray]:
+        """
+        Solves for the time it takes for an investment of pv to grow to fv, in closed form.
+
+        :param pv: the present value, or an array of them.
+        :type pv: float, ndarray
+        :param fv: the future value, or an array of them.
+        :type fv: float, ndarray
+        :return: the time, or an array of times.
+        :rtype: float, ndarray
+        """
+        res = np.log(np.asarray(fv, dtype=float) / np.asarray(pv, dtype=float)) / self.log_rate
+
+        if res.ndim == 0:
+            res = float(res)
+
+        return res
+
+
+class InterpolatedAccumulation(Accumulation):
+    """
+    An accumulation function built from a table of points, such as a discount curve observed in the market. Supply \
+    either the accumulated values or the discount factors at a set of times. The points are stored as sorted NumPy \
+    arrays, and the log of the accumulation function is interpolated between them, either linearly, which \
+    corresponds to flat forward rates between the points, or with a monotone cubic (PCHIP) spline. Beyond the last \
+    point, the last forward rate continues to apply.
+
+    If time 0 is not among the points, the point (0, 1) is added.
+
+    :param times: the times of the points.
+    :type times: list, ndarray
+    :param values: the accumulated values at the times, defaults to None.
+    :type values: list, ndarray
+    :param discount_factors: the discount factors at the times, defaults to None.
+    :type discount_factors: list, ndarray
+    :param method: the interpolation method, either 'flat_forward' or 'pchip', defaults to 'flat_forward'.
+    :type method: str
+    :return: an accumulation object.
+    :rtype: InterpolatedAccumulation
+    """
+    def __init__(
+        self,
+        times: Union[list, ndarray],
+        values: Union[list, ndarray] = None,
+        discount_factors: Union[list, ndarray] = None,
+        method: str = 'flat_forward'
+    ):
+        if (values is None) == (discount_factors is None):
+            raise ValueError("Supply either values or discount_factors, but not both.")
+
+        times = np.asarray(times, dtype=float)
+
+        if values is not None:
+            log_acc = np.log(np.asarray(values, dtype=float))
+        else:
+            log_acc = - np.log(np.asarray(discount_factors, dtype=float))
+
+        order = np.argsort(times)
+        times = times[order]
+        log_acc = log_acc[order]
+
+        if 0 not in times:
+            idx = np.searchsorted(times, 0)
+            times = np.insert(times, idx, 0.0)
+            log_acc = np.insert(log_acc, idx, 0.0)
+
+        if len(times) < 2:
+            raise ValueError("At least one point other than time 0 is needed.")
+
+        if method not in ('flat_forward', 'pchip'):
+            raise ValueError("method must be either 'flat_forward' or 'pchip'.")
+
+        self.times = times
+        self.log_acc = log_acc
+        self.method = method
+
+        if method == 'pchip':
+            self.spline = PchipInterpolator(times, log_acc, extrapolate=False)
+            end_slope = self.spline.derivative()(times[[0, -1]])
+        else:
+            self.spline = None
+            end_slope = np.diff(log_acc)[[0, -1]] / np.diff(times)[[0, -1]]
+
+        # the forward rates used to extrapolate before the first point and after the last point
+        self.end_slope = end_slope
+
+        # the table is neither assumed to be compound nor level, so the probes of the parent class are skipped
+        self.k = 1
+        self.func = self.val
+        self.gr = self.func
+        self.is_compound = False
+        self.is_level = False
+
+    def val(self, t: Union[float, ndarray]) -> Union[float, ndarray]:
+        """
+        Calculates the value of 1 invested at time 0, at time t.
+
+        :param t: the valuation time, or an array of valuation times.
+        :type t: float, ndarray
+        :return: the accumulated value, or an array of them.
+        :rtype: float, ndarray
+        """
+        t_arr = np.asarray(t, dtype=float)
+        lo = self.times[0]
+        hi = self.times[-1]
+        tc = np.clip(t_arr, lo, hi)
+
+        if self.method == 'pchip':
+            inner = self.spline(tc)
+        else:
+            inner = np.interp(tc, self.times, self.log_acc)
+
+        log_acc = inner + np.where(
+            t_arr > hi,
+            (t_arr - hi) * self.end_slope[1],
+            np.where(t_arr < lo, (t_arr - lo) * self.end_slope[0], 0.0)
+        )
+
+        res = np.exp(log_acc)
+
+        if res.ndim == 0:
+            res = float(res)
+
+        return res
+
+    def forward_rate(
+        self,
+        t1: Union[float, ndarray],
+        t2: Union[float, ndarray]
+    ) -> Union[float, ndarray]:
+        """
+        Calculates the annualized effective forward rates between t1 and t2.
+
+        :param t1: the beginning of the period, or an array of them.
+        :type t1: float, ndarray
+        :param t2: the end of the period, or an array of them.
+        :type t2: float, ndarray
+        :return: the forward rate, or an array of them.
+        :rtype: float, ndarray
+        """
+        t1 = np.asarray(t1, dtype=float)
+        t2 = np.asarray(t2, dtype=float)
+
+        res = np.asarray((self.val(t2) / self.val(t1)) ** (1 / (t2 - t1)) - 1)
+
+        if res.ndim == 0:
+            res = float(res)
+
+        return res
+
+
 def simple_solver(
     pv: float = None,
     fv: float = None,
@@ -543,21 +812,26 @@ def actual_actual(
         beg_dt: dt.datetime,
         end_dt: dt.datetime,
         frac=True
-):
+) -> float:
+    """
+    Calculate the number of days using the actual/actual rule. Set frac=True to return days as a percentage of year, \
+    using the actual/actual ISDA convention. See :func:`.act_act_isda`, which also accepts arrays of dates.
+
+    :param beg_dt: the beginning date
+    :type beg_dt: datetime.datetime
+    :param end_dt: the ending date
+    :type end_dt: datetime.datetime
+    :param frac: whether you want the answer in number of days or fraction of a year, defaults to True
+    :type frac: bool, optional
+    :return: the number of days or percent of a year between two dates using the actual/actual rule, \
+    depending on frac
+    :rtype: float
+    """
 
     if not frac:
         return (end_dt - beg_dt).days
     else:
-        years = relativedelta(end_dt, beg_dt).years
-
-        intermediate = dt.datetime(beg_dt.year + 1, end_dt.month, end_dt.day)
-
-        days = (intermediate - beg_dt).days
-
-
-        t = years + days / 365
-
-        return t
+        return float(act_act_isda(beg_dt, end_dt))
 
 
 def bankers_rule(
@@ -659,31 +933,78 @@ class TieredBal:
     def __init__(
         self,
         tiers: list,
-        rates: list
+        rates: list,
+        cache_size: int = 1024
     ):
         self.tiers = tiers
         self.rates = rates
+        self.cache_size = cache_size
+        self.jump_cache = OrderedDict()
+
+        # Each tier is compound, so the time needed to grow from one balance to another is additive across tiers.
+        # Measuring balances on a common time axis g, with g = 0 at the first jump balance, the balance can be grown by
+        # a time t by moving from g to g + t. The anchors are the balances at which the tiers start on this axis.
+        self.tier_arr = np.asarray(tiers, dtype=float)
+        self.log_rates = np.log1p(np.asarray(rates, dtype=float))
+
+        if len(self.tier_arr) > 1:
+            self.anchors = np.concatenate([self.tier_arr[1:2], self.tier_arr[1:]])
+            widths = np.log(self.tier_arr[2:] / self.tier_arr[1:-1]) / self.log_rates[1:-1]
+            self.tier_g = np.concatenate([[0.0, 0.0], np.cumsum(widths)])
+        else:
+            self.anchors = np.ones(1)
+            self.tier_g = np.zeros(1)
 
     def __call__(
         self,
-        k: float,
-        t: float
-    ) -> float:
-        jump_times = self.get_jump_times(k=k)
+        k: Union[float, ndarray],
+        t: Union[float, ndarray]
+    ) -> Union[float, ndarray]:
+
+        res = self.from_g(self.to_g(k) + np.asarray(t, dtype=float))
 
-        # find applicable tiers
-        jump_times.insert(0, 0)
-        jump_rates = self.rates[-len(jump_times):]
-        jump_tiers = self.tiers[-len(jump_times):]
+        if res.ndim == 0:
+            res = float(res)
 
-        # construct amount function and calculate balance
-        index = len([i for i in jump_times if i <= t]) - 1
-        lower_t = jump_times[index]
-        base_amt = max(jump_tiers[index], k)
-        rate = jump_rates[index]
-        time = t - lower_t
+        return res
 
-        bal = base_amt * ((1 + rate) ** time)
+    def to_g(
+        self,
+        k: Union[float, ndarray]
+    ) -> ndarray:
+        """
+        Maps balances to the time axis on which the tiers are laid out, so that growing a balance by a time t \
+        amounts to adding t.
+
+        :param k: The balance, or an array of balances.
+        :type k: float, ndarray
+        :return: The position of the balances on the time axis.
+        :rtype: ndarray
+        """
+        k = np.asarray(k, dtype=float)
+        idx = np.maximum(np.searchsorted(self.tier_arr, k, side='right') - 1, 0)
+
+        with np.errstate(divide='ignore'):
+            g = self.tier_g[idx] + np.log(k / self.anchors[idx]) / self.log_rates[idx]
+
+        return g
+
+    def from_g(
+        self,
+        g: ndarray
+    ) -> ndarray:
+        """
+        Maps positions on the time axis on which the tiers are laid out back to balances. This is the inverse of \
+        :meth:`to_g`.
+
+        :param g: The position on the time axis.
+        :type g: ndarray
+        :return: The balances.
+        :rtype: ndarray
+        """
+        idx = np.maximum(np.searchsorted(self.tier_g, g, side='right') - 1, 0)
+
+        bal = self.anchors[idx] * np.exp((g - self.tier_g[idx]) * self.log_rates[idx])
 
         return bal
 
@@ -693,32 +1014,54 @@ class TieredBal:
     ) -> list:
         """
         Calculates the times at which the interest rate is expected to change for the account, assuming \
-        an initial investment of k and no further investments.
+        an initial investment of k and no further investments. The results are cached by principal.
 
         :param k: the principal, or initial investment.
         :type k: float
         :return: a list of times at which the interest rate is expected to change for the account.
         :rtype: list
         """
-        # determine jump balances and rates
-        jump_balances = [i for i in self.tiers if i > k]
-        if len(jump_balances) == 0:
-            jump_rates = []
+        if k in self.jump_cache:
+            self.jump_cache.move_to_end(k)
         else:
-            jump_rates = self.rates[:len(self.rates) - 1]
-            jump_rates = jump_rates[-len(jump_balances):]
+            jump_g = self.tier_g[1:][self.tier_arr[1:] > k]
+            self.jump_cache[k] = (jump_g - self.to_g(k)).tolist()
 
-        # determine jump times
-        jump_times = []
-        pv = k
-        t_base = 0
-        for fv, i in zip(jump_balances, jump_rates):
-            jump_increment = compound_solver(pv=pv, fv=fv, gr=Rate(i))
-            jump_times.append(t_base + jump_increment)
-            t_base = t_base + jump_increment
-            pv = fv
+            if len(self.jump_cache) > self.cache_size:
+                self.jump_cache.popitem(last=False)
 
-        return jump_times
+        return self.jump_cache[k].copy()
+
+    def trajectory(
+        self,
+        amounts: Union[list, ndarray],
+        times: Union[list, ndarray]
+    ) -> ndarray:
+        """
+        Calculates the balances of a set of accounts that receive a stream of deposits. Each row of amounts \
+        represents an account, and each column the deposits made at the corresponding time. A one-dimensional \
+        amounts is treated as a single account. The balances are evaluated just after each deposit, and the \
+        accounts are all rolled forward at once.
+
+        :param amounts: The deposits, of shape (accounts, times) or (times,).
+        :type amounts: list, ndarray
+        :param times: The deposit times.
+        :type times: list, ndarray
+        :return: The balances just after each deposit, of the same shape as amounts.
+        :rtype: ndarray
+        """
+        amounts = np.asarray(amounts, dtype=float)
+        times = np.asarray(times, dtype=float)
+
+        bals = np.empty(amounts.shape)
+        bal = amounts[..., 0]
+        bals[..., 0] = bal
+
+        for i, interval in enumerate(np.diff(times), start=1):
+            bal = self.from_g(self.to_g(bal) + interval) + amounts[..., i]
+            bals[..., i] = bal
+
+        return bals
 
 
 class TieredTime:
@@ -759,28 +1102,86 @@ class TieredTime:
 
         self.rates = rates_std
 
+        # standardize once, and store the log growth of each tier, so that evaluation only needs a lookup and an exp
+        self.std_rates = [standardize_rate(gr=x) for x in self.rates]
+        self.tier_arr = np.asarray(tiers, dtype=float)
+        self.log_rates = np.array([
+            np.log1p(x.rate) if x.formal_pattern in COMPOUNDS else x.rate for x in self.std_rates
+        ])
+        self.patterns = np.array([x.formal_pattern for x in self.std_rates])
+
+        # cumulative log growth at the start of each tier
+        full = self.log_growth(idx=np.arange(len(self.tier_arr) - 1), t=np.diff(self.tier_arr))
+        self.cum_log = np.concatenate([[0.0], np.cumsum(full)])
+
     def __call__(
             self,
             k: float,
-            t: float
-    ) -> float:
-        # find the cumulative tiers that apply at time t
-        jump_times = self.tiers
-        jump_times = [i for i in jump_times if i < t]
+            t: Union[float, ndarray]
+    ) -> Union[float, ndarray]:
 
-        rates = self.rates[:len(jump_times)]
-        times = jump_times[:len(jump_times)]
-        times.append(t)
-        times = np.diff(times)
+        return k * self.val(t=t)
 
-        # for each tier that applies, calculate the cumulative balance
-        bal = k
-        for rate, time in zip(rates, times):
+    def val(
+            self,
+            t: Union[float, ndarray]
+    ) -> Union[float, ndarray]:
+        """
+        Calculates the value of 1 invested at time 0, at time t. The applicable tier is found with a binary search, \
+        and the growth is the cumulative growth to the start of that tier, times the growth within it.
 
-            rate = standardize_rate(gr=rate)
-            bal = bal * rate.amt_func(k=1, t=time)
+        :param t: The valuation time, or an array of valuation times.
+        :type t: float, ndarray
+        :return: The accumulated value, or an array of them.
+        :rtype: float, ndarray
+        """
 
-        return bal
+        t_arr = np.asarray(t, dtype=float)
+
+        # the tiers that apply at time t are those that start before t
+        idx = np.searchsorted(self.tier_arr, t_arr, side='left') - 1
+        started = idx >= 0
+        idx = np.maximum(idx, 0)
+
+        log_val = self.cum_log[idx] + self.log_growth(idx=idx, t=t_arr - self.tier_arr[idx])
+        res = np.where(started, np.exp(log_val), 1.0)
+
+        if res.ndim == 0:
+            res = float(res)
+
+        return res
+
+    def log_growth(
+            self,
+            idx: ndarray,
+            t: ndarray
+    ) -> ndarray:
+        """
+        Calculates the log of the growth within tiers, for a time t elapsed since the start of each tier.
+
+        :param idx: The tier indices.
+        :type idx: ndarray
+        :param t: The time elapsed since the start of each tier.
+        :type t: ndarray
+        :return: The log growth.
+        :rtype: ndarray
+        """
+
+        lr = self.log_rates[idx]
+        pattern = self.patterns[idx]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            res = np.where(
+                pattern == 'Simple Interest',
+                np.log1p(lr * t),
+                np.where(
+                    pattern == 'Simple Discount',
+                    - np.log1p(- lr * t),
+                    lr * t
+                )
+            )
+
+        return res
 
 
 def k_solver(
@@ -805,6 +1206,144 @@ def k_solver(
     return res
 
 
+def array_func(f: Callable) -> Callable:
+    """
+    Returns a version of a function of t that accepts NumPy arrays. If the function already works elementwise on \
+    arrays, it is returned as is, otherwise it is wrapped with np.vectorize.
+
+    :param f: a function of t.
+    :type f: Callable
+    :return: a function of t that accepts arrays.
+    :rtype: Callable
+    """
+    try:
+        test = np.asarray(f(np.array([0.0, 1.0])), dtype=float)
+        if test.shape == (2,):
+            return f
+    except (TypeError, ValueError):
+        pass
+
+    return np.vectorize(f, otypes=[float])
+
+
+def bracket_solver(
+    f: Callable,
+    a: ndarray,
+    b: ndarray,
+    tol: float = 1e-12,
+    max_iter: int = 200
+) -> ndarray:
+    """
+    Finds roots of f within each of a set of brackets [a, b], over which f changes sign, using the Illinois \
+    variant of the method of false position. All the brackets are refined at once, so f must accept arrays.
+
+    :param f: the function, which must accept arrays.
+    :type f: Callable
+    :param a: the lower bounds of the brackets.
+    :type a: ndarray
+    :param b: the upper bounds of the brackets.
+    :type b: ndarray
+    :param tol: the convergence tolerance, relative to the size of the root, defaults to 1e-12.
+    :type tol: float
+    :param max_iter: the maximum number of iterations, defaults to 200.
+    :type max_iter: int
+    :return: the roots.
+    :rtype: ndarray
+    """
+    a = np.array(a, dtype=float)
+    b = np.array(b, dtype=float)
+    fa = np.asarray(f(a), dtype=float)
+    fb = np.asarray(f(b), dtype=float)
+
+    if np.any(fa * fb > 0):
+        raise Exception("f must change sign over each bracket.")
+
+    # the side of the bracket that was replaced last, so that a stale endpoint can have its value halved
+    side = np.zeros(a.shape)
+    c = np.where(fa == 0, a, b)
+
+    for _ in range(max_iter):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            c_next = np.where(fb == fa, (a + b) / 2, (a * fb - b * fa) / (fb - fa))
+        fc = np.asarray(f(c_next), dtype=float)
+
+        done = np.abs(c_next - c) <= tol * (1 + np.abs(c_next))
+        c = c_next
+
+        if np.all(done | (fc == 0)):
+            break
+
+        same_b = fc * fb > 0
+
+        fa = np.where(same_b & (side == -1), fa / 2, fa)
+        fb = np.where(~same_b & (side == 1), fb / 2, fb)
+
+        b = np.where(same_b, c, b)
+        fb = np.where(same_b, fc, fb)
+        a = np.where(same_b, a, c)
+        fa = np.where(same_b, fa, fc)
+        side = np.where(same_b, -1, 1)
+    else:
+        raise Exception("Bracket solver failed to converge.")
+
+    return c
+
+
+def t_solver(
+    f: Callable,
+    target: Union[float, ndarray],
+    t0: float = 0,
+    step: float = 1,
+    tol: float = 1e-12
+) -> Union[float, ndarray]:
+    """
+    Solves for the time t > t0 at which a monotone growth function f reaches a target value. The solution is first \
+    bracketed by doubling the search interval until f crosses the target. A single target is then solved with \
+    Brent's method, while an array of targets is solved all at once with :func:`.bracket_solver`.
+
+    :param f: the growth function, for example an accumulation function.
+    :type f: Callable
+    :param target: the target value, or an array of target values.
+    :type target: float, ndarray
+    :param t0: the lower bound of the search, defaults to 0.
+    :type t0: float
+    :param step: the initial length of the search interval, defaults to 1.
+    :type step: float
+    :param tol: the convergence tolerance, defaults to 1e-12.
+    :type tol: float
+    :return: the time, or an array of times.
+    :rtype: float, ndarray
+    """
+    f = array_func(f)
+    target = np.asarray(target, dtype=float)
+
+    lo = np.full(target.shape, float(t0))
+    f_lo = np.asarray(f(lo), dtype=float) - target
+    width = np.full(target.shape, float(step))
+    hi = lo + width
+    f_hi = np.asarray(f(hi), dtype=float) - target
+
+    for _ in range(64):
+        open_ = f_lo * f_hi > 0
+        if not np.any(open_):
+            break
+
+        lo = np.where(open_, hi, lo)
+        f_lo = np.where(open_, f_hi, f_lo)
+        width = np.where(open_, width * 2, width)
+        hi = np.where(open_, hi + width, hi)
+        f_hi = np.where(open_, np.asarray(f(hi), dtype=float) - target, f_hi)
+    else:
+        raise Exception("Unable to bracket the time at which the target value is reached.")
+
+    if target.ndim == 0:
+        res = brentq(lambda t: float(f(np.asarray(t))) - float(target), float(lo), float(hi), xtol=tol)
+    else:
+        res = bracket_solver(lambda t: np.asarray(f(t), dtype=float) - target, a=lo, b=hi, tol=tol)
+
+    return res
+
+
 class SimpleLoan:
     """
     A callable growth pattern for a simple loan, which is a lump sum loan to be paid back with a single payment \
@@ -894,15 +1433,18 @@ def standardize_acc(
 
     """
     Returns an compound accumulation object. Usually used to enable more complex classes and functions to accept
-    several different objects to indicate a compound interest growth rate.
+    several different objects to indicate a compound interest growth rate. Floats and compound Rate objects are
+    returned as a :class:`.CompoundAccumulation`, while an :class:`.InterpolatedAccumulation` is returned as is.
 
     :param gr: A growth rate object.
-    :type gr: Accumulation, float, Rate, or TieredTime
+    :type gr: Accumulation, InterpolatedAccumulation, float, Rate, or TieredTime
     :return: an Accumulation object
     :rtype: Accumulation
     """
 
-    if isinstance(
+    if isinstance(gr, InterpolatedAccumulation):
+        pass
+    elif isinstance(
         gr,
         Accumulation
     ):
@@ -910,7 +1452,9 @@ def standardize_acc(
             raise TypeError("Standardization of Accumulation class only valid for compound interest.")
         else:
             pass
-    elif isinstance(gr, (float, Rate, TieredTime)):
+    elif isinstance(gr, float) or (isinstance(gr, Rate) and gr.formal_pattern in COMPOUNDS):
+        gr = CompoundAccumulation(gr)
+    elif isinstance(gr, (Rate, TieredTime)):
         gr = Accumulation(gr)
     else:
         raise TypeError("Invalid type passed to gr.")
@@ -918,6 +1462,136 @@ def standardize_acc(
     return gr
 
 
+class InvestmentYearTable:
+    """
+    :class:`InvestmentYearTable` stores a table of interest rates for the investment year method as a 2-D NumPy \
+    array indexed by (investment year, duration), where the last column holds the ultimate rates. A table might \
+    look something like this:
+
+    iym_table = {
+    2000: [.06, .065, .0575, .06, .065],
+    2001: [.07, .0625, .06, .07, .0675],
+    2002: [.06, .06, .0725, .07, .0725],
+    2003: [.0775, .08, .08, .0775, .0715]
+    }
+
+    For each year, you move one column to the right until reaching the rightmost column, and one row down for each \
+    year after that. Beyond the last row, the last ultimate rate continues to apply. The accumulation factors \
+    at each whole duration are precomputed for every investment year, so that lookups and accumulated values for \
+    arrays of investment years and times are a single gather.
+
+    :param table: A table of interest rates as a dictionary, with consecutive years as the keys.
+    :type table: dict
+    :return: An InvestmentYearTable object.
+    :rtype: InvestmentYearTable
+    """
+
+    def __init__(
+        self,
+        table: dict
+    ):
+        years = sorted(table.keys())
+
+        if years != list(range(years[0], years[0] + len(years))):
+            raise ValueError("The years of the table must be consecutive.")
+
+        self.first_year = years[0]
+        self.rates = np.array([table[y] for y in years], dtype=float)
+        self.n_row, self.n_col = self.rates.shape
+
+        # the durations after which every investment year has moved past the table onto the last ultimate rate
+        self.horizon = self.n_col + self.n_row - 1
+
+        rows = np.arange(self.n_row)[:, None]
+        durations = np.arange(self.horizon)[None, :]
+        path = self.rate(t0=rows + self.first_year, t=durations)
+
+        self.acc = np.concatenate([np.ones((self.n_row, 1)), np.cumprod(1 + path, axis=1)], axis=1)
+
+    def rate(
+        self,
+        t0: Union[int, ndarray],
+        t: Union[int, ndarray]
+    ) -> Union[float, ndarray]:
+        """
+        Reads the annual effective interest rates applicable during year t + 1 of investments made in year t0.
+
+        :param t0: The year of the initial investment, or an array of them.
+        :type t0: int, ndarray
+        :param t: The nonnegative whole number of years since the investment, or an array of them.
+        :type t: int, ndarray
+        :return: The interest rate, or an array of them.
+        :rtype: float, ndarray
+        """
+        row = np.asarray(t0, dtype=int) - self.first_year
+        t = np.asarray(t, dtype=int)
+
+        if np.any((row < 0) | (row >= self.n_row)):
+            raise ValueError("Investment year not found in the table.")
+
+        if np.any(t < 0):
+            raise ValueError("The time since the investment must be nonnegative.")
+
+        select = t < self.n_col
+        col = np.where(select, t, self.n_col - 1)
+        row = np.minimum(np.where(select, row, row + t - self.n_col + 1), self.n_row - 1)
+
+        res = self.rates[row, col]
+
+        if res.ndim == 0:
+            res = float(res)
+
+        return res
+
+    def val(
+        self,
+        t0: Union[int, ndarray],
+        t: Union[float, ndarray]
+    ) -> Union[float, ndarray]:
+        """
+        Calculates the value at time t of 1 invested in year t0, for arrays of investment years and times.
+
+        :param t0: The year of the initial investment, or an array of them.
+        :type t0: int, ndarray
+        :param t: The nonnegative time since the investment, or an array of them.
+        :type t: float, ndarray
+        :return: The accumulated value, or an array of them.
+        :rtype: float, ndarray
+        """
+        row = np.asarray(t0, dtype=int) - self.first_year
+        t = np.asarray(t, dtype=float)
+        d = np.minimum(np.floor(t), self.horizon).astype(int)
+
+        # the rates are read first so that investment years and times outside the table are rejected
+        rate = self.rate(t0=t0, t=d)
+        res = self.acc[row, d] * (1 + rate) ** (t - d)
+
+        if res.ndim == 0:
+            res = float(res)
+
+        return res
+
+    def tiered_time(
+        self,
+        t0: int
+    ) -> TieredTime:
+        """
+        Returns a TieredTime object representing the rates applicable to an investment made in year t0. This object \
+        can then be passed to an Amount or an Accumulation class.
+
+        :param t0: The year of the initial investment.
+        :type t0: int
+        :return: A TieredTime growth rate object.
+        :rtype: TieredTime
+        """
+        n_tiers = self.horizon - (int(t0) - self.first_year)
+        rates = self.rate(t0=t0, t=np.arange(n_tiers))
+
+        tt = TieredTime(tiers=list(range(n_tiers)), rates=[float(x) for x in rates])
+
+        return tt
+
+
 def tt_iym(
     table: dict,
     t0: float
@@ -934,6 +1608,8 @@ def tt_iym(
     2003: [.0775, .08, .08, .0775, .0715]
     }
 
+    To read many investment years from the same table, see :class:`.InvestmentYearTable`.
+
     :param table: A table of interest rates.
     :type table: dict
     :param t0: The year of the initial investment.
@@ -942,21 +1618,7 @@ def tt_iym(
     :rtype: TieredTime
     """
 
-    # move to the right for each row in year t
-    n_col = len(table[t0])
-    # move downwards for each row greater than t
-    n_row = max(table.keys()) - t0
-    n_tiers = n_col + n_row
-    tiers = [x for x in range(n_tiers)]
-    rates = table[t0]
-
-    # get the ultimate rates from the last column in the table
-    index = t0
-    for n in range(n_row):
-        index += 1
-        rates.append(table[index][-1])
-
-    tt = TieredTime(tiers=tiers, rates=rates)
+    tt = InvestmentYearTable(table=table).tiered_time(t0=t0)
 
     return tt
 
@@ -977,6 +1639,8 @@ def read_iym(
     2003: [.0775, .08, .08, .0775, .0715]
     }
 
+    To read many values from the same table, see :class:`.InvestmentYearTable`.
+
     :param table: A table of interest rates as a dictionary, with years as the keys.
     :type table: dict
     :param t0: The initial investment time.
@@ -986,44 +1650,55 @@ def read_iym(
     :return: An interest rate applicable to the desired lookup time.
     :rtype: Rate
     """
-    duration = t
-    n_col = len(table[t0])
-    row_d = duration - n_col
 
-    if duration <= n_col:
-        rate = table[t0][duration]
-    else:
-        row = row_d + t0
-        rate = table[row][-1]
-
-    rate = Rate(rate)
+    rate = Rate(InvestmentYearTable(table=table).rate(t0=t0, t=t))
 
     return rate
 
 
-def invsec(amt1: Amount, amt2: Amount, x0=range(100), precision=5) -> list:
+def invsec(
+    amt1: Amount,
+    amt2: Amount,
+    x0: Iterable = range(100),
+    precision: int = 5
+) -> list:
     """
-    Finds the point(s) at which two accumulation functions intersect.
-
-    :param amt1:
-    :type amt1:
-    :param amt2:
-    :type amt2:
-    :param x0:
-    :type x0:
-    :param precision:
-    :type precision:
-    :return:
-    :rtype:
+    Finds the point(s) at which two amount functions intersect. The difference between the two functions is \
+    evaluated on the grid x0, and each interval of the grid over which the difference changes sign is then refined \
+    with :func:`.bracket_solver`, all at once.
+
+    :param amt1: the first amount function.
+    :type amt1: Amount
+    :param amt2: the second amount function.
+    :type amt2: Amount
+    :param x0: the grid of times to scan for intersections, defaults to range(100).
+    :type x0: Iterable
+    :param precision: the number of decimal places to round the intersections to, defaults to 5.
+    :type precision: int
+    :return: a sorted list of the intersection times.
+    :rtype: list
     """
+    f1 = array_func(amt1.val)
+    f2 = array_func(amt2.val)
+
     def f(t):
-        return amt1.val(t) - amt2.val(t)
+        return np.asarray(f1(t), dtype=float) - np.asarray(f2(t), dtype=float)
+
+    grid = np.asarray(list(x0), dtype=float)
+    grid.sort()
+    h = f(grid)
 
-    sol = newton(f, x0=x0)
+    exact = grid[h == 0]
+    crossed = h[:-1] * h[1:] < 0
 
-    sol = [round(x, precision) for x in sol]
+    if np.any(crossed):
+        refined = bracket_solver(f, a=grid[:-1][crossed], b=grid[1:][crossed])
+    else:
+        refined = np.array([])
 
-    res = list(set(sol))
+    sol = np.concatenate([exact, refined])
+
+    res = sorted(set(round(float(x), precision) for x in sol))
 
     return res
 
@@ -1050,55 +1725,98 @@ def rate_from_earned(iex: Tuple[float, float], iey: Tuple[float, float]) -> Rate
     return gr
 
 
+def _deprecate_intdisc_args(
+    x0,
+    precision
+):
+    """
+    Warns that the Newton's method arguments of the interest and discount solvers are no longer used.
+    """
+    if x0 is not None or precision is not None:
+        warnings.warn(
+            "x0 and precision are deprecated and ignored, the interest rate is now bracketed and solved directly. "
+            "They will be removed in a future release.",
+            DeprecationWarning,
+            stacklevel=3
+        )
+
+
 def rate_from_intdisc(
-    iex: Tuple[float, float],
-    dex: Tuple[float, float],
-    x0=np.linspace(.001, 1, 100),
-    precision=5
-) -> list:
+    iex: Union[Tuple[float, float], ndarray],
+    dex: Union[Tuple[float, float], ndarray],
+    x0=None,
+    precision=None
+) -> Union[list, ndarray]:
     """
     Given interest earned over a time period on an unknown investment amount, and discount earned over a time period, \
     on that same amount,, solves for an annualized compound interest rate.
 
-    :param iex: The interest earned over a time interval.
-    :type iex: Tuple[float, float]
-    :param dex: The discount earned over a time interval.
-    :type dex: Tuple[float, float]
-    :param x0: A starting guess or list of guesses for Newton's method, defaults to np.linspace(.001, 1, 100).
-    :type x0:
-    :param precision: rounding precision used to remove duplicates from Newton's method, defaults to 5.
-    :type precision: int
-    :return: a list of interest rates, if found.
-    :rtype: list
+    The ratio of interest earned to discount earned increases with the interest rate, so there is at most one \
+    positive rate that solves the equation of value. It is bracketed and then solved with :func:`.bracket_solver`. \
+    Arrays of observations, with one (amount, time) pair per row, are solved all at once.
+
+    :param iex: The interest earned over a time interval, or an array of them.
+    :type iex: Tuple[float, float], ndarray
+    :param dex: The discount earned over a time interval, or an array of them.
+    :type dex: Tuple[float, float], ndarray
+    :param x0: Deprecated and ignored, since the rate is bracketed rather than found from starting guesses.
+    :param precision: Deprecated and ignored, since the solver returns a single rate rather than rounding away \
+    duplicate roots.
+    :return: a list containing the interest rate for a single observation, or an array of interest rates for an \
+    array of observations, with nan where no positive rate exists.
+    :rtype: list, ndarray
     """
 
-    i_amt = iex[0]
-    d_amt = dex[0]
-    i_t = iex[1]
-    d_t = dex[1]
+    _deprecate_intdisc_args(x0=x0, precision=precision)
 
-    def f(i):
-        return ((1 + i) ** (i_t + d_t) - (1 + i) ** d_t) / ((1 + i) ** d_t - 1) - (i_amt / d_amt)
+    iex = np.asarray(iex, dtype=float)
+    dex = np.asarray(dex, dtype=float)
 
-    sol = newton(f, x0=x0)
+    i_amt = iex[..., 0]
+    i_t = iex[..., 1]
+    d_amt = dex[..., 0]
+    d_t = dex[..., 1]
 
-    if isinstance(sol, Iterable):
-        sol = [round(x, precision) for x in sol]
-        res = list(set(sol))
+    i_amt, i_t, d_amt, d_t = np.broadcast_arrays(i_amt, i_t, d_amt, d_t)
+    target = i_amt / d_amt
 
-    else:
+    def ratio(i, i_t, d_t):
+        return ((1 + i) ** (i_t + d_t) - (1 + i) ** d_t) / ((1 + i) ** d_t - 1)
+
+    # the ratio tends to i_t / d_t as the rate tends to 0, so there is no positive root below that
+    lo = np.full(target.shape, 1e-9)
+    hi = np.ones(target.shape)
+    solvable = ratio(lo, i_t, d_t) < target
+
+    for _ in range(64):
+        open_ = solvable & (ratio(hi, i_t, d_t) < target)
+        if not np.any(open_):
+            break
+        lo = np.where(open_, hi, lo)
+        hi = np.where(open_, hi * 2, hi)
+
+    res = np.full(target.shape, np.nan)
+
+    if np.any(solvable):
+        s_t, s_i_t, s_d_t = target[solvable], i_t[solvable], d_t[solvable]
+        res[solvable] = bracket_solver(
+            lambda i: ratio(i, s_i_t, s_d_t) - s_t,
+            a=lo[solvable],
+            b=hi[solvable]
+        )
 
-        res = [sol]
+    if res.ndim == 0:
+        res = [] if np.isnan(res) else [float(res)]
 
     return res
 
 
 def amt_from_intdisc(
-    iex: Tuple[float, float],
-    dex: Tuple[float, float],
-    x0: Union[float, ndarray] = np.linspace(.001, 1, 100),
-    precision: int = 5
-) -> Amount:
+    iex: Union[Tuple[float, float], ndarray],
+    dex: Union[Tuple[float, float], ndarray],
+    x0=None,
+    precision=None
+) -> Union[Amount, list]:
 
     """
     Given interest earned over a time period on an unknown investment amount, and discount earned over a time period, \
@@ -1107,68 +1825,91 @@ def amt_from_intdisc(
     For example, if you can earn 500 in interest in two years, and the discount in one year is 200, you can supply
     iex=[400, 2], dex=[200,1]
 
-    :param iex: The interest earned over a time interval.
-    :type iex: Tuple[float, float]
-    :param dex: The discount earned over a time interval.
-    :type dex: Tuple[float, float]
-    :param x0: A starting guess or list of guesses for Newton's method, defaults to np.linspace(.001, 1, 100).
-    :type x0:
-    :param precision: rounding precision used to remove duplicates from Newton's method, defaults to 5.
-    :type precision: int
-    :return: An amount function.
-    :rtype: Amount
+    Arrays of observations, with one (amount, time) pair per row, return a list of Amount objects, one per row.
+
+    :param iex: The interest earned over a time interval, or an array of them.
+    :type iex: Tuple[float, float], ndarray
+    :param dex: The discount earned over a time interval, or an array of them.
+    :type dex: Tuple[float, float], ndarray
+    :param x0: Deprecated and ignored, since the rate is bracketed rather than found from starting guesses.
+    :param precision: Deprecated and ignored, since the solver returns a single rate rather than rounding away \
+    duplicate roots.
+    :return: An amount function, or a list of them.
+    :rtype: Amount, list
     """
-    rates = rate_from_intdisc(
-        iex=iex,
-        dex=dex,
-        x0=x0,
-        precision=precision
-    )
-
-    # use the min positive one:
-
-    gr = min([x for x in rates if x > 0])
+    _deprecate_intdisc_args(x0=x0, precision=precision)
 
-    k = iex[0] / ((1 + gr) ** iex[1] - 1)
+    gr, k = intdisc_solver(iex=iex, dex=dex)
 
-    amt = Amount(gr=gr, k=k)
+    if np.ndim(gr) == 0:
+        amt = Amount(gr=float(gr), k=float(k))
+    else:
+        amt = [Amount(gr=float(x), k=float(y)) for x, y in zip(gr, k)]
 
     return amt
 
 
 def k_from_intdisc(
-    iex: Tuple[float, float],
-    dex: Tuple[float, float],
-    x0: Union[float, ndarray] = np.linspace(.001, 1, 100),
-    precision: int = 5
-) -> float:
+    iex: Union[Tuple[float, float], ndarray],
+    dex: Union[Tuple[float, float], ndarray],
+    x0=None,
+    precision=None
+) -> Union[float, ndarray]:
 
     """
     Given interest earned over a time period on an unknown investment amount, and discount earned over a time period, \
-    on that same amount, solves for the amount.
-
-    :param iex: The interest earned over a time interval.
-    :type iex: Tuple[float, float]
-    :param dex: The discount earned over a time interval.
-    :type dex: Tuple[float, float]
-    :param x0: A starting guess or list of guesses for Newton's method, defaults to np.linspace(.001, 1, 100).
-    :type x0:
-    :param precision: rounding precision used to remove duplicates from Newton's method, defaults to 5.
-    :type precision: int
-    :return: The investment amount.
-    :rtype: float
+    on that same amount, solves for the amount. Arrays of observations, with one (amount, time) pair per row, return \
+    an array of amounts.
+
+    :param iex: The interest earned over a time interval, or an array of them.
+    :type iex: Tuple[float, float], ndarray
+    :param dex: The discount earned over a time interval, or an array of them.
+    :type dex: Tuple[float, float], ndarray
+    :param x0: Deprecated and ignored, since the rate is bracketed rather than found from starting guesses.
+    :param precision: Deprecated and ignored, since the solver returns a single rate rather than rounding away \
+    duplicate roots.
+    :return: The investment amount, or an array of them.
+    :rtype: float, ndarray
     """
 
-    k = amt_from_intdisc(
-        iex=iex,
-        dex=dex,
-        x0=x0,
-        precision=precision
-    ).k
+    _deprecate_intdisc_args(x0=x0, precision=precision)
+
+    k = intdisc_solver(iex=iex, dex=dex)[1]
+
+    if np.ndim(k) == 0:
+        k = float(k)
 
     return k
 
 
+def intdisc_solver(
+    iex: Union[Tuple[float, float], ndarray],
+    dex: Union[Tuple[float, float], ndarray]
+) -> tuple:
+    """
+    Solves for the interest rate and the investment amount, given interest earned and discount earned on the same \
+    amount. Used by :func:`.amt_from_intdisc` and :func:`.k_from_intdisc`.
+
+    :param iex: The interest earned over a time interval, or an array of them.
+    :type iex: Tuple[float, float], ndarray
+    :param dex: The discount earned over a time interval, or an array of them.
+    :type dex: Tuple[float, float], ndarray
+    :return: The interest rate and the investment amount, or arrays of them.
+    :rtype: tuple
+    """
+    iex_arr = np.asarray(iex, dtype=float)
+    gr = rate_from_intdisc(iex=iex, dex=dex)
+
+    if isinstance(gr, list):
+        if len(gr) == 0:
+            raise Exception("No positive interest rate found.")
+        gr = gr[0]
+
+    k = iex_arr[..., 0] / ((1 + gr) ** iex_arr[..., 1] - 1)
+
+    return gr, k
+
+
 def nominal_m_solver(im, dm) -> float:
     """
     Given a nominal interest and nominal discount rate with the same compounding frequency,
@@ -1201,15 +1942,257 @@ def vaalern(s, r) -> float:
     return (r * s) / (r - s)
 
 
-def acc_from_delta_t(delta_t: Callable) -> Callable:
-    def f(t):
-        return np.exp(quad(delta_t, 0, t)[0])
+class ForceOfInterest:
+    """
+    :class:`ForceOfInterest` is a callable growth pattern defined by a force of interest :math:`\\delta_t`, so that \
+    the value of k invested at time 0 is:
+
+    .. math::
+
+       A_K(t) = K e^{\\int_0^t \\delta_s ds}
+
+    Rather than integrating from 0 on every evaluation, the cumulative integral is calculated once on a grid of \
+    Gauss-Legendre panels, which are bisected until both the panel integral and a cubic Hermite interpolant of the \
+    cumulative integral are accurate to tol per unit of time. Values are then read off the interpolant, vectorized \
+    over t. When t falls outside of the grid, the grid is extended up to t, in either direction, and never past it, \
+    so that the force of interest is only evaluated over times that were asked for.
+
+    :param delta_t: the force of interest, a function of t.
+    :type delta_t: Callable
+    :param horizon: the initial length of the grid, defaults to 1.
+    :type horizon: float
+    :param tol: the error tolerance of the cumulative integral per unit of time, defaults to 1e-10.
+    :type tol: float
+    :param step: the initial width of the panels, before refinement, defaults to 1.
+    :type step: float
+    :param order: the number of Gauss-Legendre nodes per panel, defaults to 8.
+    :type order: int
+    :return: a ForceOfInterest object.
+    :rtype: ForceOfInterest
+    """
+
+    def __init__(
+        self,
+        delta_t: Callable,
+        horizon: float = 1,
+        tol: float = 1e-10,
+        step: float = 1,
+        order: int = 8
+    ):
+        self.delta_t = delta_t
+        self.tol = tol
+        self.step = step
+        self.gl_nodes, self.gl_weights = np.polynomial.legendre.leggauss(order)
+
+        self.delta_arr = array_func(delta_t)
+
+        self.x = np.zeros(1)
+        self.cum = np.zeros(1)
+        self.dydx = np.asarray(self.delta_arr(self.x), dtype=float)
+        self.spline = None
+
+        self.extend(t_min=0, t_max=horizon)
+
+    def __call__(
+        self,
+        k: Union[float, ndarray],
+        t: Union[float, ndarray]
+    ) -> Union[float, ndarray]:
+
+        return k * self.val(t=t)
+
+    def val(
+        self,
+        t: Union[float, ndarray]
+    ) -> Union[float, ndarray]:
+        """
+        Calculates the value of 1 invested at time 0, at time t.
+
+        :param t: the valuation time, or an array of valuation times.
+        :type t: float, ndarray
+        :return: the accumulated value, or an array of them.
+        :rtype: float, ndarray
+        """
+        t_arr = np.asarray(t, dtype=float)
+
+        if t_arr.size:
+            self.extend(t_min=t_arr.min(), t_max=t_arr.max())
+
+        res = np.exp(self.spline(t_arr))
+
+        if res.ndim == 0:
+            res = float(res)
+
+        return res
+
+    def acc_func(self, t: Union[float, ndarray]) -> Union[float, ndarray]:
+        """
+        The accumulation function, the value of 1 invested at time 0, at time t.
+
+        :param t: the valuation time, or an array of valuation times.
+        :type t: float, ndarray
+        :return: the accumulated value, or an array of them.
+        :rtype: float, ndarray
+        """
+        return self.val(t=t)
+
+    def amt_func(self, t: Union[float, ndarray], k: Union[float, ndarray]) -> Union[float, ndarray]:
+        """
+        The amount function, the value of k invested at time 0, at time t.
+
+        :param t: the valuation time, or an array of valuation times.
+        :type t: float, ndarray
+        :param k: the principal.
+        :type k: float, ndarray
+        :return: the accumulated value, or an array of them.
+        :rtype: float, ndarray
+        """
+        return k * self.val(t=t)
+
+    def extend(
+        self,
+        t_min: float,
+        t_max: float
+    ):
+        """
+        Extends the grid so that it covers the interval from t_min to t_max. The new panels end exactly at t_min \
+        or t_max, so the force of interest is never integrated beyond the times requested, where it may not exist.
+
+        :param t_min: the lower bound of the interval.
+        :type t_min: float
+        :param t_max: the upper bound of the interval.
+        :type t_max: float
+        """
+        lo = self.x[0]
+        hi = self.x[-1]
+        grown = False
+
+        if t_max > hi:
+            x, cum, dydx = self.integrate(a=hi, b=t_max)
+            self.x = np.concatenate([self.x, x[1:]])
+            self.cum = np.concatenate([self.cum, self.cum[-1] + cum[1:]])
+            self.dydx = np.concatenate([self.dydx, dydx[1:]])
+            grown = True
+
+        if t_min < lo:
+            x, cum, dydx = self.integrate(a=t_min, b=lo)
+            self.x = np.concatenate([x[:-1], self.x])
+            self.cum = np.concatenate([self.cum[0] + cum[:-1] - cum[-1], self.cum])
+            self.dydx = np.concatenate([dydx[:-1], self.dydx])
+            grown = True
+
+        if grown or self.spline is None:
+            self.spline = CubicHermiteSpline(self.x, self.cum, self.dydx)
+
+    def integrate(
+        self,
+        a: float,
+        b: float
+    ) -> tuple:
+        """
+        Calculates the cumulative integral of the force of interest from a, on an adaptive grid spanning a to b.
+
+        :param a: the lower bound.
+        :type a: float
+        :param b: the upper bound.
+        :type b: float
+        :return: the grid, the cumulative integral at each grid point, and the force of interest at each grid point.
+        :rtype: tuple
+        """
+        n_seed = max(int(np.ceil((b - a) / self.step)), 1)
+        edges = np.linspace(a, b, n_seed + 1)
+        pending_a = edges[:-1]
+        pending_b = edges[1:]
+        accepted = []
+
+        # bisect all the panels that fail the error test at once, level by level
+        while len(pending_a):
+            mid = (pending_a + pending_b) / 2
+            width = pending_b - pending_a
+
+            whole = self.gauss_legendre(pending_a, pending_b)
+            left = self.gauss_legendre(pending_a, mid)
+            right = self.gauss_legendre(mid, pending_b)
+
+            d_a = np.asarray(self.delta_arr(pending_a), dtype=float)
+            d_m = np.asarray(self.delta_arr(mid), dtype=float)
+            d_b = np.asarray(self.delta_arr(pending_b), dtype=float)
+
+            # the cubic Hermite interpolant of the cumulative integral at the midpoint
+            hermite = whole / 2 + width / 8 * (d_a - d_b)
 
-    return f
+            err = np.maximum(np.abs(whole - left - right), np.abs(hermite - left))
+            ok = (err <= self.tol * width) | (width <= 1e-9 * np.maximum(1, np.abs(pending_a)))
 
+            accepted.append(np.column_stack([pending_a, mid, left, right, d_a, d_m])[ok])
 
-def amt_from_delta_t(delta_t: Callable) -> Callable:
-    def f(t, k):
-        return k * np.exp(quad(delta_t, 0, t)[0])
+            pending_a, pending_b = (
+                np.concatenate([pending_a[~ok], mid[~ok]]),
+                np.concatenate([mid[~ok], pending_b[~ok]])
+            )
+
+        panels = np.concatenate(accepted)
+        panels = panels[np.argsort(panels[:, 0])]
+
+        x = np.append(panels[:, :2].ravel(), b)
+        cum = np.concatenate([[0.0], np.cumsum(panels[:, 2:4].ravel())])
+        dydx = np.append(panels[:, 4:6].ravel(), np.asarray(self.delta_arr(np.array([b])), dtype=float)[0])
+
+        return x, cum, dydx
+
+    def gauss_legendre(
+        self,
+        a: ndarray,
+        b: ndarray
+    ) -> ndarray:
+        """
+        Integrates the force of interest over a set of panels with Gauss-Legendre quadrature.
+
+        :param a: the lower bounds of the panels.
+        :type a: ndarray
+        :param b: the upper bounds of the panels.
+        :type b: ndarray
+        :return: the integral over each panel.
+        :rtype: ndarray
+        """
+        half = (b - a)[:, None] / 2
+        nodes = (a + b)[:, None] / 2 + half * self.gl_nodes
+        vals = np.asarray(self.delta_arr(nodes.ravel()), dtype=float).reshape(nodes.shape)
+
+        return (vals * self.gl_weights * half).sum(axis=1)
+
+
+def acc_from_delta_t(
+    delta_t: Callable,
+    tol: float = 1e-10
+) -> Callable:
+    """
+    Returns an accumulation function given a force of interest. See :class:`.ForceOfInterest`.
+
+    :param delta_t: the force of interest, a function of t.
+    :type delta_t: Callable
+    :param tol: the error tolerance of the cumulative integral per unit of time, defaults to 1e-10.
+    :type tol: float
+    :return: the accumulation function.
+    :rtype: Callable
+    """
+
+    return ForceOfInterest(delta_t=delta_t, tol=tol).acc_func
+
+
+def amt_from_delta_t(
+    delta_t: Callable,
+    tol: float = 1e-10
+) -> Callable:
+    """
+    Returns an amount function given a force of interest. See :class:`.ForceOfInterest`.
+
+    :param delta_t: the force of interest, a function of t.
+    :type delta_t: Callable
+    :param tol: the error tolerance of the cumulative integral per unit of time, defaults to 1e-10.
+    :type tol: float
+    :return: the amount function.
+    :rtype: Callable
+    """
 
-    return f
\ No newline at end of file
+    return ForceOfInterest(delta_t=delta_t, tol=tol).amt_func
\ No newline at end of file
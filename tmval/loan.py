@@ -1,14 +1,27 @@
-from math import ceil
+import numpy as np
+
+from math import ceil, floor
 from typing import List, Union
 
 from tmval.annuity import (
     Annuity,
     get_loan_pmt,
     olb_r,
-    olb_p
+    olb_p,
+    olb_r_schedule,
+    olb_p_schedule,
+    reinvested_sv,
+    round_cents
+)
+
+from tmval.factors import (
+    a_angln,
+    get_period_rate,
+    s_angln
 )
 
 from tmval.growth import (
+    Accumulation,
     Amount,
     standardize_acc,
     TieredTime
@@ -95,8 +108,18 @@ class Loan(Payments):
             else:
                 self.pmt_is_level = False
 
+        # the annuity factors can be used directly when the rates are compound and the payments are level
+        if period and term:
+            i = get_period_rate(gr=self.gr, period=period) if self.gr is not None else None
+            j = get_period_rate(gr=self.sfr, period=period) if self.sfr is not None else None
+            n = floor(term / period)
+        else:
+            i = j = n = None
+
         if amt is None:
-            if sfr is None:
+            if sfr is None and i is not None and isinstance(self.pmt, (float, int)):
+                ann = self.pmt * a_angln(n=n, i=i)
+            elif sfr is None:
                 ann = Annuity(
                     period=self.period,
                     term=self.term,
@@ -104,12 +127,15 @@ class Loan(Payments):
                     amount=self.pmt
                 ).pv()
             elif sfr and sf_split == 1:
-                ann_snk = Annuity(
-                    period=self.period,
-                    term=self.term,
-                    gr=self.sfr,
-                    amount=1
-                ).pv()
+                if j is not None:
+                    ann_snk = a_angln(n=n, i=j)
+                else:
+                    ann_snk = Annuity(
+                        period=self.period,
+                        term=self.term,
+                        gr=self.sfr,
+                        amount=1
+                    ).pv()
 
                 sf_i = self.gr.effective_interval(t2=self.period)
                 sf_j = self.sfr.effective_interval(t2=self.period)
@@ -153,11 +179,14 @@ class Loan(Payments):
             )
 
         if sfr is not None and sfd is None and pmt is not None:
-            sv = Annuity(
-                gr=self.sfr,
-                period=self.period,
-                term=self.term
-            ).sv()
+            if j is not None:
+                sv = s_angln(n=n, i=j)
+            else:
+                sv = Annuity(
+                    gr=self.sfr,
+                    period=self.period,
+                    term=self.term
+                ).sv()
 
             self.sfd = self.amt / sv
 
@@ -295,6 +324,66 @@ class Loan(Payments):
 
         return olb
 
+    def olb_schedule(
+        self,
+        times: Union[list, np.ndarray] = None,
+        method: str = 'retrospective',
+        r: float = None,
+        missed: List[int] = None
+    ) -> dict:
+
+        """
+        Calculates the outstanding loan balance at each of a set of times, in one computation. Returned as a dict \
+        which can be supplied to a pandas DataFrame for further analysis and viewing.
+
+        :param times: The valuation times, defaults to None, in which case the balance is calculated at time 0 and \
+        at each payment date.
+        :type times: list, ndarray
+        :param method: 'retrospective' or 'prospective', defaults to 'retrospective'.
+        :type method: str
+        :param r: For the prospective method, the final payment amount, if different from the others, defaults to \
+        None.
+        :type r: float
+        :param missed: For the prospective method, a list of missed payments, for example, 4th and 5th payments \
+        would be [4, 5].
+        :type missed: List[int]
+        :return: The valuation times and the outstanding loan balances.
+        :rtype: dict
+        """
+
+        if times is None:
+            times = np.arange(ceil(self.term / self.period) + 1) * self.period
+
+        times = np.asarray(times, dtype=float)
+
+        if method == 'retrospective':
+            olb = olb_r_schedule(
+                loan=self.amt,
+                q=self.pmt,
+                period=self.period,
+                gr=self.gr.gr,
+                times=times
+            )
+        elif method == 'prospective':
+            olb = olb_p_schedule(
+                q=self.pmt,
+                period=self.period,
+                term=self.term,
+                gr=self.gr.gr,
+                times=times,
+                r=r,
+                missed=missed
+            )
+        else:
+            raise ValueError("method can either be retrospective or prospective.")
+
+        res = {
+            'time': times,
+            'olb': olb
+        }
+
+        return res
+
     def amortize_payments(
         self,
         payments: Payments
@@ -348,7 +437,9 @@ class Loan(Payments):
 
         if self.cents:
             for k, v in res.items():
-                res[k] = [round(x, 2) if isinstance(x, float) else x for x in v]
+                is_float = [isinstance(x, float) for x in v]
+                cents = round_cents([x if f else 0.0 for x, f in zip(v, is_float)])
+                res[k] = [c / 100 if f else x for x, c, f in zip(v, cents.tolist(), is_float)]
 
         return res
 
@@ -372,7 +463,8 @@ class Loan(Payments):
         if self.sfr:
             return 0
         else:
-            return self.olb_r(t1) - self.olb_r(t2)
+            olb = self.olb_schedule(times=[t1, t2])['olb']
+            return float(olb[0] - olb[1])
 
     def total_payments(
         self,
@@ -557,7 +649,9 @@ class Loan(Payments):
 
         if self.cents:
             for k, v in res.items():
-                res[k] = [round(x, 2) if isinstance(x, float) else x for x in v]
+                is_float = [isinstance(x, float) for x in v]
+                cents = round_cents([x if f else 0.0 for x, f in zip(v, is_float)])
+                res[k] = [c / 100 if f else x for x, c, f in zip(v, cents.tolist(), is_float)]
 
         return res
 
@@ -573,27 +667,35 @@ class Loan(Payments):
 
         return res
 
-    def rc_yield(self) -> list:
+    def rc_yield(self, reinv: Union[float, Rate, TieredTime, Accumulation] = None) -> list:
         """
-        Calculates the yield rate based off replacement of capital.
+        Calculates the yield rate based off replacement of capital. The sinking fund grows at the sinking fund \
+        rate, and its interest can be reinvested at a different rate by supplying reinv, which may be any growth \
+        object.
 
+        :param reinv: The rate at which the interest earned by the sinking fund is reinvested, defaults to the \
+        sinking fund rate.
+        :type reinv: float, Rate, TieredTime, Accumulation
         :return: The yield rate based off replacement of capital.
         :rtype: list
         """
         n_payments = ceil(self.term / self.period)
+        sf_times = [(x + 1) * self.period for x in range(n_payments)]
+
         if self.pmt_is_level:
             extra = [self.pmt - self.sfd] * n_payments
 
-            sv = Annuity(
-                amount=self.sfd,
+            sv = reinvested_sv(
+                amounts=[self.sfd] * n_payments,
+                times=sf_times,
                 gr=self.sfr,
-                term=self.term,
-                period=self.period
-            ).sv()
+                reinv=self.sfr if reinv is None else reinv,
+                t=self.term
+            )
 
             pmts = Payments(
                 amounts=[-self.amt] + extra + [sv],
-                times=[0.0] + [(x + 1) * self.period for x in range(n_payments)] + [self.term],
+                times=[0.0] + sf_times + [self.term],
                 gr=self.sfr
             )
 
@@ -605,11 +707,20 @@ class Loan(Payments):
                 extra_i = amount - sfd
                 extra += [extra_i]
 
-            sv = self.sinking()['sf_bal'][-1]
+            if reinv is None:
+                sv = self.sinking()['sf_bal'][-1]
+            else:
+                sv = reinvested_sv(
+                    amounts=sf_deps[1:],
+                    times=sf_times,
+                    gr=self.sfr,
+                    reinv=reinv,
+                    t=self.term
+                )
 
             pmts = Payments(
                 amounts=[-self.amt] + extra + [sv],
-                times=[0.0] + [(x + 1) * self.period for x in range(n_payments)] + [self.term],
+                times=[0.0] + sf_times + [self.term],
                 gr=self.sfr
             )
 
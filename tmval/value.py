@@ -18,9 +18,15 @@ from typing import (
     Union
 )
 
+from tmval.daycount import (
+    to_datetime64,
+    year_frac
+)
+
 from tmval.growth import (
     Accumulation,
-    Amount,
+    array_func,
+    bracket_solver,
     compound_solver,
     standardize_acc,
     TieredBal,
@@ -82,6 +88,12 @@ class Payments:
             self.set_accumulation(gr=gr)
 
     def __add__(self, other):
+        if callable(other.amounts) or callable(self.amounts):
+            raise NotImplementedError(
+                "Payments generated lazily, such as perpetuities, cannot be added to other payments, use head() to "
+                "take a finite number of them."
+            )
+
         self.append(amounts=other.amounts, times=other.times)
 
     def set_accumulation(self, gr: Union[float, Rate, Accumulation, TieredBal, TieredTime]):
@@ -272,8 +284,7 @@ class Payments:
                 interval = next_t - time
 
                 if isinstance(self.gr, TieredBal):
-                    amt = Amount(gr=self.gr, k=bal)
-                    bal = amt.val(interval)
+                    bal = self.gr(k=bal, t=interval)
                 else:
                     bal = bal * self.gr.val(interval)
 
@@ -580,6 +591,592 @@ class Payments:
 
         return eh
 
+    def key_rate_durations(
+        self,
+        key_rates: list,
+        curve: Union[dict, float, Rate, Accumulation] = None,
+        h: float = .0001,
+        excl_inv: bool = True
+    ) -> dict:
+        """
+        Calculates the key rate durations of the payments. See :func:`.key_rate_durations` for details.
+
+        :param key_rates: The key rate times, in years.
+        :type key_rates: list
+        :param curve: A dict of spot rates keyed by time, or a growth rate object. Defaults to the growth rate of \
+        the payments.
+        :type curve: dict, float, Rate, Accumulation
+        :param h: The size of the shock, defaults to .0001.
+        :type h: float
+        :param excl_inv: Whether to exclude the first payment, which is usually the investment, defaults to True.
+        :type excl_inv: bool
+        :return: The key rate durations, keyed by key rate.
+        :rtype: dict
+        """
+
+        krd = key_rate_durations(
+            payments=self,
+            key_rates=key_rates,
+            curve=curve,
+            h=h,
+            excl_inv=excl_inv
+        )
+
+        return krd
+
+    def xirr(
+        self,
+        x0: float = .1,
+        grid: Iterable = None
+    ) -> float:
+        """
+        Calculates the annual effective yield rate of payments made at arbitrary times, similar to the XIRR \
+        function found in spreadsheets. The equation of value is written in terms of the force of interest \
+        :math:`\\delta = \\ln(1 + i)`:
+
+        .. math::
+
+           \\sum_k C_{t_k} e^{-\\delta t_k} = 0
+
+        which is scanned for sign changes on a grid of forces of interest, all in one matrix operation. The sign \
+        change closest to the starting guess is then refined with :func:`.bracket_solver`.
+
+        :param x0: A starting guess for the yield rate, defaults to .1.
+        :type x0: float
+        :param grid: The grid of forces of interest to scan, defaults to 400 points between ln(.01) and ln(101), \
+        corresponding to yield rates between -99% and 10,000%.
+        :type grid: Iterable
+        :return: The yield rate.
+        :rtype: float
+        """
+
+        amounts = np.asarray(self.amounts, dtype=float)
+        times = np.asarray(self.times, dtype=float)
+
+        def f(delta):
+            return (amounts * np.exp(-np.asarray(delta)[..., None] * times)).sum(axis=-1)
+
+        if grid is None:
+            grid = np.linspace(np.log(.01), np.log(101), 400)
+        else:
+            grid = np.sort(np.asarray(list(grid), dtype=float))
+
+        h = f(grid)
+
+        crossed = np.flatnonzero(h[:-1] * h[1:] <= 0)
+
+        if len(crossed) == 0:
+            raise Exception("Unable to find a yield rate, the equation of value does not change sign.")
+
+        # pick the bracket closest to the starting guess
+        mids = (grid[crossed] + grid[crossed + 1]) / 2
+        idx = crossed[np.argmin(np.abs(mids - np.log(1 + x0)))]
+
+        delta = bracket_solver(f, a=grid[idx:idx + 1], b=grid[idx + 1:idx + 2])[0]
+
+        return float(np.expm1(delta))
+
+
+class DatedPayments(Payments):
+    """
+    A collection of payments made on calendar dates. The dates are converted into times, in years from a valuation \
+    date, in a single vectorized step using a day count convention. Since the object is otherwise a \
+    :class:`.Payments` object, all of its methods are available, such as :meth:`.Payments.xirr` to calculate the \
+    yield rate of irregularly dated cash flows.
+
+    :param amounts: a list of payment amounts.
+    :type amounts: list, np.ndarray
+    :param dates: the payment dates, as datetime objects, ISO strings, or a datetime64 array.
+    :type dates: list, np.ndarray
+    :param gr: a growth rate object, can be supplied as a float, a Rate object, or an Accumulation object.
+    :type gr: float, Rate, or Accumulation
+    :param convention: the day count convention, see :func:`.year_frac`, defaults to 'Actual/365 Fixed'.
+    :type convention: str
+    :param val_date: the valuation date, at which time is 0. Defaults to the earliest payment date.
+    :type val_date: datetime.date, str, np.datetime64
+    :param freq: the coupon frequency, required for the Actual/Actual ICMA convention.
+    :type freq: int
+    """
+    def __init__(
+        self,
+        amounts: Union[list, ndarray],
+        dates: Union[list, ndarray],
+        gr: Union[
+            float,
+            Rate,
+            Accumulation
+        ] = None,
+        convention: str = 'Actual/365 Fixed',
+        val_date=None,
+        freq: int = None
+    ):
+        self.dates = to_datetime64(dates)
+        self.val_date = self.dates.min() if val_date is None else to_datetime64(val_date)
+        self.convention = convention
+
+        times = np.atleast_1d(year_frac(
+            beg_dt=self.val_date,
+            end_dt=self.dates,
+            convention=convention,
+            freq=freq
+        ))
+
+        Payments.__init__(
+            self,
+            amounts=list(np.asarray(amounts, dtype=float)),
+            times=times.tolist(),
+            gr=gr
+        )
+
+
+class PerpetualStream(Payments):
+    """
+    An infinite stream of payments, such as a perpetuity, a perpetual preferred stock, or a ground rent. The \
+    k-th payment, counting from 0, is:
+
+    .. math::
+
+       P(1 + g)^k + Q \\lfloor k m \\rfloor
+
+    made at time :math:`d + p(k + 1)` for payments in arrears, or :math:`d + pk` for payments in advance, where p \
+    is the payment period and d is the deferral. The payments are generated lazily, in chunks of NumPy arrays.
+
+    The net present value is calculated by summing the payments one chunk at a time, and adding the value of the \
+    remaining payments in closed form, at the rate of interest in effect at the end of the chunks summed so far. \
+    Summation stops once adding another chunk changes the result by no more than the tolerance, so growth rate \
+    objects that are not compound, such as :class:`.TieredTime` or :class:`.InterpolatedAccumulation`, are \
+    supported as long as they eventually settle to a level rate.
+
+    Since the stream is a :class:`.Payments` object, it supports the valuation methods of ordinary payments, such \
+    as its durations and convexities, which are summed one chunk at a time. Operations that need the full list of \
+    payments, such as adding payments or solving for a yield, raise NotImplementedError, and :meth:`head` returns \
+    the first n payments as ordinary payments for them.
+
+    :param amount: the first payment, defaults to 1.
+    :type amount: float
+    :param period: the payment period, defaults to 1.
+    :type period: float
+    :param gprog: the geometric progression of the payments, defaults to 0.
+    :type gprog: float
+    :param aprog: the arithmetic progression of the payments, defaults to 0.
+    :type aprog: float
+    :param mprog: the number of arithmetic steps per payment, defaults to 1.
+    :type mprog: float
+    :param imd: 'immediate' or 'due', defaults to 'immediate'.
+    :type imd: str
+    :param deferral: the deferral, in years, defaults to 0.
+    :type deferral: float
+    :param gr: a growth rate object, can be supplied as a float, a Rate object, or an Accumulation object.
+    :type gr: float, Rate, or Accumulation
+    :param chunk_size: the number of payments generated per chunk, defaults to 1024.
+    :type chunk_size: int
+    """
+    def __init__(
+        self,
+        amount: float = 1.0,
+        period: float = 1,
+        gprog: float = 0.0,
+        aprog: float = 0.0,
+        mprog: float = 1,
+        imd: str = 'immediate',
+        deferral: float = 0.0,
+        gr: Union[
+            float,
+            Rate,
+            Accumulation,
+            TieredTime
+        ] = None,
+        chunk_size: int = 1024
+    ):
+        if imd not in ['immediate', 'due']:
+            raise ValueError('imd can either be immediate or due.')
+
+        self.amount = amount
+        self.period = period
+        self.gprog = gprog
+        self.aprog = aprog
+        self.mprog = mprog
+        self.imd = imd
+        self.deferral = deferral
+
+        # the arithmetic steps repeat every r payments, so the chunks are kept to a multiple of r
+        self.step_cycle = self.__step_cycle()
+        cycle = self.step_cycle if self.step_cycle else 1
+        self.chunk_size = int(np.ceil(chunk_size / cycle) * cycle)
+
+        Payments.__init__(
+            self,
+            amounts=self.iter_amounts,
+            times=self.iter_times,
+            gr=gr
+        )
+
+    def __step_cycle(self) -> Union[int, None]:
+        """
+        Returns the number of payments per arithmetic step, 1 if there are one or more steps per payment, or None if \
+        the steps do not repeat with a whole number of payments.
+        """
+        m = self.mprog
+
+        if self.aprog == 0 or float(m).is_integer():
+            return 1
+        elif abs(1 / m - round(1 / m)) < 1e-9:
+            return round(1 / m)
+        else:
+            return None
+
+    def chunk(
+        self,
+        start: int = 0,
+        size: int = None
+    ) -> tuple:
+        """
+        Generates a chunk of consecutive payments.
+
+        :param start: the index of the first payment in the chunk, counting from 0, defaults to 0.
+        :type start: int
+        :param size: the number of payments in the chunk, defaults to chunk_size.
+        :type size: int
+        :return: the payment amounts and the payment times, as NumPy arrays.
+        :rtype: tuple
+        """
+        if size is None:
+            size = self.chunk_size
+
+        k = np.arange(start, start + size, dtype=float)
+        amounts = self.amount * (1 + self.gprog) ** k + self.aprog * np.floor(k * self.mprog)
+        times = self.deferral + self.period * (k + (1 if self.imd == 'immediate' else 0))
+
+        return amounts, times
+
+    def iter_amounts(self, n: int) -> Iterator:
+        """
+        Yields the first n payment amounts.
+
+        :param n: the number of payments.
+        :type n: int
+        """
+        start = 0
+        while start < n:
+            yield from self.chunk(start=start, size=min(self.chunk_size, n - start))[0].tolist()
+            start += self.chunk_size
+
+    def iter_times(self, n: int) -> Iterator:
+        """
+        Yields the first n payment times.
+
+        :param n: the number of payments.
+        :type n: int
+        """
+        start = 0
+        while start < n:
+            yield from self.chunk(start=start, size=min(self.chunk_size, n - start))[1].tolist()
+            start += self.chunk_size
+
+    def head(self, n: int) -> Payments:
+        """
+        Returns the first n payments as an ordinary, finite :class:`.Payments` object.
+
+        :param n: the number of payments.
+        :type n: int
+        :return: the first n payments.
+        :rtype: Payments
+        """
+        amounts, times = self.chunk(start=0, size=n)
+
+        return Payments(amounts=amounts.tolist(), times=times.tolist(), gr=self.gr)
+
+    def tail_factor(
+        self,
+        start: int,
+        i: float
+    ) -> Union[float, None]:
+        """
+        Calculates the value of the payments from index start onwards, one period before the first of them, at a \
+        level effective interest rate of i per payment period. Returns None if the arithmetic steps do not repeat \
+        with a whole number of payments, in which case there is no closed form.
+
+        :param start: the index of the first payment.
+        :type start: int
+        :param i: the effective interest rate per payment period.
+        :type i: float
+        :return: the value of the remaining payments.
+        :rtype: float, None
+        """
+        if i <= self.gprog or i <= 0:
+            raise ValueError("The perpetuity does not converge, the interest rate must exceed the growth rate.")
+
+        pv = self.amount * (1 + self.gprog) ** start / (i - self.gprog)
+
+        if self.aprog != 0:
+            if self.step_cycle is None:
+                return None
+
+            m = self.mprog
+            steps = np.floor(start * m)
+
+            if self.step_cycle == 1:
+                steps_pv = m / i ** 2
+            else:
+                r = self.step_cycle
+                i_r = (1 + i) ** r - 1
+                steps_pv = ((1 + i) ** r - 1) / i * (1 + i) ** (- r) * (1 + i_r) / i_r ** 2
+
+            pv += self.aprog * (steps / i + steps_pv)
+
+        return pv
+
+    def npv(
+        self,
+        gr=None,
+        tol: float = 1e-10,
+        max_chunks: int = 10000
+    ) -> float:
+        """
+        Calculates the net present value of the stream, to within a tolerance.
+
+        :param gr: a growth rate object, defaults to the one supplied when the stream was declared.
+        :type gr: float, Rate, or Accumulation
+        :param tol: the tolerance, relative to the value of the stream, defaults to 1e-10.
+        :type tol: float
+        :param max_chunks: the maximum number of chunks to sum, defaults to 10000.
+        :type max_chunks: int
+        :return: the net present value.
+        :rtype: float
+        """
+        if gr is None:
+            if self.gr is None:
+                raise Exception("Growth rate object not set.")
+            else:
+                acc = self.gr
+        else:
+            acc = standardize_acc(gr=gr)
+
+        acc_arr = array_func(acc.val)
+
+        head = 0.0
+        estimate = None
+        start = 0
+
+        for _ in range(max_chunks):
+            amounts, times = self.chunk(start=start)
+            head += float(np.sum(amounts / acc_arr(times)))
+            start += self.chunk_size
+
+            # the rate in effect over the period before the next payment is assumed to apply from then on
+            t_next = self.deferral + self.period * (start + (1 if self.imd == 'immediate' else 0))
+            t_prev = t_next - self.period
+            v_prev = 1 / acc.val(t_prev)
+            i = acc.val(t_next) / acc.val(t_prev) - 1
+
+            if i > max(self.gprog, 0):
+                tail = self.tail_factor(start=start, i=i)
+            elif getattr(acc, 'is_compound', False):
+                raise ValueError("The perpetuity does not converge, the interest rate must exceed the growth rate.")
+            else:
+                tail = None
+
+            if tail is None:
+                prev, estimate = estimate, head
+                if prev is not None and abs(estimate - prev) <= tol * max(1.0, abs(estimate)):
+                    return estimate
+            else:
+                prev, estimate = estimate, head + tail * v_prev
+                if prev is not None and abs(estimate - prev) <= tol * max(1.0, abs(estimate)):
+                    return estimate
+
+        raise Exception("The net present value failed to converge.")
+
+    def eq_val(self, t: float, gr=None) -> float:
+        """
+        Calculates the value of the stream at time t.
+
+        :param t: the valuation time.
+        :type t: float
+        :param gr: a growth rate object, defaults to the one supplied when the stream was declared.
+        :type gr: float, Rate, or Accumulation
+        :return: the value at time t.
+        :rtype: float
+        """
+        acc = self.gr if gr is None else standardize_acc(gr=gr)
+
+        return self.npv(gr=gr) * acc.val(t)
+
+    def _moment(
+        self,
+        acc: Accumulation,
+        k: int,
+        tol: float = 1e-10,
+        max_chunks: int = 10000
+    ) -> float:
+        """
+        Sums the present values of the payments, each multiplied by its time raised to the power k, one chunk at a \
+        time until a chunk adds no more than the tolerance.
+        """
+        if acc.is_compound and acc.val(self.period) - 1 <= max(self.gprog, 0):
+            raise ValueError("The perpetuity does not converge, the interest rate must exceed the growth rate.")
+
+        acc_arr = array_func(acc.val)
+
+        total = 0.0
+        start = 0
+
+        for _ in range(max_chunks):
+            amounts, times = self.chunk(start=start)
+            added = float(np.sum(times ** k * amounts / acc_arr(times)))
+            total += added
+            start += self.chunk_size
+
+            if abs(added) <= tol * max(1.0, abs(total)):
+                return total
+
+        raise Exception("The sum failed to converge.")
+
+    def macaulay_duration(self, gr=None) -> float:
+        """
+        Calculates the Macaulay duration of the stream. There is no initial investment to exclude, so every \
+        payment is included.
+
+        :param gr: a growth rate object, defaults to the one supplied when the stream was declared.
+        :type gr: float, Rate, or Accumulation
+        :return: the Macaulay duration.
+        :rtype: float
+        """
+        acc = self.gr if gr is None else standardize_acc(gr=gr)
+
+        return self._moment(acc=acc, k=1) / self._moment(acc=acc, k=0)
+
+    def macaulay_convexity(self, gr=None) -> float:
+        """
+        Calculates the Macaulay convexity of the stream.
+
+        :param gr: a growth rate object, defaults to the one supplied when the stream was declared.
+        :type gr: float, Rate, or Accumulation
+        :return: the Macaulay convexity.
+        :rtype: float
+        """
+        acc = self.gr if gr is None else standardize_acc(gr=gr)
+
+        return self._moment(acc=acc, k=2) / self._moment(acc=acc, k=0)
+
+    def modified_duration(self, i: float, m: int = 1) -> float:
+        """
+        Calculates the modified duration of the stream at an annual effective interest rate of i.
+
+        :param i: the interest rate.
+        :type i: float
+        :param m: the compounding frequency, defaults to 1.
+        :type m: int
+        :return: the modified duration.
+        :rtype: float
+        """
+        if m != 1:
+            im = Rate(i).convert_rate(
+                pattern="Nominal Interest",
+                freq=m
+            )
+            return self.macaulay_duration(gr=i) / (1 + im.rate / m)
+
+        return - derivative(self.npv, x0=i, dx=1e-6) / self.npv(gr=i)
+
+    def modified_convexity(self, i: float, dx: float = 1e-5) -> float:
+        """
+        Calculates the modified convexity of the stream at an annual effective interest rate of i.
+
+        :param i: the interest rate.
+        :type i: float
+        :param dx: the step used to approximate the second derivative, defaults to 1e-5.
+        :type dx: float
+        :return: the modified convexity.
+        :rtype: float
+        """
+        return derivative(self.npv, x0=i, dx=dx, n=2) / self.npv(gr=i)
+
+    def effective_duration(self, i0: float, h: float, call: float = None) -> float:
+        """
+        Calculates the effective duration of the stream, from its values at interest rates of i0 - h and i0 + h.
+
+        :param i0: the interest rate.
+        :type i0: float
+        :param h: the change in the interest rate.
+        :type h: float
+        :param call: the value of the stream at i0 - h, if it is capped by a call price.
+        :type call: float
+        :return: the effective duration.
+        :rtype: float
+        """
+        return Payments.effective_duration(self, i0=i0, h=h, call=call, excl_inv=False)
+
+    def relchg(self, i: float, i0=None, approx: bool = False, degree: int = 1) -> float:
+        """
+        Calculates the relative change in the value of the stream when the interest rate moves from i0 to i, \
+        optionally approximated with the modified duration, and the modified convexity if degree is 2.
+
+        :param i: the new interest rate.
+        :type i: float
+        :param i0: the original growth rate object, defaults to the one supplied when the stream was declared.
+        :type i0: float, Rate, or Accumulation
+        :param approx: whether to approximate the change, defaults to False.
+        :type approx: bool
+        :param degree: the degree of the approximation, 1 or 2, defaults to 1.
+        :type degree: int
+        :return: the relative change.
+        :rtype: float
+        """
+        acc = self.gr if i0 is None else standardize_acc(gr=i0)
+
+        if not approx:
+            return (self.npv(gr=i) - self.npv(gr=i0)) / self.npv(gr=i0)
+
+        if not acc.is_compound:
+            raise Exception("Relative change approximation is unsupported for non-compound interest.")
+
+        r0 = acc.interest_rate.rate
+        res = - self.modified_duration(i=r0) * (i - r0)
+
+        if degree == 2:
+            res += self.modified_convexity(i=r0) * ((i - r0) ** 2) / 2
+        elif degree != 1:
+            raise ValueError("Relative change approximation is only supported for 1st and 2nd degrees.")
+
+        return res
+
+    def _finite_only(self, operation: str):
+        raise NotImplementedError(
+            operation + " is not supported for an infinite stream of payments, use head() to take a finite number "
+            "of them."
+        )
+
+    def __add__(self, other):
+        self._finite_only("Adding payments")
+
+    def append(self, amounts: list, times: list):
+        self._finite_only("Appending payments")
+
+    def paymentize(self, other, gr=None):
+        self._finite_only("Combining payments")
+
+    def group_payments(self) -> dict:
+        self._finite_only("Grouping payments")
+
+    def pt_bal(self, t: float) -> float:
+        self._finite_only("The balance calculation")
+
+    def irr(self, x0: float = 1.05) -> list:
+        self._finite_only("The internal rate of return")
+
+    def xirr(self, x0: float = .1, grid: Iterable = None) -> float:
+        self._finite_only("The internal rate of return")
+
+    def dw_approx(self, *args, **kwargs) -> Rate:
+        self._finite_only("The dollar-weighted yield")
+
+    def time_weighted_yield(self, *args, **kwargs) -> Rate:
+        self._finite_only("The time-weighted yield")
+
+    def key_rate_durations(self, *args, **kwargs) -> dict:
+        self._finite_only("The key rate duration")
+
 
 def npv(
         payments: list,
@@ -909,6 +1506,89 @@ def pairwise(iterable: Iterable) -> Iterator:
     return zip(a, b)
 
 
+def key_rate_durations(
+    payments: Union[Payments, List[Payments]],
+    key_rates: list,
+    curve: Union[dict, float, Rate, Accumulation] = None,
+    h: float = .0001,
+    excl_inv: bool = True
+) -> dict:
+    """
+    Calculates the key rate durations of a set of payments, or of a portfolio of them. The spot rate curve is bumped \
+    locally at each key rate by a triangular shock that peaks at the key rate and fades out linearly at the \
+    neighboring key rates. The shocks at the shortest and longest key rates extend flat to the ends of the curve, so \
+    the shocks sum to a parallel shift and the key rate durations sum to the effective duration.
+
+    The spot curve can be supplied as a dict of spot rates, such as the one returned by :func:`.spot_rates`, which \
+    is linearly interpolated between the times provided. Otherwise, the curve is implied from a growth rate object, or \
+    from each set of payments' own growth rate if no curve is supplied. The base discount factors are computed once, \
+    and every bumped valuation reuses them, so all of the key rate durations come out of a single batched \
+    revaluation, using central differences of size h.
+
+    For a portfolio, the durations are those of the combined cash flows, which is the same as weighting each \
+    instrument's key rate durations by its value.
+
+    :param payments: A set of payments, or a list of them.
+    :type payments: Payments, list
+    :param key_rates: The key rate times, in years.
+    :type key_rates: list
+    :param curve: A dict of spot rates keyed by time, or a growth rate object. Defaults to the growth rate of the \
+    payments.
+    :type curve: dict, float, Rate, Accumulation
+    :param h: The size of the shock, defaults to .0001.
+    :type h: float
+    :param excl_inv: Whether to exclude the first payment, which is usually the investment, defaults to True.
+    :type excl_inv: bool
+    :return: The key rate durations, keyed by key rate.
+    :rtype: dict
+    """
+
+    if isinstance(payments, Payments):
+        payments = [payments]
+
+    key_rates = np.sort(np.asarray(key_rates, dtype=float))
+    bumps = np.eye(len(key_rates))
+
+    pv = 0
+    pv_up = np.zeros(len(key_rates))
+    pv_down = np.zeros(len(key_rates))
+
+    for pmts in payments:
+        times = np.asarray(pmts.times[1:] if excl_inv else pmts.times, dtype=float)
+        amounts = np.asarray(pmts.amounts[1:] if excl_inv else pmts.amounts, dtype=float)
+
+        if isinstance(curve, dict):
+            curve_t = sorted(curve.keys())
+            curve_r = [standardize_rate(curve[t]).rate for t in curve_t]
+            spots = np.interp(times, curve_t, curve_r)
+            disc = (1 + spots) ** -times
+        else:
+            if curve is not None:
+                acc = standardize_acc(gr=curve)
+            elif pmts.gr is not None:
+                acc = pmts.gr
+            else:
+                raise Exception("Growth rate object not set.")
+
+            disc = np.asarray(array_func(acc.discount_func)(times), dtype=float)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                spots = np.where(times > 0, disc ** (-1 / times) - 1, 0)
+
+        # weight of each key rate's shock at each payment time
+        weights = np.array([np.interp(times, key_rates, b) for b in bumps])
+
+        pv += np.sum(amounts * disc)
+        pv_up += np.sum(amounts * disc * ((1 + spots) / (1 + spots + h * weights)) ** times, axis=1)
+        pv_down += np.sum(amounts * disc * ((1 + spots) / (1 + spots - h * weights)) ** times, axis=1)
+
+    krd = (pv_down - pv_up) / (2 * h * pv)
+
+    res = {k: d for k, d in zip(key_rates.tolist(), krd.tolist())}
+
+    return res
+
+
 def extract_flows(payments: Union[Payments, List[Payments]]) -> Payments:
 
     if isinstance(payments, Payments):